@@ -0,0 +1,245 @@
+"""Append-only store of compressed recordings referenced by history entries."""
+
+import io
+import os
+import struct
+import threading
+from pathlib import Path
+
+
+DEFAULT_ARCHIVE_DIR = Path.home() / ".local" / "share" / "voice-ctrl" / "audio"
+
+# Container format and PyAV encoder name for each supported codec
+CODECS = {
+    "flac": ("flac", "flac"),  # Lossless, about half the size of WAV
+    "opus": ("ogg", "libopus"),  # Lossy, about a tenth of the size of WAV
+}
+
+
+class AudioArchive:
+    """Stores compressed recordings in append-only segment files.
+
+    Each recording is encoded to FLAC or Opus and appended to the newest
+    segment file with a small header. A history entry keeps a reference
+    (segment number, offset, length), so reading a recording is one seek and
+    one read of just that blob. When the archive exceeds max_bytes, whole
+    segments are deleted oldest first; references into them then resolve to
+    None.
+    """
+
+    # Magic and payload length written before every blob
+    HEADER = struct.Struct("<4sI")
+    MAGIC = b"VCA1"
+    # Upper bound for one segment file
+    SEGMENT_BYTES = 8 * 1024 * 1024
+    # Opus bit rate, plenty for 16 kHz speech
+    OPUS_BIT_RATE = 24000
+
+    def __init__(self, archive_dir=None, max_bytes=256 * 1024 * 1024, codec="flac"):
+        """Initialize the archive.
+
+        Args:
+            archive_dir: Directory for segment files (defaults to ~/.local/share/voice-ctrl/audio)
+            max_bytes: Byte budget for all segments (default 256 MB)
+            codec: "flac" or "opus"
+        """
+        if codec not in CODECS:
+            raise ValueError(f"Unsupported codec: {codec}")
+        self.archive_dir = Path(archive_dir) if archive_dir else DEFAULT_ARCHIVE_DIR
+        self.max_bytes = max_bytes
+        self.codec = codec
+        self._lock = threading.Lock()
+
+    @property
+    def segment_bytes(self):
+        """Segment size, small enough that eviction can keep the budget."""
+        return max(64 * 1024, min(self.SEGMENT_BYTES, self.max_bytes // 4))
+
+    def _segment_path(self, number):
+        return self.archive_dir / f"{number:08d}.seg"
+
+    def _segments(self):
+        """List existing segment numbers, oldest first."""
+        if not self.archive_dir.exists():
+            return []
+        numbers = []
+        for path in self.archive_dir.glob("*.seg"):
+            try:
+                numbers.append(int(path.stem))
+            except ValueError:
+                continue
+        return sorted(numbers)
+
+    def encode(self, samples, sample_rate=16000):
+        """Compress mono int16 samples with the archive codec.
+
+        Args:
+            samples: 1-D int16 numpy array
+            sample_rate: Sample rate in Hz
+
+        Returns:
+            Encoded bytes
+        """
+        import av
+
+        container_format, encoder = CODECS[self.codec]
+        buffer = io.BytesIO()
+        container = av.open(buffer, mode="w", format=container_format)
+        try:
+            stream = container.add_stream(encoder, rate=sample_rate)
+            stream.layout = "mono"
+            if self.codec == "opus":
+                stream.bit_rate = self.OPUS_BIT_RATE
+
+            frame = av.AudioFrame.from_ndarray(samples.reshape(1, -1), format="s16", layout="mono")
+            frame.sample_rate = sample_rate
+            for packet in stream.encode(frame):
+                container.mux(packet)
+            for packet in stream.encode(None):
+                container.mux(packet)
+        finally:
+            container.close()
+        return buffer.getvalue()
+
+    def store(self, samples, sample_rate=16000):
+        """Compress a recording and append it to the archive.
+
+        Args:
+            samples: 1-D int16 numpy array of mono audio
+            sample_rate: Sample rate in Hz
+
+        Returns:
+            Reference dictionary to keep with the history entry
+        """
+        blob = self.encode(samples, sample_rate)
+
+        with self._lock:
+            self.archive_dir.mkdir(parents=True, exist_ok=True)
+            segments = self._segments()
+            number = segments[-1] if segments else 1
+            path = self._segment_path(number)
+            if path.exists() and path.stat().st_size + self.HEADER.size + len(blob) > self.segment_bytes:
+                number += 1
+                path = self._segment_path(number)
+
+            with open(path, "ab") as f:
+                offset = f.seek(0, os.SEEK_END) + self.HEADER.size
+                f.write(self.HEADER.pack(self.MAGIC, len(blob)))
+                f.write(blob)
+
+            self._evict()
+
+        return {
+            "segment": number,
+            "offset": offset,
+            "length": len(blob),
+            "codec": self.codec,
+            "sample_rate": sample_rate,
+        }
+
+    def _evict(self):
+        """Delete the oldest segments until the archive fits its budget (under the lock)."""
+        segments = self._segments()
+        sizes = {number: self._segment_path(number).stat().st_size for number in segments}
+        total = sum(sizes.values())
+        # The newest segment is being appended to and is never evicted
+        for number in segments[:-1]:
+            if total <= self.max_bytes:
+                break
+            self._segment_path(number).unlink()
+            total -= sizes[number]
+
+    def read(self, ref):
+        """Read the compressed blob of one recording.
+
+        Args:
+            ref: Reference returned by store()
+
+        Returns:
+            Encoded bytes, or None if the recording was evicted
+        """
+        try:
+            with open(self._segment_path(ref["segment"]), "rb") as f:
+                f.seek(ref["offset"] - self.HEADER.size)
+                magic, length = self.HEADER.unpack(f.read(self.HEADER.size))
+                if magic != self.MAGIC or length != ref["length"]:
+                    return None
+                return f.read(length)
+        except (OSError, KeyError, TypeError, struct.error):
+            return None
+
+    def contains(self, ref):
+        """Check whether a recording is still in the archive.
+
+        Args:
+            ref: Reference returned by store()
+
+        Returns:
+            True if the recording can be read
+        """
+        try:
+            return self._segment_path(ref["segment"]).exists()
+        except (KeyError, TypeError):
+            return False
+
+    def read_audio(self, ref):
+        """Decode one recording.
+
+        Args:
+            ref: Reference returned by store()
+
+        Returns:
+            1-D int16 numpy array at the stored sample rate, or None if evicted
+        """
+        import av
+        import numpy as np
+
+        blob = self.read(ref)
+        if blob is None:
+            return None
+
+        resampler = av.AudioResampler(format="s16", layout="mono", rate=ref.get("sample_rate", 16000))
+        chunks = []
+        with av.open(io.BytesIO(blob)) as container:
+            for frame in container.decode(audio=0):
+                for resampled in resampler.resample(frame):
+                    chunks.append(resampled.to_ndarray().reshape(-1))
+        for resampled in resampler.resample(None):
+            chunks.append(resampled.to_ndarray().reshape(-1))
+
+        if not chunks:
+            return np.zeros(0, dtype=np.int16)
+        return np.concatenate(chunks).astype(np.int16, copy=False)
+
+    @property
+    def total_bytes(self):
+        """Current size of all segments in bytes."""
+        with self._lock:
+            return sum(self._segment_path(number).stat().st_size for number in self._segments())
+
+
+_archive = None
+_archive_lock = threading.Lock()
+
+
+def get_audio_archive(max_bytes=None, codec=None):
+    """Get the process-wide audio archive.
+
+    Args:
+        max_bytes: If given, update the archive's byte budget
+        codec: If given, codec for recordings stored from now on
+
+    Returns:
+        Shared AudioArchive instance
+    """
+    global _archive
+    with _archive_lock:
+        if _archive is None:
+            _archive = AudioArchive()
+        if max_bytes is not None:
+            _archive.max_bytes = max_bytes
+        if codec is not None:
+            if codec not in CODECS:
+                raise ValueError(f"Unsupported codec: {codec}")
+            _archive.codec = codec
+        return _archive
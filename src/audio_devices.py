@@ -0,0 +1,134 @@
+"""Input device discovery and matching for AudioRecorder."""
+
+import re
+import sounddevice as sd
+
+
+# ALSA appends the card/device numbers, e.g. "USB Audio: - (hw:2,0)", which
+# change when devices are plugged in a different order or after a reboot
+_ALSA_SUFFIX = re.compile(r'\s*\((?:plug)?hw:\d+(?:,\d+)?\)\s*$')
+
+
+def normalize_device_name(name):
+    """Strip volatile parts of a PortAudio device name for stable matching.
+
+    Args:
+        name: Device name as reported by PortAudio
+
+    Returns:
+        Lowercase name without the ALSA hw:X,Y suffix
+    """
+    return _ALSA_SUFFIX.sub('', name or '').strip().lower()
+
+
+def describe_device(index, info, samplerate):
+    """Build the descriptor persisted in config as input_device_cache.
+
+    Args:
+        index: PortAudio device index
+        info: Device info dictionary from sounddevice.query_devices
+        samplerate: Native sample rate the device should be opened at
+
+    Returns:
+        Dictionary with name, index, hostapi, samplerate and channels
+    """
+    return {
+        'name': info['name'],
+        'index': index,
+        'hostapi': info['hostapi'],
+        'samplerate': int(samplerate),
+        'channels': info['max_input_channels'],
+    }
+
+
+def list_input_devices():
+    """List all devices with at least one input channel.
+
+    Returns:
+        List of (index, name) tuples
+    """
+    return [
+        (index, info['name'])
+        for index, info in enumerate(sd.query_devices())
+        if info['max_input_channels'] > 0
+    ]
+
+
+def _find_device_index(selection):
+    """Map a configured device selection to a PortAudio index.
+
+    Args:
+        selection: "" or None for the default input, an int index, or a name;
+            a string of digits is an index unless a device has that name
+
+    Returns:
+        Device index, or None to use the system default
+    """
+    if selection is None or selection == "":
+        return None
+    if isinstance(selection, int):
+        return selection
+
+    wanted = normalize_device_name(selection)
+    devices = list_input_devices()
+
+    # Exact match on the normalized name first, then an index typed as text,
+    # then substring match ("2" must not pick "USB Audio 2.0")
+    for index, name in devices:
+        if normalize_device_name(name) == wanted:
+            return index
+    if wanted.isdigit():
+        return int(wanted)
+    for index, name in devices:
+        if wanted in normalize_device_name(name):
+            return index
+
+    raise ValueError(f"Input device not found: '{selection}'")
+
+
+def resolve_input_device(selection, channels=1):
+    """Resolve a device selection to a descriptor, enumerating devices if needed.
+
+    Args:
+        selection: "" or None for the default input, an int index, or a name
+        channels: Number of channels the recorder will capture
+
+    Returns:
+        Device descriptor dictionary (see describe_device)
+    """
+    index = _find_device_index(selection)
+    info = sd.query_devices(index, 'input')
+    if index is None:
+        index = info['index']
+
+    samplerate = int(info['default_samplerate'])
+    sd.check_input_settings(device=index, channels=channels, samplerate=samplerate)
+
+    descriptor = describe_device(index, info, samplerate)
+    descriptor['selection'] = "" if selection is None else selection
+    return descriptor
+
+
+def descriptor_matches(descriptor, selection):
+    """Check whether a cached descriptor can be used for the given selection.
+
+    Only the single cached index is queried, so this avoids enumerating every
+    ALSA/PulseAudio endpoint while still catching indices that moved after a
+    reboot or hotplug.
+
+    Args:
+        descriptor: Cached descriptor dictionary (may be empty)
+        selection: "" or None for the default input, an int index, or a name
+
+    Returns:
+        True if the descriptor is still valid for this selection
+    """
+    if not descriptor or descriptor.get('selection', "") != ("" if selection is None else selection):
+        return False
+
+    try:
+        info = sd.query_devices(descriptor['index'])
+    except Exception:
+        return False
+
+    return info['name'] == descriptor.get('name') and info['max_input_channels'] > 0
@@ -6,7 +6,19 @@ import threading
 
 
 class AudioFeedback:
-    """Plays audio feedback beeps for recording events."""
+    """Plays audio feedback beeps for recording events.
+
+    Beeps are synthesized once and played through a single output stream whose
+    callback mixes the active sounds, so triggering a beep only queues a buffer
+    and (re)starts an already open stream instead of spawning a thread and
+    opening a new device with sd.play().
+    """
+
+    # (frequency Hz, duration s) for each beep
+    BEEPS = {
+        "start": (800, 0.1),  # Higher pitch for "start"
+        "stop": (400, 0.15),  # Lower pitch for "stop"
+    }
 
     def __init__(self, enabled=True, sample_rate=44100):
         """Initialize the audio feedback system.
@@ -17,6 +29,19 @@ class AudioFeedback:
         """
         self.enabled = enabled
         self.sample_rate = sample_rate
+        self.stream = None
+        self._voices = []  # [buffer, position] pairs currently being played
+        self._lock = threading.Lock()
+        self._stopping = False  # Set by the callback once it has nothing left to play
+
+        # Synthesize all beeps up front; playback only copies these buffers
+        self._beeps = {
+            name: self._generate_beep(frequency, duration)
+            for name, (frequency, duration) in self.BEEPS.items()
+        }
+
+        if self.enabled:
+            self._open_stream()
 
     def _generate_beep(self, frequency, duration, volume=0.3):
         """Generate a simple sine wave beep.
@@ -27,7 +52,7 @@ class AudioFeedback:
             volume: Volume level (0.0 to 1.0, default 0.3 for non-intrusive)
 
         Returns:
-            numpy array containing the audio samples
+            float32 numpy array containing the audio samples
         """
         t = np.linspace(0, duration, int(self.sample_rate * duration), False)
         # Generate sine wave
@@ -39,18 +64,65 @@ class AudioFeedback:
         envelope[-fade_samples:] = np.linspace(1, 0, fade_samples)
         # Apply volume and envelope
         audio = note * envelope * volume
-        return audio
+        return audio.astype(np.float32)
+
+    def _open_stream(self):
+        """Open the persistent output stream (not started until a beep plays)."""
+        if self.stream is not None:
+            return
+
+        try:
+            self.stream = sd.OutputStream(
+                samplerate=self.sample_rate,
+                channels=1,
+                dtype='float32',
+                latency='low',
+                callback=self._callback
+            )
+        except Exception as e:
+            # Fail silently - audio feedback is non-critical
+            print(f"WARNING: Could not open audio feedback stream: {e}")
+            self.stream = None
+
+    def _callback(self, outdata, frames, time_info, status):
+        """Mix all active beeps into the output buffer (runs on the audio thread)."""
+        outdata.fill(0)
+        with self._lock:
+            for voice in self._voices:
+                buffer, position = voice
+                chunk = buffer[position:position + frames]
+                outdata[:len(chunk), 0] += chunk
+                voice[1] = position + len(chunk)
+            self._voices = [voice for voice in self._voices if voice[1] < len(voice[0])]
+            self._stopping = finished = not self._voices
+
+        if finished:
+            # Stop callbacks while idle; the stream stays open for the next beep
+            raise sd.CallbackStop
 
     def _play_sound(self, audio_data):
-        """Play audio data through the default output device.
+        """Queue audio data on the persistent output stream.
 
         Args:
-            audio_data: numpy array containing audio samples
+            audio_data: float32 numpy array containing audio samples
         """
+        if self.stream is None:
+            self._open_stream()
+            if self.stream is None:
+                return
+
         try:
-            sd.play(audio_data, self.sample_rate)
-            # Don't wait for playback to complete (non-blocking)
-        except Exception as e:
+            with self._lock:
+                self._voices.append([audio_data, 0])
+                needs_start = self._stopping or not self.stream.active
+                self._stopping = False
+
+            if needs_start:
+                # A stream that finished via CallbackStop must be stopped before restarting
+                if not self.stream.stopped:
+                    self.stream.stop()
+                self.stream.start()
+        except Exception:
             # Fail silently - audio feedback is non-critical
             pass
 
@@ -58,29 +130,13 @@ class AudioFeedback:
         """Play a beep sound when recording starts (higher pitch)."""
         if not self.enabled:
             return
-
-        def _play_async():
-            # Higher frequency beep for "start" (800 Hz)
-            beep = self._generate_beep(frequency=800, duration=0.1)
-            self._play_sound(beep)
-
-        # Play in separate thread to avoid blocking
-        thread = threading.Thread(target=_play_async, daemon=True)
-        thread.start()
+        self._play_sound(self._beeps["start"])
 
     def play_stop_beep(self):
         """Play a beep sound when recording stops (lower pitch)."""
         if not self.enabled:
             return
-
-        def _play_async():
-            # Lower frequency beep for "stop" (400 Hz)
-            beep = self._generate_beep(frequency=400, duration=0.15)
-            self._play_sound(beep)
-
-        # Play in separate thread to avoid blocking
-        thread = threading.Thread(target=_play_async, daemon=True)
-        thread.start()
+        self._play_sound(self._beeps["stop"])
 
     def set_enabled(self, enabled):
         """Enable or disable audio feedback.
@@ -89,3 +145,14 @@ class AudioFeedback:
             enabled: True to enable, False to disable
         """
         self.enabled = enabled
+        if enabled:
+            self._open_stream()
+
+    def close(self):
+        """Close the output stream."""
+        if self.stream is not None:
+            try:
+                self.stream.close()
+            except Exception:
+                pass
+            self.stream = None
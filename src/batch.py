@@ -0,0 +1,305 @@
+"""Batch transcription of audio files with a pool of local model workers.
+
+Used by `voice-ctrl transcribe <files/dirs>`. Each worker process loads its
+own faster-whisper model, so throughput scales with the number of cores as
+long as there is memory for the models. Results are written as JSON lines
+as soon as each file finishes, and files already present in the output
+file are skipped, so an interrupted batch can simply be run again.
+"""
+
+import contextlib
+import json
+import os
+import sys
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+
+# File extensions picked up when a directory is given
+AUDIO_EXTENSIONS = {".wav", ".mp3", ".m4a", ".ogg", ".oga", ".opus", ".flac", ".webm", ".mp4", ".aac"}
+
+# Approximate resident memory of one int8 worker per model size, in MB
+MODEL_MEMORY_MB = {
+    "tiny": 200,
+    "base": 300,
+    "small": 700,
+    "medium": 1600,
+    "large": 3200,
+}
+# Used when the model size cannot be determined
+DEFAULT_MODEL_MEMORY_MB = 1024
+
+# Per-process state in pool workers
+_transcriber = None
+
+
+def collect_audio_files(paths):
+    """Expand files and directories into a sorted list of audio files.
+
+    Args:
+        paths: Iterable of file or directory paths
+
+    Returns:
+        List of absolute file path strings, without duplicates
+    """
+    files = set()
+    for path in paths:
+        path = Path(path).expanduser().resolve()
+        if path.is_dir():
+            for candidate in path.rglob("*"):
+                if candidate.is_file() and candidate.suffix.lower() in AUDIO_EXTENSIONS:
+                    files.add(str(candidate))
+        elif path.is_file():
+            files.add(str(path))
+        else:
+            print(f"WARNING: Skipping missing path: {path}", file=sys.stderr)
+    return sorted(files)
+
+
+def _available_memory_mb():
+    """Read MemAvailable from /proc/meminfo.
+
+    Returns:
+        Available memory in MB, or None if unknown
+    """
+    try:
+        with open("/proc/meminfo") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) // 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def estimate_model_memory_mb(model_source):
+    """Estimate how much memory one worker needs for a model.
+
+    Args:
+        model_source: Model path or ID as used by LocalTranscriber
+
+    Returns:
+        Estimated memory in MB
+    """
+    path = Path(model_source).expanduser()
+    if path.is_dir():
+        size = sum(f.stat().st_size for f in path.rglob("*") if f.is_file())
+        # Weights plus decoder buffers and interpreter overhead
+        return int(size * 1.5 / (1024 * 1024)) + 200
+
+    name = str(model_source).lower()
+    for size_name, memory_mb in MODEL_MEMORY_MB.items():
+        if size_name in name:
+            return memory_mb
+    return DEFAULT_MODEL_MEMORY_MB
+
+
+def plan_workers(file_count, model_source, requested=None):
+    """Choose the number of worker processes and threads per worker.
+
+    Workers are limited by cores, by available memory for one model each,
+    and by the number of files.
+
+    Args:
+        file_count: Number of files to transcribe
+        model_source: Model path or ID as used by LocalTranscriber
+        requested: Explicit worker count, or None to decide automatically
+
+    Returns:
+        Tuple of (workers, cpu_threads per worker)
+    """
+    cores = os.cpu_count() or 1
+
+    if requested:
+        workers = requested
+    else:
+        workers = cores
+        available_mb = _available_memory_mb()
+        if available_mb is not None:
+            workers = min(workers, max(1, available_mb // estimate_model_memory_mb(model_source)))
+
+    workers = max(1, min(workers, file_count or 1))
+    cpu_threads = max(1, cores // workers)
+    return workers, cpu_threads
+
+
+def load_completed(output_path):
+    """Read the files already transcribed successfully in an output file.
+
+    Args:
+        output_path: Path to a JSONL output file
+
+    Returns:
+        Set of file path strings
+    """
+    completed = set()
+    try:
+        with open(output_path) as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # Partial line from an interrupted run
+                if "path" in record and "error" not in record:
+                    completed.add(record["path"])
+    except FileNotFoundError:
+        pass
+    return completed
+
+
+def _terminate_partial_line(output_path):
+    """Append a newline if an interrupted run left the last line unfinished.
+
+    Args:
+        output_path: Path to a JSONL output file
+    """
+    try:
+        with open(output_path, "rb+") as f:
+            if f.seek(0, os.SEEK_END) == 0:
+                return
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                f.write(b"\n")
+    except FileNotFoundError:
+        pass
+
+
+def _init_worker(cpu_threads):
+    """Create the worker's transcriber (runs once in each pool process)."""
+    global _transcriber
+    # Keep stdout free for JSONL output; status messages go to stderr
+    sys.stdout = sys.stderr
+
+    from .config import Config
+    from .local_transcriber import LocalTranscriber
+    # Workers load with the saved or guessed compute type; benchmarking in
+    # every worker at once would need extra model copies and skew the timings
+    _transcriber = LocalTranscriber(config=Config(), cpu_threads=cpu_threads, benchmark=False)
+
+
+def _transcribe_file(path):
+    """Transcribe one file in a worker process.
+
+    Args:
+        path: Audio file path
+
+    Returns:
+        Result record dictionary
+    """
+    from .transcript_cache import get_transcript_cache
+
+    started = time.perf_counter()
+    record = {"path": path}
+    try:
+        cache = get_transcript_cache(_transcriber.config.get_transcript_cache_max_bytes())
+        cache_key = _transcriber.cache_key(Path(path))
+        cached = cache.get(cache_key) if cache_key else None
+        if cached:
+            record.update(cached)
+            record["cached"] = True
+        else:
+            segments, info = _transcriber.decode(path)
+            text = " ".join(segment.text for segment in segments).strip()
+            record["language"] = info.language
+            record["audio_seconds"] = round(info.duration, 2)
+            if not text:
+                # Reported like the hotkey path; a rerun tries the file again
+                raise RuntimeError("No speech detected")
+            record["text"] = text
+            if cache_key:
+                cache.put(cache_key, {
+                    "text": record["text"],
+                    "language": record["language"],
+                    "audio_seconds": record["audio_seconds"],
+                })
+    except Exception as e:
+        record["error"] = str(e)
+    record["seconds"] = round(time.perf_counter() - started, 2)
+    return record
+
+
+def run_batch(paths, output=None, workers=None):
+    """Transcribe files and directories with the local model.
+
+    Args:
+        paths: Files and/or directories to transcribe
+        output: JSONL output path (None writes to stdout without resuming)
+        workers: Number of worker processes (None sizes to cores and memory)
+
+    Returns:
+        Process exit code (0 if every file was transcribed)
+    """
+    from .config import Config
+
+    files = collect_audio_files(paths)
+
+    out_file = sys.stdout
+    if output:
+        completed = load_completed(output)
+        if completed:
+            print(f"Resuming: {len(completed)} file(s) already in {output}", file=sys.stderr)
+        files = [path for path in files if path not in completed]
+
+    if not files:
+        print("Nothing to transcribe", file=sys.stderr)
+        return 0
+
+    if output:
+        _terminate_partial_line(output)
+        out_file = open(output, "a")
+
+    # Config reports on stdout, which may be carrying the JSONL output
+    with contextlib.redirect_stdout(sys.stderr):
+        config = Config()
+    model_source = config.get_local_model_path() or config.get_local_model_id() or "base"
+    worker_count, cpu_threads = plan_workers(len(files), model_source, workers)
+    print(
+        f"Transcribing {len(files)} file(s) with {worker_count} worker(s) x {cpu_threads} thread(s)",
+        file=sys.stderr
+    )
+
+    started = time.perf_counter()
+    failures = 0
+    audio_seconds = 0.0
+    interrupted = False
+
+    # Spawned workers do not inherit threads or locks from this process
+    executor = ProcessPoolExecutor(
+        max_workers=worker_count,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(cpu_threads,)
+    )
+    try:
+        futures = [executor.submit(_transcribe_file, path) for path in files]
+        for done, future in enumerate(as_completed(futures), start=1):
+            record = future.result()
+            out_file.write(json.dumps(record) + "\n")
+            out_file.flush()
+
+            if "error" in record:
+                failures += 1
+                print(f"[{done}/{len(files)}] FAILED {record['path']}: {record['error']}", file=sys.stderr)
+            else:
+                audio_seconds += record.get("audio_seconds", 0.0)
+                print(f"[{done}/{len(files)}] {record['path']} ({record['seconds']:.1f}s)", file=sys.stderr)
+    except KeyboardInterrupt:
+        interrupted = True
+    finally:
+        executor.shutdown(wait=not interrupted, cancel_futures=True)
+        if out_file is not sys.stdout:
+            out_file.close()
+
+    if interrupted:
+        print("\nInterrupted. Run the same command again to resume.", file=sys.stderr)
+        return 130
+
+    elapsed = time.perf_counter() - started
+    speed = f", {audio_seconds / elapsed:.1f}x realtime" if audio_seconds and elapsed > 0 else ""
+    print(
+        f"Done: {len(files) - failures} transcribed, {failures} failed in {elapsed:.1f}s{speed}",
+        file=sys.stderr
+    )
+    return 1 if failures else 0
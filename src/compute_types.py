@@ -0,0 +1,302 @@
+"""Choice of the faster-whisper compute type from CPU features and benchmarks."""
+
+import gc
+import json
+import os
+import platform
+import threading
+import time
+from pathlib import Path
+
+
+DEFAULT_RESULTS_PATH = Path.home() / ".cache" / "voice-ctrl" / "compute_types.json"
+
+# CTranslate2 compute types usable on the CPU, the values of local_compute_type besides "auto"
+CPU_COMPUTE_TYPES = ("int8", "int8_float32", "int8_bfloat16", "bfloat16", "float32")
+
+# CPU features that change which compute type is fastest, and the /proc/cpuinfo flags for each
+CPU_FEATURE_FLAGS = {
+    "avx2": ("avx2",),
+    "avx512": ("avx512f",),
+    "vnni": ("avx512_vnni", "avx_vnni"),
+    "bf16": ("avx512_bf16",),
+    "amx": ("amx_int8", "amx_bf16", "amx_tile"),
+}
+
+
+def read_cpu_info(path="/proc/cpuinfo"):
+    """Read the CPU model name and flags.
+
+    Args:
+        path: cpuinfo file to read
+
+    Returns:
+        Tuple of (model name, set of flags); empty if the file cannot be read
+    """
+    name = ""
+    flags = set()
+    try:
+        with open(path) as f:
+            for line in f:
+                key, _, value = line.partition(":")
+                key = key.strip()
+                if key == "model name" and not name:
+                    name = value.strip()
+                elif key == "flags" and not flags:
+                    flags = set(value.split())
+                if name and flags:
+                    break
+    except OSError:
+        pass
+    return name, flags
+
+
+def cpu_features(flags):
+    """Reduce CPU flags to the features in CPU_FEATURE_FLAGS.
+
+    Args:
+        flags: Set of /proc/cpuinfo flags
+
+    Returns:
+        Sorted list of feature names present
+    """
+    return sorted(feature for feature, names in CPU_FEATURE_FLAGS.items() if flags.intersection(names))
+
+
+def supported_compute_types():
+    """Get the CPU compute types of the installed CTranslate2 build.
+
+    Returns:
+        Set of compute type names
+    """
+    try:
+        import ctranslate2
+        return set(ctranslate2.get_supported_compute_types("cpu"))
+    except Exception:
+        return {"int8", "float32"}
+
+
+def candidate_compute_types(features, supported):
+    """Order the compute types worth trying, most likely fastest first.
+
+    Without AVX2, int8 matrix products fall back to slow code, so float32
+    comes first. bfloat16 types only help with AVX-512 BF16 or AMX.
+
+    Args:
+        features: CPU features from cpu_features
+        supported: Compute types from supported_compute_types
+
+    Returns:
+        List of compute types
+    """
+    if "avx2" in features:
+        order = ["int8", "int8_float32"]
+        if "bf16" in features or "amx" in features:
+            order += ["int8_bfloat16", "bfloat16"]
+        order.append("float32")
+    else:
+        order = ["float32", "int8"]
+    return [compute_type for compute_type in order if compute_type in supported] or ["float32"]
+
+
+def benchmark_audio(seconds=5, sample_rate=16000):
+    """Make the fixed audio decoded by benchmarks: quiet noise, the same every time."""
+    import numpy as np
+    return (np.random.default_rng(0).standard_normal(seconds * sample_rate) * 0.01).astype(np.float32)
+
+
+class ComputeTypeSelector:
+    """Picks the fastest compute type for each model on this machine.
+
+    Until a model has been benchmarked, the first of candidate_compute_types
+    is used. A benchmark loads the model once per candidate, decodes the
+    same short audio with a bounded number of tokens, and keeps the type
+    with the lowest decode time.
+
+    Results are saved as JSON under a key made of the CPU model, core
+    count, relevant features and CTranslate2 version, so a config shared
+    between machines, or a CTranslate2 upgrade, leads to a new benchmark.
+    """
+
+    # Timed decodes per compute type, after one untimed warm-up decode
+    RUNS = 2
+    # Tokens decoded per run, so the time does not depend on what noise decodes to
+    MAX_NEW_TOKENS = 16
+
+    def __init__(self, path=None, cpuinfo_path="/proc/cpuinfo", supported=None):
+        """Detect the CPU and load earlier results.
+
+        Args:
+            path: JSON file for results (defaults to ~/.cache/voice-ctrl/compute_types.json)
+            cpuinfo_path: cpuinfo file to read the CPU from
+            supported: Compute types to consider (defaults to supported_compute_types())
+        """
+        self.path = Path(path) if path else DEFAULT_RESULTS_PATH
+        cpu_name, flags = read_cpu_info(cpuinfo_path)
+        self.features = cpu_features(flags)
+        self.candidates = candidate_compute_types(
+            self.features, supported if supported is not None else supported_compute_types()
+        )
+        self.machine = self._machine_key(cpu_name)
+        self._lock = threading.Lock()
+        self._benchmark_lock = threading.Lock()
+        self._results = self._load()
+
+    def _machine_key(self, cpu_name):
+        try:
+            from importlib.metadata import version
+            ctranslate2_version = version("ctranslate2")
+        except Exception:
+            ctranslate2_version = "unknown"
+        return (
+            f"{cpu_name or platform.machine()} x{os.cpu_count()} "
+            f"[{','.join(self.features)}] ctranslate2-{ctranslate2_version}"
+        )
+
+    def _load(self):
+        """Read this machine's results, ignoring malformed entries."""
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or not isinstance(data.get(self.machine), dict):
+            return {}
+
+        return {
+            model: result for model, result in data[self.machine].items()
+            if isinstance(result, dict) and result.get("compute_type") in CPU_COMPUTE_TYPES
+        }
+
+    def _save(self):
+        """Write this machine's results atomically, keeping other machines' (called under the lock)."""
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+            if not isinstance(data, dict):
+                data = {}
+        except (OSError, ValueError):
+            data = {}
+        data[self.machine] = self._results
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.path.with_suffix(".tmp")
+            with open(temp_path, "w") as f:
+                json.dump(data, f, indent=2)
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            print(f"WARNING: Could not save compute type benchmarks: {e}")
+
+    def get(self, model):
+        """Get the benchmark result for a model.
+
+        Args:
+            model: Model path or ID
+
+        Returns:
+            Dict with "compute_type", "decode_ms" and "load_ms" per type, or None if not benchmarked
+        """
+        with self._lock:
+            result = self._results.get(model)
+            return dict(result) if result else None
+
+    def choose(self, model):
+        """Get the compute type to load a model with.
+
+        Args:
+            model: Model path or ID
+
+        Returns:
+            Benchmarked fastest type, or the likely fastest for this CPU
+        """
+        result = self.get(model)
+        return result["compute_type"] if result else self.candidates[0]
+
+    def benchmark(self, model, loader, cpu_threads=0, options=None, wait_idle=None):
+        """Time every candidate compute type for a model and remember the fastest.
+
+        Only one benchmark runs at a time; a model benchmarked meanwhile by
+        another caller is not measured again.
+
+        Args:
+            model: Model path or ID
+            loader: Callable loading a model, called as loader(model, cpu_threads=..., compute_type=...)
+            cpu_threads: Threads used by the model
+            options: Decoding options such as language and beam_size
+            wait_idle: Optional callable blocking while dictations are being
+                transcribed; called before every load and decode so the
+                benchmark does not compete with them for the CPU
+
+        Returns:
+            The model's result from get(), or None if no candidate could be loaded
+        """
+        with self._benchmark_lock:
+            if self.get(model):
+                return self.get(model)
+
+            audio = benchmark_audio()
+            decode_options = dict(
+                options or {},
+                vad_filter=False,
+                temperature=0.0,
+                condition_on_previous_text=False,
+                max_new_tokens=self.MAX_NEW_TOKENS,
+            )
+            decode_ms = {}
+            load_ms = {}
+            for compute_type in self.candidates:
+                try:
+                    if wait_idle is not None:
+                        wait_idle()
+                    start = time.perf_counter()
+                    instance = loader(model, cpu_threads=cpu_threads, compute_type=compute_type)
+                    load_ms[compute_type] = round((time.perf_counter() - start) * 1000)
+
+                    runs = []
+                    for _ in range(self.RUNS + 1):
+                        if wait_idle is not None:
+                            wait_idle()
+                        start = time.perf_counter()
+                        segments, _ = instance.transcribe(audio, **decode_options)
+                        for _ in segments:
+                            pass
+                        runs.append((time.perf_counter() - start) * 1000)
+                    decode_ms[compute_type] = round(min(runs[1:]))
+                except Exception as e:
+                    print(f"Skipping compute type {compute_type} for {model}: {e}")
+                finally:
+                    instance = None
+                    gc.collect()
+
+            if not decode_ms:
+                return None
+
+            best = min(decode_ms, key=decode_ms.get)
+            with self._lock:
+                self._results[model] = {
+                    "compute_type": best,
+                    "decode_ms": decode_ms,
+                    "load_ms": load_ms,
+                    "measured_at": int(time.time()),
+                }
+                self._save()
+            print(f"Fastest compute type for {model}: {best} ({decode_ms})")
+            return self.get(model)
+
+
+_selector = None
+_selector_lock = threading.Lock()
+
+
+def get_compute_type_selector():
+    """Get the process-wide compute type selector.
+
+    Returns:
+        Shared ComputeTypeSelector instance
+    """
+    global _selector
+    with _selector_lock:
+        if _selector is None:
+            _selector = ComputeTypeSelector()
+        return _selector
@@ -2,8 +2,32 @@
 
 import json
 import logging
+import threading
 from pathlib import Path
 from .notifier import Notifier
+from .logging_setup import setup_logging, configure_logging
+from .shortcuts import shortcut_keys
+from .compute_types import CPU_COMPUTE_TYPES
+from .paste_profiles import OVERRIDE_STRATEGIES
+
+
+class ConfigChange:
+    """A single setting that changed between two versions of the config."""
+
+    def __init__(self, key, old_value, new_value):
+        """Initialize the change event.
+
+        Args:
+            key: Configuration key that changed
+            old_value: Value before the change
+            new_value: Value after the change
+        """
+        self.key = key
+        self.old_value = old_value
+        self.new_value = new_value
+
+    def __repr__(self):
+        return f"ConfigChange({self.key!r}, {self.old_value!r} -> {self.new_value!r})"
 
 
 class Config:
@@ -12,15 +36,61 @@ class Config:
     # Default configuration values
     DEFAULT_CONFIG = {
         "api_key": "",
+        "openai_base_url": "",  # OpenAI-compatible server URL ("" = api.openai.com)
+        "openai_model": "whisper-1",  # Model name sent to the transcription endpoint
+        "openai_timeout_seconds": 30,  # Request timeout of the transcription endpoint
+        "openai_auth_header": "",  # Extra "Name: value" header, e.g. for a reverse proxy
         "max_duration_seconds": 240,
         "audio_feedback_enabled": True,
         "keyboard_shortcut": "Ctrl+Shift+Space",
         "autostart_enabled": False,
         "stt_provider": "openai",  # "openai" or "local"
-        "local_engine": "faster-whisper",  # Local STT engine to use
+        "local_engine": "faster-whisper",  # Local STT engine: "faster-whisper" or "whisper.cpp"
         "local_model_path": "",  # Path to local model file
         "local_model_id": "",  # Hugging Face model ID (e.g., "openai/whisper-small")
-        "local_scan_paths": []  # List of paths to scan for models
+        "local_compute_type": "auto",  # faster-whisper weight type ("auto" = benchmarked per machine)
+        "local_scan_paths": [],  # List of paths to scan for models
+        "input_device": "",  # Input device name or index ("" for system default)
+        "input_device_cache": {},  # Last resolved input device descriptor
+        "audio_blocksize": 0,  # Frames per audio callback (0 = PortAudio default)
+        "audio_latency": "low",  # PortAudio latency hint: "low", "high" or seconds
+        "log_level": "ERROR",  # Minimum level written to voice-ctrl.log
+        "log_max_bytes": 1048576,  # Rotate log files at this size
+        "log_backup_count": 3,  # Rotated log files to keep
+        "perf_log_enabled": False,  # Write timing spans to perf.jsonl
+        "transcript_cache_enabled": True,  # Reuse results for identical audio
+        "transcript_cache_max_mb": 64,  # Disk budget of the transcript cache
+        "audio_retention_enabled": False,  # Keep compressed recordings with history
+        "audio_retention_max_mb": 256,  # Disk budget of the audio archive
+        "audio_retention_codec": "flac",  # "flac" (lossless) or "opus" (smaller)
+        "context_prompt_enabled": False,  # Prompt the model with the glossary and recent dictations (opt-in: sent to OpenAI)
+        "prompt_max_tokens": 120,  # Token budget of the prompt (Whisper allows up to 223)
+        "prompt_history_max_age_minutes": 30,  # Only use dictations this recent in the prompt
+        "glossary": [],  # Words and names the model should spell correctly
+        "progressive_paste_enabled": False,  # Paste local transcriptions segment by segment
+        "typing_max_chars": 32,  # Type texts up to this length instead of pasting (0 = never)
+        "typing_apps": [],  # WM_CLASS names of applications where text is always typed
+        "paste_app_overrides": {},  # WM_CLASS class -> {"strategy": ..., "delay": seconds}
+        "hotkey_profiles": [],  # Extra shortcuts, each with its own provider, model and paste settings
+        "warm_models_max_mb": 2048,  # Memory budget for keeping the profiles' local models loaded
+        "model_idle_unload_minutes": 0  # Unload local models unused this long (0 = keep loaded)
+    }
+
+    # Settings that are applied to the logging subsystem
+    LOGGING_KEYS = ("log_level", "log_max_bytes", "log_backup_count", "perf_log_enabled")
+    LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+    PASTE_STRATEGIES = OVERRIDE_STRATEGIES
+    LOCAL_ENGINES = ("faster-whisper", "whisper.cpp")
+    # Settings a hotkey profile may contain, with their types
+    HOTKEY_PROFILE_FIELDS = {
+        "name": str,
+        "shortcut": str,
+        "provider": str,
+        "model": str,
+        "language": str,
+        "beam_size": int,
+        "vad_filter": bool,
+        "paste_strategy": str,
     }
 
     def __init__(self, config_path=None, log_path=None):
@@ -38,25 +108,39 @@ class Config:
         # Ensure config directory exists
         config_dir.mkdir(parents=True, exist_ok=True)
 
-        # Set up logging
-        self._setup_logging()
+        # Set up logging (the first Config in the process initializes it)
+        setup_logging(self.log_path)
+        self.logger = logging.getLogger(__name__)
 
         # Initialize notifier
         self.notifier = Notifier(log_path=self.log_path)
 
+        # Change notification state
+        self._subscribers = []  # (frozenset of keys, callback) pairs
+        self._lock = threading.Lock()
+        self._watch_thread = None
+        self._watch_stop = threading.Event()
+
         # Load configuration
         self.settings = self._load_config()
+        self._last_mtime = self._get_mtime()
+
+        # Apply logging settings now and whenever they change
+        self._apply_logging_settings()
+        self.subscribe(self.LOGGING_KEYS, self._apply_logging_settings)
+
+    def _apply_logging_settings(self, changes=None):
+        """Push the logging settings to the logging subsystem.
 
-    def _setup_logging(self):
-        """Configure logging to file."""
-        logging.basicConfig(
-            filename=str(self.log_path),
-            level=logging.ERROR,
-            format='[%(asctime)s] %(levelname)s: %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S',
-            force=True
+        Args:
+            changes: Dict of key -> ConfigChange (unused, settings are re-read)
+        """
+        configure_logging(
+            level=self.get_log_level(),
+            max_bytes=self.get_log_max_bytes(),
+            backup_count=self.get_log_backup_count(),
+            perf_log_enabled=self.is_perf_log_enabled()
         )
-        self.logger = logging.getLogger(__name__)
 
     def _load_config(self):
         """Load configuration from file or create default config.
@@ -162,6 +246,35 @@ class Config:
         if "api_key" in config and not isinstance(config["api_key"], str):
             return False
 
+        # Check that openai_base_url is empty or an HTTP(S) URL
+        if "openai_base_url" in config:
+            base_url = config["openai_base_url"]
+            if not isinstance(base_url, str):
+                return False
+            if base_url.strip() and not base_url.strip().startswith(("http://", "https://")):
+                return False
+
+        # Check that openai_model is a non-empty string
+        if "openai_model" in config:
+            if not isinstance(config["openai_model"], str) or not config["openai_model"].strip():
+                return False
+
+        # Check that openai_timeout_seconds is a positive number
+        if "openai_timeout_seconds" in config:
+            timeout = config["openai_timeout_seconds"]
+            if isinstance(timeout, bool) or not isinstance(timeout, (int, float)) or not 0 < timeout <= 600:
+                return False
+
+        # Check that openai_auth_header is empty or "Name: value"
+        if "openai_auth_header" in config:
+            header = config["openai_auth_header"]
+            if not isinstance(header, str):
+                return False
+            if header.strip():
+                name, separator, _ = header.partition(":")
+                if not separator or not name.strip():
+                    return False
+
         # Check that max_duration_seconds is a positive number
         if "max_duration_seconds" in config:
             if not isinstance(config["max_duration_seconds"], (int, float)):
@@ -193,9 +306,20 @@ class Config:
                 )
                 config["stt_provider"] = "openai"  # Revert to default
 
-        # Check that local_engine is a string
-        if "local_engine" in config and not isinstance(config["local_engine"], str):
-            return False
+        # Check that local_engine is a known engine
+        if "local_engine" in config:
+            if not isinstance(config["local_engine"], str):
+                return False
+            if config["local_engine"] not in self.LOCAL_ENGINES:
+                self.logger.error(
+                    f"Invalid local_engine value: {config['local_engine']}. "
+                    f"Must be one of {', '.join(self.LOCAL_ENGINES)}"
+                )
+                self.notifier.notify_error(
+                    "Configuration Error",
+                    f"Invalid local_engine: '{config['local_engine']}'. Using default 'faster-whisper'."
+                )
+                config["local_engine"] = "faster-whisper"  # Revert to default
 
         # Check that local_model_path is a string
         if "local_model_path" in config and not isinstance(config["local_model_path"], str):
@@ -205,6 +329,21 @@ class Config:
         if "local_model_id" in config and not isinstance(config["local_model_id"], str):
             return False
 
+        # Check that local_compute_type is "auto" or a CPU compute type
+        if "local_compute_type" in config:
+            if not isinstance(config["local_compute_type"], str):
+                return False
+            if config["local_compute_type"] not in ("auto",) + CPU_COMPUTE_TYPES:
+                self.logger.error(
+                    f"Invalid local_compute_type value: {config['local_compute_type']}. "
+                    f"Must be 'auto' or one of {', '.join(CPU_COMPUTE_TYPES)}"
+                )
+                self.notifier.notify_error(
+                    "Configuration Error",
+                    f"Invalid local_compute_type: '{config['local_compute_type']}'. Using default 'auto'."
+                )
+                config["local_compute_type"] = "auto"  # Revert to default
+
         # Check that local_scan_paths is a list
         if "local_scan_paths" in config:
             if not isinstance(config["local_scan_paths"], list):
@@ -213,8 +352,330 @@ class Config:
             if not all(isinstance(path, str) for path in config["local_scan_paths"]):
                 return False
 
+        # Check that input_device is a name or an index
+        if "input_device" in config:
+            if isinstance(config["input_device"], bool) or not isinstance(config["input_device"], (str, int)):
+                return False
+
+        # Check that input_device_cache is a dictionary
+        if "input_device_cache" in config and not isinstance(config["input_device_cache"], dict):
+            return False
+
+        # Check that audio_blocksize is a non-negative integer
+        if "audio_blocksize" in config:
+            if isinstance(config["audio_blocksize"], bool) or not isinstance(config["audio_blocksize"], int):
+                return False
+            if config["audio_blocksize"] < 0:
+                return False
+
+        # Check that audio_latency is "low", "high" or a positive number of seconds
+        if "audio_latency" in config:
+            latency = config["audio_latency"]
+            if isinstance(latency, str):
+                if latency not in ["low", "high"]:
+                    return False
+            elif isinstance(latency, bool) or not isinstance(latency, (int, float)) or latency <= 0:
+                return False
+
+        # Check that log_level is a known level name
+        if "log_level" in config:
+            if not isinstance(config["log_level"], str) or config["log_level"].upper() not in self.LOG_LEVELS:
+                return False
+
+        # Check that log rotation settings are positive integers
+        for key in ("log_max_bytes", "log_backup_count"):
+            if key in config:
+                if isinstance(config[key], bool) or not isinstance(config[key], int):
+                    return False
+                if config[key] <= 0:
+                    return False
+
+        # Check that perf_log_enabled is a boolean
+        if "perf_log_enabled" in config and not isinstance(config["perf_log_enabled"], bool):
+            return False
+
+        # Check that transcript_cache_enabled is a boolean
+        if "transcript_cache_enabled" in config and not isinstance(config["transcript_cache_enabled"], bool):
+            return False
+
+        # Check that transcript_cache_max_mb is a positive number
+        if "transcript_cache_max_mb" in config:
+            max_mb = config["transcript_cache_max_mb"]
+            if isinstance(max_mb, bool) or not isinstance(max_mb, (int, float)) or max_mb <= 0:
+                return False
+
+        # Check that audio_retention_enabled is a boolean
+        if "audio_retention_enabled" in config and not isinstance(config["audio_retention_enabled"], bool):
+            return False
+
+        # Check that audio_retention_max_mb is a positive number
+        if "audio_retention_max_mb" in config:
+            max_mb = config["audio_retention_max_mb"]
+            if isinstance(max_mb, bool) or not isinstance(max_mb, (int, float)) or max_mb <= 0:
+                return False
+
+        # Check that audio_retention_codec is a supported codec
+        if "audio_retention_codec" in config and config["audio_retention_codec"] not in ["flac", "opus"]:
+            return False
+
+        # Check that context_prompt_enabled is a boolean
+        if "context_prompt_enabled" in config and not isinstance(config["context_prompt_enabled"], bool):
+            return False
+
+        # Check that prompt_max_tokens is an integer within Whisper's prompt window
+        if "prompt_max_tokens" in config:
+            max_tokens = config["prompt_max_tokens"]
+            if isinstance(max_tokens, bool) or not isinstance(max_tokens, int):
+                return False
+            if max_tokens < 0 or max_tokens > 223:
+                return False
+
+        # Check that prompt_history_max_age_minutes is a non-negative number
+        if "prompt_history_max_age_minutes" in config:
+            max_age = config["prompt_history_max_age_minutes"]
+            if isinstance(max_age, bool) or not isinstance(max_age, (int, float)) or max_age < 0:
+                return False
+
+        # Check that glossary is a list of strings
+        if "glossary" in config:
+            if not isinstance(config["glossary"], list):
+                return False
+            if not all(isinstance(term, str) for term in config["glossary"]):
+                return False
+
+        # Check that progressive_paste_enabled is a boolean
+        if "progressive_paste_enabled" in config and not isinstance(config["progressive_paste_enabled"], bool):
+            return False
+
+        # Check that typing_max_chars is a non-negative integer
+        if "typing_max_chars" in config:
+            max_chars = config["typing_max_chars"]
+            if isinstance(max_chars, bool) or not isinstance(max_chars, int) or max_chars < 0:
+                return False
+
+        # Check that typing_apps is a list of strings
+        if "typing_apps" in config:
+            if not isinstance(config["typing_apps"], list):
+                return False
+            if not all(isinstance(name, str) for name in config["typing_apps"]):
+                return False
+
+        # Check that paste_app_overrides maps application names to valid profiles
+        if "paste_app_overrides" in config:
+            overrides = config["paste_app_overrides"]
+            if not isinstance(overrides, dict):
+                return False
+            for profile in overrides.values():
+                if not isinstance(profile, dict):
+                    return False
+                if "strategy" in profile and profile["strategy"] not in self.PASTE_STRATEGIES:
+                    return False
+                if "delay" in profile:
+                    delay = profile["delay"]
+                    if isinstance(delay, bool) or not isinstance(delay, (int, float)) or not 0 <= delay <= 5:
+                        return False
+
+        # Check that hotkey_profiles is a list of well-formed profiles
+        if "hotkey_profiles" in config:
+            profiles = config["hotkey_profiles"]
+            if not isinstance(profiles, list):
+                return False
+            for profile in profiles:
+                if not isinstance(profile, dict):
+                    return False
+                if not isinstance(profile.get("name"), str) or not isinstance(profile.get("shortcut"), str):
+                    return False
+                for key, value in profile.items():
+                    expected = self.HOTKEY_PROFILE_FIELDS.get(key)
+                    if expected is None:
+                        return False
+                    if isinstance(value, bool) != (expected is bool) or not isinstance(value, expected):
+                        return False
+                if profile.get("provider", "local") not in ["openai", "local"]:
+                    return False
+                if not 1 <= profile.get("beam_size", 1) <= 10:
+                    return False
+                if profile.get("paste_strategy", "shift_insert") not in self.PASTE_STRATEGIES:
+                    return False
+
+            # Drop profiles whose shortcut is invalid or already taken; the main
+            # shortcut wins, then the earlier profile
+            shortcut = config.get("keyboard_shortcut", self.DEFAULT_CONFIG["keyboard_shortcut"])
+            main_keys = shortcut_keys(shortcut)
+            taken = {main_keys} if main_keys else set()
+            kept = []
+            rejected = []
+            for profile in profiles:
+                keys = shortcut_keys(profile["shortcut"])
+                if keys is None or keys in taken:
+                    rejected.append(profile["shortcut"])
+                else:
+                    taken.add(keys)
+                    kept.append(profile)
+            if rejected:
+                self.logger.error(f"Ignoring hotkey profiles with invalid or conflicting shortcuts: {rejected}")
+                self.notifier.notify_error(
+                    "Configuration Error",
+                    f"Ignoring hotkey profiles with invalid or duplicate shortcuts: {', '.join(rejected)}"
+                )
+                config["hotkey_profiles"] = kept
+
+        # Check that warm_models_max_mb is a non-negative integer
+        if "warm_models_max_mb" in config:
+            max_mb = config["warm_models_max_mb"]
+            if isinstance(max_mb, bool) or not isinstance(max_mb, int) or max_mb < 0:
+                return False
+
+        # Check that model_idle_unload_minutes is a non-negative number
+        if "model_idle_unload_minutes" in config:
+            minutes = config["model_idle_unload_minutes"]
+            if isinstance(minutes, bool) or not isinstance(minutes, (int, float)) or minutes < 0:
+                return False
+
         return True
 
+    def _get_mtime(self):
+        """Get the config file modification time.
+
+        Returns:
+            Modification time in nanoseconds, or None if the file is missing
+        """
+        try:
+            return self.config_path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def _write_config(self, settings):
+        """Write settings to the config file and remember its new mtime.
+
+        Args:
+            settings: Complete settings dictionary to write
+        """
+        with open(self.config_path, 'w') as f:
+            json.dump(settings, f, indent=2)
+        self._last_mtime = self._get_mtime()
+
+    def subscribe(self, keys, callback):
+        """Register a callback for changes to specific settings.
+
+        The callback runs on the thread that applied the change (the settings
+        window or the file watcher), so it should hand slow work such as model
+        loading to a background thread.
+
+        Args:
+            keys: Iterable of configuration keys the callback cares about
+            callback: Function taking a dict of key -> ConfigChange
+        """
+        with self._lock:
+            self._subscribers.append((frozenset(keys), callback))
+
+    def _apply(self, new_settings):
+        """Replace the in-memory settings and notify subscribers of differences.
+
+        Args:
+            new_settings: Complete settings dictionary
+
+        Returns:
+            Dict of key -> ConfigChange for every setting that changed
+        """
+        with self._lock:
+            old_settings = self.settings
+            self.settings = new_settings
+            subscribers = list(self._subscribers)
+
+        keys = set(old_settings) | set(new_settings)
+        changes = {
+            key: ConfigChange(key, old_settings.get(key), new_settings.get(key))
+            for key in keys
+            if old_settings.get(key) != new_settings.get(key)
+        }
+
+        for subscribed_keys, callback in subscribers:
+            relevant = {key: change for key, change in changes.items() if key in subscribed_keys}
+            if not relevant:
+                continue
+            try:
+                callback(relevant)
+            except Exception as e:
+                self.logger.error(f"Config change handler failed for {sorted(relevant)}: {e}")
+                print(f"ERROR: Failed to apply config change {sorted(relevant)}: {e}")
+
+        return changes
+
+    def update(self, new_settings):
+        """Save new settings to disk and apply them without a restart.
+
+        Args:
+            new_settings: Complete settings dictionary
+
+        Returns:
+            Dict of key -> ConfigChange for every setting that changed
+
+        Raises:
+            ValueError: If the settings are invalid; nothing is saved or applied
+        """
+        merged_config = self.DEFAULT_CONFIG.copy()
+        merged_config.update(new_settings)
+        if not self._validate_config(merged_config):
+            self.logger.error("Config update rejected, invalid settings")
+            raise ValueError("Invalid settings, nothing was saved")
+        self._write_config(merged_config)
+        return self._apply(merged_config)
+
+    def reload(self):
+        """Re-read the config file and apply any changes.
+
+        An unreadable or invalid file (for example, one being written by an
+        editor) keeps the current settings instead of reverting to defaults.
+
+        Returns:
+            Dict of key -> ConfigChange for every setting that changed
+        """
+        try:
+            with open(self.config_path, 'r') as f:
+                config = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            self.logger.error(f"Config reload skipped, cannot read {self.config_path}: {e}")
+            return {}
+
+        if not self._validate_config(config):
+            self.logger.error("Config reload skipped, invalid config file structure")
+            return {}
+
+        if "openai_api_key" in config and not config.get("api_key"):
+            config["api_key"] = config["openai_api_key"]
+
+        merged_config = self.DEFAULT_CONFIG.copy()
+        merged_config.update(config)
+        changes = self._apply(merged_config)
+        if changes:
+            print(f"Configuration reloaded: {', '.join(sorted(changes))} changed")
+        return changes
+
+    def start_watching(self, interval=1.0):
+        """Watch the config file and reload it when it changes on disk.
+
+        Args:
+            interval: Seconds between modification time checks (default 1.0)
+        """
+        if self._watch_thread and self._watch_thread.is_alive():
+            return
+
+        def watch_worker():
+            while not self._watch_stop.wait(interval):
+                mtime = self._get_mtime()
+                if mtime is not None and mtime != self._last_mtime:
+                    self._last_mtime = mtime
+                    self.reload()
+
+        self._watch_stop.clear()
+        self._watch_thread = threading.Thread(target=watch_worker, daemon=True)
+        self._watch_thread.start()
+
+    def stop_watching(self):
+        """Stop watching the config file."""
+        self._watch_stop.set()
+
     def get(self, key, default=None):
         """Get a configuration value.
 
@@ -235,6 +696,58 @@ class Config:
         """
         return self.settings.get("api_key", "")
 
+    def get_openai_base_url(self):
+        """Get the URL of the OpenAI-compatible transcription server.
+
+        Returns:
+            Base URL without a trailing slash, or empty string for api.openai.com
+        """
+        return self.settings.get("openai_base_url", "").strip().rstrip("/")
+
+    def get_openai_model(self):
+        """Get the model name sent to the transcription endpoint.
+
+        Returns:
+            Model name (default "whisper-1")
+        """
+        return self.settings.get("openai_model", "whisper-1").strip()
+
+    def get_openai_timeout(self):
+        """Get the request timeout of the transcription endpoint.
+
+        Returns:
+            Timeout in seconds (default 30)
+        """
+        return self.settings.get("openai_timeout_seconds", 30)
+
+    def get_openai_auth_header(self):
+        """Get the extra header sent with every request to the endpoint.
+
+        Returns:
+            Dict of header name -> value (empty if not set)
+        """
+        header = self.settings.get("openai_auth_header", "")
+        if ":" not in header:
+            return {}
+        name, value = header.split(":", 1)
+        return {name.strip(): value.strip()}
+
+    def uses_openai_api(self):
+        """Check whether transcription requests go to OpenAI itself.
+
+        Returns:
+            True unless an OpenAI-compatible server is configured
+        """
+        return not self.get_openai_base_url()
+
+    def has_api_key(self):
+        """Check whether an OpenAI API key is configured.
+
+        Returns:
+            True if a non-blank API key is set, False otherwise
+        """
+        return bool(self.get_api_key().strip())
+
     def get_max_duration(self):
         """Get the maximum recording duration in seconds.
 
@@ -279,7 +792,7 @@ class Config:
         """Get the local STT engine to use.
 
         Returns:
-            Local engine string (default "faster-whisper")
+            Local engine string: "faster-whisper" or "whisper.cpp" (default "faster-whisper")
         """
         return self.settings.get("local_engine", "faster-whisper")
 
@@ -299,6 +812,14 @@ class Config:
         """
         return self.settings.get("local_model_id", "")
 
+    def get_local_compute_type(self):
+        """Get the weight type faster-whisper models are loaded with.
+
+        Returns:
+            "auto" or a CTranslate2 CPU compute type such as "int8" (default "auto")
+        """
+        return self.settings.get("local_compute_type", "auto")
+
     def get_local_scan_paths(self):
         """Get the list of paths to scan for local models.
 
@@ -306,3 +827,211 @@ class Config:
             List of path strings (default empty list)
         """
         return self.settings.get("local_scan_paths", [])
+
+    def get_input_device(self):
+        """Get the configured input device.
+
+        Returns:
+            Device name string or integer index ("" for the system default)
+        """
+        return self.settings.get("input_device", "")
+
+    def get_input_device_cache(self):
+        """Get the cached descriptor of the last resolved input device.
+
+        Returns:
+            Descriptor dictionary (empty if the device was never resolved)
+        """
+        return self.settings.get("input_device_cache", {})
+
+    def get_audio_blocksize(self):
+        """Get the number of frames per audio callback.
+
+        Returns:
+            Block size in frames (default 0, letting PortAudio choose)
+        """
+        return self.settings.get("audio_blocksize", 0)
+
+    def get_audio_latency(self):
+        """Get the PortAudio input latency hint.
+
+        Returns:
+            "low", "high" or latency in seconds (default "low")
+        """
+        return self.settings.get("audio_latency", "low")
+
+    def get_log_level(self):
+        """Get the minimum level written to the log file.
+
+        Returns:
+            Level name such as "ERROR" or "DEBUG" (default "ERROR")
+        """
+        return self.settings.get("log_level", "ERROR").upper()
+
+    def get_log_max_bytes(self):
+        """Get the size at which log files are rotated.
+
+        Returns:
+            Size in bytes (default 1048576)
+        """
+        return self.settings.get("log_max_bytes", 1048576)
+
+    def get_log_backup_count(self):
+        """Get the number of rotated log files to keep.
+
+        Returns:
+            Number of backups (default 3)
+        """
+        return self.settings.get("log_backup_count", 3)
+
+    def is_perf_log_enabled(self):
+        """Check if timing spans are written to perf.jsonl.
+
+        Returns:
+            True if enabled, False otherwise
+        """
+        return self.settings.get("perf_log_enabled", False)
+
+    def is_transcript_cache_enabled(self):
+        """Check if transcription results are cached by audio content.
+
+        Returns:
+            True if enabled, False otherwise
+        """
+        return self.settings.get("transcript_cache_enabled", True)
+
+    def get_transcript_cache_max_bytes(self):
+        """Get the disk budget of the transcript cache.
+
+        Returns:
+            Size in bytes (default 64 MB)
+        """
+        return int(self.settings.get("transcript_cache_max_mb", 64) * 1024 * 1024)
+
+    def is_audio_retention_enabled(self):
+        """Check if recordings are kept with history entries.
+
+        Returns:
+            True if enabled, False otherwise
+        """
+        return self.settings.get("audio_retention_enabled", False)
+
+    def get_audio_retention_max_bytes(self):
+        """Get the disk budget of the audio archive.
+
+        Returns:
+            Size in bytes (default 256 MB)
+        """
+        return int(self.settings.get("audio_retention_max_mb", 256) * 1024 * 1024)
+
+    def get_audio_retention_codec(self):
+        """Get the codec used to compress retained recordings.
+
+        Returns:
+            "flac" or "opus" (default "flac")
+        """
+        return self.settings.get("audio_retention_codec", "flac")
+
+    def is_context_prompt_enabled(self):
+        """Check if transcriptions are prompted with the glossary and recent dictations.
+
+        Returns:
+            True if context prompting is enabled (default False)
+        """
+        return self.settings.get("context_prompt_enabled", False)
+
+    def get_prompt_max_tokens(self):
+        """Get the token budget of the context prompt.
+
+        Returns:
+            Maximum prompt length in tokens (default 120)
+        """
+        return self.settings.get("prompt_max_tokens", 120)
+
+    def get_prompt_history_max_age(self):
+        """Get how old a dictation may be to appear in the context prompt.
+
+        Returns:
+            Maximum age in seconds (default 30 minutes)
+        """
+        return self.settings.get("prompt_history_max_age_minutes", 30) * 60
+
+    def get_glossary(self):
+        """Get the words and names the model should spell correctly.
+
+        Returns:
+            List of glossary terms (default empty)
+        """
+        return [term.strip() for term in self.settings.get("glossary", []) if term.strip()]
+
+    def is_progressive_paste_enabled(self):
+        """Check if local transcriptions are pasted segment by segment as they are decoded.
+
+        Returns:
+            True if progressive paste is enabled (default False)
+        """
+        return self.settings.get("progressive_paste_enabled", False)
+
+    def get_typing_max_chars(self):
+        """Get the length up to which texts are typed instead of pasted.
+
+        Returns:
+            Maximum number of characters (default 32, 0 never types)
+        """
+        return self.settings.get("typing_max_chars", 32)
+
+    def get_typing_apps(self):
+        """Get the applications where text is always typed instead of pasted.
+
+        Returns:
+            List of WM_CLASS names (default empty)
+        """
+        return self.settings.get("typing_apps", [])
+
+    def get_paste_app_overrides(self):
+        """Get the user's paste strategy for specific applications.
+
+        Returns:
+            Dict of WM_CLASS class name -> {"strategy": ..., "delay": seconds} (default empty)
+        """
+        return self.settings.get("paste_app_overrides", {})
+
+    def get_hotkey_profiles(self):
+        """Get the extra shortcuts and the transcription profile each one uses.
+
+        Returns:
+            List of profile dictionaries with "name" and "shortcut", and
+            optionally "provider", "model", "language", "beam_size",
+            "vad_filter" and "paste_strategy" (default empty)
+        """
+        return self.settings.get("hotkey_profiles", [])
+
+    def get_warm_models_max_mb(self):
+        """Get the memory budget for keeping local models of hotkey profiles loaded.
+
+        Returns:
+            Budget in megabytes (default 2048)
+        """
+        return self.settings.get("warm_models_max_mb", 2048)
+
+    def get_model_idle_unload_minutes(self):
+        """Get the idle time after which local models are unloaded.
+
+        Returns:
+            Minutes without a dictation, 0 to keep models loaded (default 0)
+        """
+        return self.settings.get("model_idle_unload_minutes", 0)
+
+    def set_input_device_cache(self, descriptor):
+        """Persist a resolved input device descriptor to the config file.
+
+        Args:
+            descriptor: Descriptor dictionary from AudioRecorder
+        """
+        self.settings["input_device_cache"] = descriptor
+        try:
+            self._write_config(self.settings)
+        except Exception as e:
+            error_msg = f"Failed to save input device cache: {e}"
+            self.logger.error(error_msg)
+            print(f"WARNING: {error_msg}")
@@ -0,0 +1,177 @@
+"""Unix-domain socket API for controlling a running VoiceControl daemon.
+
+The protocol is one JSON object per line. A request looks like
+{"command": "status", "args": {}} and the reply is either
+{"ok": true, "result": ...} or {"ok": false, "error": "..."}.
+Only the standard library is imported here so the CLI client stays fast.
+"""
+
+import json
+import os
+import socket
+import socketserver
+import threading
+from pathlib import Path
+
+
+def default_socket_path():
+    """Get the control socket path.
+
+    Uses $VOICE_CTRL_SOCKET if set, otherwise $XDG_RUNTIME_DIR/voice-ctrl.sock,
+    falling back to /tmp/voice-ctrl-<uid>.sock.
+
+    Returns:
+        Path to the control socket
+    """
+    if os.environ.get("VOICE_CTRL_SOCKET"):
+        return Path(os.environ["VOICE_CTRL_SOCKET"])
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / "voice-ctrl.sock"
+    return Path("/tmp") / f"voice-ctrl-{os.getuid()}.sock"
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Answers requests on one client connection."""
+
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            reply = self.server.control.dispatch(line)
+            self.wfile.write(json.dumps(reply).encode("utf-8") + b"\n")
+            self.wfile.flush()
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class ControlServer:
+    """Serves the control API of a running daemon over a Unix socket.
+
+    Each command maps to a handler called with the request's "args" as
+    keyword arguments; its return value must be JSON serializable. Every
+    connection gets its own thread, so a slow command such as
+    transcribe-file does not block status queries.
+    """
+
+    def __init__(self, handlers, socket_path=None):
+        """Initialize the server. Call start() to begin accepting clients.
+
+        Args:
+            handlers: Dict of command name -> callable
+            socket_path: Socket path (defaults to default_socket_path())
+        """
+        self.handlers = handlers
+        self.socket_path = Path(socket_path) if socket_path else default_socket_path()
+        self.server = None
+        self.thread = None
+
+    def start(self):
+        """Bind the socket and serve requests from a background thread.
+
+        Raises:
+            RuntimeError: If another daemon is already listening on the socket
+        """
+        if self.socket_path.exists():
+            if _is_listening(self.socket_path):
+                raise RuntimeError(f"Another instance is already listening on {self.socket_path}")
+            # Left behind by a daemon that did not shut down cleanly
+            self.socket_path.unlink()
+
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        old_umask = os.umask(0o177)  # Socket is only accessible by this user
+        try:
+            self.server = _UnixServer(str(self.socket_path), _RequestHandler)
+        finally:
+            os.umask(old_umask)
+        self.server.control = self
+
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """Stop serving and remove the socket file."""
+        if self.server is None:
+            return
+        self.server.shutdown()
+        self.server.server_close()
+        self.server = None
+        try:
+            self.socket_path.unlink()
+        except OSError:
+            pass
+
+    def dispatch(self, line):
+        """Run the command in one request line.
+
+        Args:
+            line: Raw JSON request (bytes or str)
+
+        Returns:
+            Reply dictionary
+        """
+        try:
+            request = json.loads(line)
+            command = request["command"]
+            args = request.get("args") or {}
+        except (ValueError, KeyError, TypeError) as e:
+            return {"ok": False, "error": f"Malformed request: {e}"}
+
+        handler = self.handlers.get(command)
+        if handler is None:
+            return {"ok": False, "error": f"Unknown command: {command}"}
+
+        try:
+            return {"ok": True, "result": handler(**args)}
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
+
+
+def _is_listening(socket_path):
+    """Check whether a process accepts connections on the socket."""
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(str(socket_path))
+        return True
+    except OSError:
+        return False
+    finally:
+        probe.close()
+
+
+def send_command(command, args=None, socket_path=None, timeout=None):
+    """Send one command to the daemon and wait for the reply.
+
+    Args:
+        command: Command name, e.g. "toggle"
+        args: Optional dict of command arguments
+        socket_path: Socket path (defaults to default_socket_path())
+        timeout: Seconds to wait for the reply (None waits indefinitely)
+
+    Returns:
+        Reply dictionary with "ok" and "result" or "error"
+
+    Raises:
+        ConnectionError: If no daemon is listening
+    """
+    socket_path = Path(socket_path) if socket_path else default_socket_path()
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    client.settimeout(timeout)
+    try:
+        try:
+            client.connect(str(socket_path))
+        except (FileNotFoundError, ConnectionRefusedError) as e:
+            raise ConnectionError(f"VoiceControl is not running (no daemon at {socket_path})") from e
+
+        request = {"command": command, "args": args or {}}
+        client.sendall(json.dumps(request).encode("utf-8") + b"\n")
+
+        with client.makefile("rb") as reader:
+            line = reader.readline()
+        if not line:
+            raise ConnectionError("Daemon closed the connection without replying")
+        return json.loads(line)
+    finally:
+        client.close()
@@ -0,0 +1,96 @@
+"""Command line client for a running VoiceControl daemon.
+
+Usage: voice-ctrl {start,stop,toggle,status,metrics,transcribe-file,transcribe} ...
+
+The client only imports the standard library and talks to the daemon over
+its Unix socket, so editor plugins and window manager bindings can trigger
+dictation in milliseconds while the daemon keeps the model warm. The
+transcribe command is the exception: it runs a batch job in this process.
+"""
+
+import argparse
+import json
+import sys
+from .control_server import send_command
+
+
+# Subcommands handled by this client rather than by the daemon itself
+COMMANDS = ("start", "stop", "toggle", "status", "metrics", "transcribe-file", "transcribe")
+
+
+def parse_args(argv=None):
+    """Parse client command line arguments.
+
+    Args:
+        argv: Argument list (defaults to sys.argv[1:])
+
+    Returns:
+        argparse.Namespace with the parsed options
+    """
+    parser = argparse.ArgumentParser(prog="voice-ctrl", description="Control a running VoiceControl daemon.")
+    parser.add_argument("--socket", help="path of the daemon's control socket")
+    parser.add_argument("--timeout", type=float, default=None, help="seconds to wait for the daemon to reply")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("start", help="start recording")
+    subparsers.add_parser("stop", help="stop recording, transcribe and paste; prints the text")
+    subparsers.add_parser("toggle", help="start or stop recording, like the hotkey")
+    subparsers.add_parser("status", help="print the daemon state as JSON")
+    subparsers.add_parser("metrics", help="print dictation counters and latencies as JSON")
+
+    transcribe_file = subparsers.add_parser("transcribe-file", help="transcribe an audio file and print the text")
+    transcribe_file.add_argument("path", help="audio file to transcribe (kept after transcription)")
+    transcribe_file.add_argument("--paste", action="store_true", help="also paste the text at the cursor")
+
+    transcribe = subparsers.add_parser(
+        "transcribe", help="batch transcribe files and directories with the local model (no daemon needed)"
+    )
+    transcribe.add_argument("paths", nargs="+", help="audio files or directories to transcribe")
+    transcribe.add_argument(
+        "-o", "--output", help="append JSON lines to this file and skip files already in it (default: stdout)"
+    )
+    transcribe.add_argument("-j", "--workers", type=int, help="worker processes (default: sized to cores and memory)")
+
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Run one client command.
+
+    Args:
+        argv: Argument list (defaults to sys.argv[1:])
+
+    Returns:
+        Process exit code
+    """
+    args = parse_args(argv)
+
+    if args.command == "transcribe":
+        from .batch import run_batch
+        return run_batch(args.paths, output=args.output, workers=args.workers)
+
+    command_args = {}
+    if args.command == "transcribe-file":
+        from pathlib import Path
+        command_args = {"path": str(Path(args.path).resolve()), "paste": args.paste}
+
+    try:
+        reply = send_command(args.command, command_args, socket_path=args.socket, timeout=args.timeout)
+    except (ConnectionError, OSError) as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 1
+
+    if not reply.get("ok"):
+        print(f"ERROR: {reply.get('error')}", file=sys.stderr)
+        return 1
+
+    result = reply.get("result")
+    if isinstance(result, str):
+        print(result)
+    elif result is not None:
+        print(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+"""Identification of the application owning the focused X11 window."""
+
+import threading
+from collections import OrderedDict
+
+try:
+    from Xlib import X, display as xdisplay
+    XLIB_AVAILABLE = True
+except ImportError:
+    XLIB_AVAILABLE = False
+
+
+class FocusedWindow:
+    """Looks up the WM_CLASS of the window that has the input focus.
+
+    WM_CLASS never changes for a window, so it is cached per window id and
+    a lookup for a known window costs one round trip to find the focus.
+    """
+
+    # Parent windows to walk up when the focus is on a child without WM_CLASS
+    MAX_DEPTH = 8
+    # Windows whose class is remembered
+    CACHE_SIZE = 64
+
+    def __init__(self, display_name=None):
+        """Connect to the X server.
+
+        Args:
+            display_name: X display to use (defaults to $DISPLAY)
+
+        Raises:
+            RuntimeError: If python-xlib is missing or the display cannot be opened
+        """
+        if not XLIB_AVAILABLE:
+            raise RuntimeError("python-xlib is not installed")
+
+        try:
+            self.display = xdisplay.Display(display_name)
+        except Exception as e:
+            raise RuntimeError(f"Cannot open X display: {e}")
+
+        self.root = self.display.screen().root
+        self._active_atom = self.display.intern_atom("_NET_ACTIVE_WINDOW")
+        self._lock = threading.Lock()
+        self._classes = OrderedDict()  # window id -> WM_CLASS tuple
+
+    def _focused(self):
+        """Get the focused top-level window, preferring the window manager's view."""
+        reply = self.root.get_full_property(self._active_atom, X.AnyPropertyType)
+        if reply is not None and reply.value and reply.value[0]:
+            return self.display.create_resource_object("window", reply.value[0])
+        focus = self.display.get_input_focus().focus
+        if isinstance(focus, int):
+            return None  # PointerRoot or None
+        return focus
+
+    def get_class(self):
+        """Get the WM_CLASS of the focused window.
+
+        Returns:
+            Tuple of (instance, class) strings, or None if unknown
+        """
+        with self._lock:
+            try:
+                window = self._focused()
+                if window is None:
+                    return None
+                if window.id in self._classes:
+                    self._classes.move_to_end(window.id)
+                    return self._classes[window.id]
+
+                wm_class = self._lookup_class(window)
+                if wm_class:
+                    self._classes[window.id] = wm_class
+                    if len(self._classes) > self.CACHE_SIZE:
+                        self._classes.popitem(last=False)
+                return wm_class
+            except Exception as e:
+                print(f"WARNING: Could not read the focused window class: {e}")
+            return None
+
+    def _lookup_class(self, window):
+        """Read WM_CLASS from a window or its nearest ancestor that has it."""
+        for _ in range(self.MAX_DEPTH):
+            if window is None or window == self.root:
+                return None
+            wm_class = window.get_wm_class()
+            if wm_class:
+                return wm_class
+            window = window.query_tree().parent
+        return None
+
+    def close(self):
+        """Close the X connection."""
+        try:
+            self.display.close()
+        except Exception:
+            pass
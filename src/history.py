@@ -1,6 +1,7 @@
 """History management module for VoiceControl application."""
 
 import json
+import threading
 from pathlib import Path
 from datetime import datetime
 import logging
@@ -26,6 +27,9 @@ class HistoryManager:
         # Set up logging
         self.logger = logging.getLogger(__name__)
 
+        # Entries are updated from background threads (audio archiving)
+        self._lock = threading.Lock()
+
         # Load existing history
         self.entries = self._load_history()
 
@@ -102,15 +106,22 @@ class HistoryManager:
             return False
         if not isinstance(entry['duration_seconds'], (int, float)):
             return False
+        # Optional reference into the AudioArchive
+        if 'audio' in entry and not isinstance(entry['audio'], dict):
+            return False
 
         return True
 
-    def add_entry(self, text, duration_seconds):
+    def add_entry(self, text, duration_seconds, audio=None):
         """Add a new transcription to history.
 
         Args:
             text: Transcribed text
             duration_seconds: Duration of the audio in seconds
+            audio: Optional AudioArchive reference to the recording
+
+        Returns:
+            The new entry dictionary (pass it to set_entry_audio later)
         """
         # Create new entry with current timestamp
         entry = {
@@ -118,18 +129,35 @@ class HistoryManager:
             'text': text,
             'duration_seconds': duration_seconds
         }
+        if audio is not None:
+            entry['audio'] = audio
 
-        # Add to beginning of list (most recent first)
-        self.entries.insert(0, entry)
+        with self._lock:
+            # Add to beginning of list (most recent first)
+            self.entries.insert(0, entry)
 
-        # Trim to maximum entries (keep most recent 30)
-        if len(self.entries) > self.MAX_ENTRIES:
-            self.entries = self.entries[:self.MAX_ENTRIES]
+            # Trim to maximum entries (keep most recent 30)
+            if len(self.entries) > self.MAX_ENTRIES:
+                self.entries = self.entries[:self.MAX_ENTRIES]
 
-        # Save to file
-        self._save_history(self.entries)
+            # Save to file
+            self._save_history(self.entries)
 
         self.logger.info(f"Added history entry: {text[:50]}... (duration: {duration_seconds}s)")
+        return entry
+
+    def set_entry_audio(self, entry, audio):
+        """Attach an archived recording to an existing entry.
+
+        Args:
+            entry: Entry dictionary returned by add_entry
+            audio: AudioArchive reference to the recording
+        """
+        with self._lock:
+            entry['audio'] = audio
+            # The entry may already have been trimmed from the history
+            if any(existing is entry for existing in self.entries):
+                self._save_history(self.entries)
 
     def get_entries(self):
         """Get all history entries.
@@ -141,8 +169,9 @@ class HistoryManager:
 
     def clear_history(self):
         """Clear all history entries."""
-        self.entries = []
-        self._save_history(self.entries)
+        with self._lock:
+            self.entries = []
+            self._save_history(self.entries)
         self.logger.info("History cleared")
 
     def get_entry_count(self):
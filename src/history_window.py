@@ -1,33 +1,51 @@
 """History viewer window module for VoiceControl application."""
 
+import queue
 import tkinter as tk
 from tkinter import ttk, messagebox
 import pyperclip
-import threading
+from .ui_thread import get_ui_thread
 
 
 class HistoryWindow:
     """Manages the history viewer GUI window."""
 
-    def __init__(self, history_manager):
+    # Milliseconds between checks for re-transcription results
+    RESULT_POLL_MS = 100
+
+    def __init__(self, history_manager, retranscriber=None, profiles=None):
         """Initialize the history viewer window.
 
         Args:
             history_manager: HistoryManager instance containing transcription history
+            retranscriber: Optional Retranscriber for entries with retained audio
+            profiles: Profiles offered for re-transcription (list of dicts with "name")
         """
         self.history_manager = history_manager
+        self.retranscriber = retranscriber
+        self.profiles = profiles or []
         self.window = None
+        self.profile_var = None
+        self._results = queue.Queue()  # Filled by the re-transcription worker
+        self._result_frames = {}  # id(entry) -> frame listing re-transcriptions
+        self._pending_labels = {}  # (id(entry), profile name) -> label
+        self._poll_id = None
 
     def show(self):
-        """Show the history viewer window."""
+        """Show the history viewer window (returns immediately; safe from any thread)."""
+        get_ui_thread().call(self._show)
+
+    def _show(self):
+        """Create the history window, or raise it if already open (on the UI thread)."""
         if self.window is not None:
             # Window already exists, bring it to front
+            self.window.deiconify()
             self.window.lift()
             self.window.focus_force()
             return
 
         # Create new window
-        self.window = tk.Tk()
+        self.window = tk.Toplevel(get_ui_thread().root)
         self.window.title("Transcription History")
         self.window.geometry("700x500")
         self.window.resizable(True, True)
@@ -116,6 +134,27 @@ class HistoryWindow:
         )
         clear_button.pack(side=tk.LEFT, padx=5)
 
+        # Profile selection for re-transcription
+        if self._retranscribe_available():
+            ttk.Label(button_frame, text="Profile:").pack(side=tk.LEFT, padx=(15, 5))
+            self.profile_var = tk.StringVar(value=self.profiles[0]["name"])
+            profile_combo = ttk.Combobox(
+                button_frame,
+                textvariable=self.profile_var,
+                values=[profile["name"] for profile in self.profiles],
+                state="readonly",
+                width=22
+            )
+            profile_combo.pack(side=tk.LEFT, padx=5)
+
+            retranscribe_all_button = ttk.Button(
+                button_frame,
+                text="Re-transcribe All",
+                command=self._retranscribe_all,
+                width=17
+            )
+            retranscribe_all_button.pack(side=tk.LEFT, padx=5)
+
         # Close button
         close_button = ttk.Button(
             button_frame,
@@ -128,8 +167,9 @@ class HistoryWindow:
         # Handle window close
         self.window.protocol("WM_DELETE_WINDOW", self._close_window)
 
-        # Run the window
-        self.window.mainloop()
+        # Show re-transcription results as they arrive
+        if self._retranscribe_available():
+            self._poll_id = self.window.after(self.RESULT_POLL_MS, self._poll_results)
 
     def _create_entry_widget(self, parent, entry, index):
         """Create a widget for a single history entry.
@@ -182,14 +222,104 @@ class HistoryWindow:
         text_widget.configure(state="disabled")  # Make read-only
         text_widget.grid(row=1, column=0, sticky=(tk.W, tk.E), pady=(8, 8))
 
+        # Action buttons
+        actions_frame = ttk.Frame(entry_frame)
+        actions_frame.grid(row=2, column=0, sticky=tk.E)
+
+        # Re-transcribe button (only for entries whose recording was kept)
+        if self._retranscribe_available() and self.retranscriber.can_retranscribe(entry):
+            retranscribe_button = ttk.Button(
+                actions_frame,
+                text="Re-transcribe",
+                command=lambda: self._retranscribe(entry),
+                width=14
+            )
+            retranscribe_button.pack(side=tk.LEFT, padx=(0, 5))
+
+            # Results of re-transcriptions are listed below the buttons
+            result_frame = ttk.Frame(entry_frame)
+            result_frame.grid(row=3, column=0, sticky=(tk.W, tk.E))
+            result_frame.columnconfigure(0, weight=1)
+            self._result_frames[id(entry)] = result_frame
+
         # Copy button
         copy_button = ttk.Button(
-            entry_frame,
+            actions_frame,
             text="Copy to Clipboard",
             command=lambda: self._copy_to_clipboard(entry['text']),
             width=18
         )
-        copy_button.grid(row=2, column=0, sticky=tk.E)
+        copy_button.pack(side=tk.LEFT)
+
+    def _retranscribe_available(self):
+        """Check whether re-transcription can be offered at all."""
+        return self.retranscriber is not None and bool(self.profiles)
+
+    def _selected_profile(self):
+        """Get the profile chosen in the profile combobox."""
+        name = self.profile_var.get() if self.profile_var else None
+        for profile in self.profiles:
+            if profile["name"] == name:
+                return profile
+        return self.profiles[0]
+
+    def _retranscribe(self, entry):
+        """Queue one entry for re-transcription with the selected profile.
+
+        Args:
+            entry: History entry dictionary
+        """
+        profile = self._selected_profile()
+        key = (id(entry), profile["name"])
+        if key in self._pending_labels:
+            return  # Already queued with this profile
+
+        result_frame = self._result_frames.get(id(entry))
+        if result_frame is None:
+            return
+
+        label = ttk.Label(
+            result_frame,
+            text=f"{profile['name']}: re-transcribing...",
+            foreground="gray",
+            wraplength=600,
+            justify=tk.LEFT
+        )
+        label.grid(row=len(result_frame.grid_slaves()), column=0, sticky=tk.W, pady=(6, 0))
+        self._pending_labels[key] = label
+
+        # Runs on the worker thread; hand the result over to the Tk thread
+        def on_result(entry, profile, text, seconds, error):
+            self._results.put((entry, profile, text, seconds, error))
+
+        self.retranscriber.submit(entry, profile, on_result)
+
+    def _retranscribe_all(self):
+        """Queue every entry with a retained recording."""
+        for entry in self.history_manager.get_entries():
+            if id(entry) in self._result_frames:
+                self._retranscribe(entry)
+
+    def _poll_results(self):
+        """Show finished re-transcriptions (runs on the Tk thread)."""
+        if self.window is None:
+            return
+
+        while True:
+            try:
+                entry, profile, text, seconds, error = self._results.get_nowait()
+            except queue.Empty:
+                break
+
+            label = self._pending_labels.pop((id(entry), profile["name"]), None)
+            if label is None:
+                continue
+            if error:
+                label.configure(text=f"{profile['name']}: failed ({error})", foreground="red")
+            else:
+                label.configure(text=f"{profile['name']} ({seconds:.1f}s): {text}", foreground="black")
+
+        self._poll_id = self.window.after(self.RESULT_POLL_MS, self._poll_results)
 
     def _copy_to_clipboard(self, text):
         """Copy text to clipboard.
@@ -201,12 +331,14 @@ class HistoryWindow:
             pyperclip.copy(text)
             messagebox.showinfo(
                 "Copied",
-                "Text copied to clipboard!"
+                "Text copied to clipboard!",
+                parent=self.window
             )
         except Exception as e:
             messagebox.showerror(
                 "Copy Failed",
-                f"Failed to copy to clipboard:\n{str(e)}"
+                f"Failed to copy to clipboard:\n{str(e)}",
+                parent=self.window
             )
 
     def _clear_history(self):
@@ -216,22 +348,29 @@ class HistoryWindow:
             "Clear History",
             "Are you sure you want to clear all transcription history?\n\n"
             "This action cannot be undone.",
-            icon=messagebox.WARNING
+            icon=messagebox.WARNING,
+            parent=self.window
         )
 
         if result:
             self.history_manager.clear_history()
             messagebox.showinfo(
                 "History Cleared",
-                "All transcription history has been cleared."
+                "All transcription history has been cleared.",
+                parent=self.window
             )
             # Close and reopen window to show empty state
             self._close_window()
-            # Reopen in a thread to avoid blocking
-            threading.Thread(target=self.show, daemon=True).start()
+            self._show()
 
     def _close_window(self):
         """Close the history viewer window."""
         if self.window:
+            # The interpreter outlives the window, so stop its timer too
+            if self._poll_id is not None:
+                self.window.after_cancel(self._poll_id)
+                self._poll_id = None
             self.window.destroy()
             self.window = None
+            self._result_frames = {}
+            self._pending_labels = {}
@@ -0,0 +1,313 @@
+"""Global hotkey registered as a passive X11 key grab."""
+
+import os
+import select
+import threading
+
+try:
+    from Xlib import X, XK, display as xdisplay, error as xerror
+    XLIB_AVAILABLE = True
+except ImportError:
+    XLIB_AVAILABLE = False
+
+from .key_typer import char_to_keysym
+
+
+# Shortcut modifiers (pynput format) and the keysyms that identify their modifier bit
+MODIFIER_KEYSYMS = {
+    "<ctrl>": ("Control_L", "Control_R"),
+    "<shift>": ("Shift_L", "Shift_R"),
+    "<alt>": ("Alt_L", "Alt_R", "Meta_L"),
+    "<cmd>": ("Super_L", "Super_R"),
+}
+
+# Named keys (pynput format) and their X keysym names
+KEY_NAMES = {
+    "<space>": "space",
+    "<enter>": "Return",
+    "<tab>": "Tab",
+    "<backspace>": "BackSpace",
+    "<delete>": "Delete",
+    "<esc>": "Escape",
+    "<up>": "Up",
+    "<down>": "Down",
+    "<left>": "Left",
+    "<right>": "Right",
+    "<home>": "Home",
+    "<end>": "End",
+    "<page_up>": "Prior",
+    "<page_down>": "Next",
+    "<insert>": "Insert",
+}
+for _i in range(1, 13):
+    KEY_NAMES[f"<f{_i}>"] = f"F{_i}"
+
+
+def shortcut_to_grab(parsed):
+    """Split a parsed shortcut into its modifiers and its key.
+
+    Args:
+        parsed: Shortcut in pynput format, e.g. "<ctrl>+<shift>+<space>"
+
+    Returns:
+        Tuple of (set of modifier names, keysym)
+
+    Raises:
+        ValueError: If the shortcut does not have exactly one non-modifier key
+    """
+    modifiers = set()
+    keysyms = []
+    for part in parsed.split("+"):
+        if part in MODIFIER_KEYSYMS:
+            modifiers.add(part)
+        elif part in KEY_NAMES:
+            keysyms.append(XK.string_to_keysym(KEY_NAMES[part]))
+        elif len(part) == 1:
+            keysyms.append(char_to_keysym(part))
+        else:
+            raise ValueError(f"Unknown key '{part}'")
+
+    if len(keysyms) != 1 or keysyms[0] is None:
+        raise ValueError(f"'{parsed}' needs exactly one key besides the modifiers")
+    return modifiers, keysyms[0]
+
+
+class HotkeyGrabber:
+    """Calls a function when a shortcut is pressed, using XGrabKey.
+
+    The X server only sends this client the grabbed key combinations, so no
+    Python code runs for any other keystroke. Caps Lock, Num Lock and
+    Scroll Lock change the modifier state, so each combination is grabbed
+    once for every state of these locks.
+
+    The grabs are set up in start(), which raises if another application
+    already holds one of the combinations; events are then handled on a
+    thread that sleeps in select() until the X server or stop() wakes it.
+
+    Same interface as pynput's GlobalHotKeys: a dict of shortcut to
+    callback, start() and stop().
+    """
+
+    # Bits of an event's state that are keyboard modifiers
+    MODIFIER_BITS = 0xff
+
+    def __init__(self, hotkeys, display_name=None):
+        """Connect to the X server.
+
+        Args:
+            hotkeys: Dict of shortcut in pynput format (e.g. "<ctrl>+<shift>+<space>")
+                -> function called (on the listener thread) when it is pressed
+            display_name: X display to use (defaults to $DISPLAY)
+
+        Raises:
+            ValueError: If a shortcut cannot be grabbed as one key plus modifiers
+            RuntimeError: If python-xlib is missing or the display cannot be opened
+        """
+        if not XLIB_AVAILABLE:
+            raise RuntimeError("python-xlib is not installed")
+        self._bindings = []  # (parsed, modifiers, keysym, callback)
+        for parsed, on_activate in hotkeys.items():
+            modifiers, keysym = shortcut_to_grab(parsed)
+            self._bindings.append((parsed, modifiers, keysym, on_activate))
+
+        try:
+            self.display = xdisplay.Display(display_name)
+        except Exception as e:
+            raise RuntimeError(f"Cannot open X display: {e}")
+
+        self.root = self.display.screen().root
+        self._grabs = []  # (keycode, modifier mask) currently grabbed
+        self._active = {}  # keycode -> list of (modifier mask, ignored lock mask, callback)
+        self._held = set()  # Grabbed keycodes currently pressed
+        self._thread = None
+        self._stopped = False
+        self._wake_read, self._wake_write = os.pipe()
+
+    def _modifier_masks(self):
+        """Find the modifier bit of every key name from the server's modifier map.
+
+        Returns:
+            Dict of keysym name -> modifier mask (0 if not a modifier)
+        """
+        masks = {}
+        mapping = self.display.get_modifier_mapping()
+        for index, keycodes in enumerate(mapping):
+            for keycode in keycodes:
+                if not keycode:
+                    continue
+                for level in range(4):
+                    name = XK.keysym_to_string(self.display.keycode_to_keysym(keycode, level))
+                    if name and name not in masks:
+                        masks[name] = 1 << index
+        return masks
+
+    def _grab_combinations(self, modifiers, keysym, masks):
+        """Compute the keycode and modifier masks to grab for one shortcut.
+
+        Args:
+            modifiers: Set of modifier names from shortcut_to_grab
+            keysym: Keysym of the shortcut's key
+            masks: Modifier masks from _modifier_masks
+
+        Returns:
+            Tuple of (keycode, modifier mask, ignored lock mask, list of masks to grab)
+
+        Raises:
+            RuntimeError: If the key is not on the keyboard layout
+        """
+        keycode = self.display.keysym_to_keycode(keysym)
+        if not keycode:
+            raise RuntimeError("The shortcut's key is not on the keyboard layout")
+
+        default_masks = {
+            "<ctrl>": X.ControlMask,
+            "<shift>": X.ShiftMask,
+            "<alt>": X.Mod1Mask,
+            "<cmd>": X.Mod4Mask,
+        }
+        base = 0
+        for modifier in modifiers:
+            mask = next(
+                (masks[name] for name in MODIFIER_KEYSYMS[modifier] if masks.get(name)),
+                default_masks[modifier]
+            )
+            base |= mask
+
+        # Lock modifiers that must not stop the shortcut from working
+        locks = [X.LockMask]
+        for name in ("Num_Lock", "Scroll_Lock"):
+            mask = masks.get(name)
+            if mask and mask not in locks and not mask & base:
+                locks.append(mask)
+
+        combinations = []
+        for bits in range(1 << len(locks)):
+            mask = base
+            for index, lock in enumerate(locks):
+                if bits & (1 << index):
+                    mask |= lock
+            combinations.append(mask)
+        return keycode, base, sum(locks), combinations
+
+    def _grab(self):
+        """Grab every shortcut in every lock state.
+
+        Raises:
+            RuntimeError: If a key is missing from the layout or another
+                application already grabbed a shortcut (nothing stays grabbed then)
+        """
+        masks = self._modifier_masks()
+        for parsed, modifiers, keysym, on_activate in self._bindings:
+            try:
+                keycode, base, ignored, combinations = self._grab_combinations(modifiers, keysym, masks)
+            except RuntimeError as e:
+                self._ungrab()
+                raise RuntimeError(f"{parsed}: {e}")
+
+            catcher = xerror.CatchError(xerror.BadAccess)
+            for mask in combinations:
+                self.root.grab_key(keycode, mask, False, X.GrabModeAsync, X.GrabModeAsync, onerror=catcher)
+                self._grabs.append((keycode, mask))
+            self.display.sync()
+            if catcher.get_error():
+                self._ungrab()
+                raise RuntimeError(f"{parsed} is already in use by another application")
+            self._active.setdefault(keycode, []).append((base, ignored, on_activate))
+
+    def _ungrab(self):
+        """Release every grab."""
+        for keycode, mask in self._grabs:
+            self.root.ungrab_key(keycode, mask)
+        self._grabs = []
+        self._active = {}
+        self.display.sync()
+
+    def start(self):
+        """Grab the shortcuts and start listening.
+
+        Raises:
+            RuntimeError: If the shortcuts cannot be grabbed
+        """
+        try:
+            self._grab()
+        except Exception:
+            self.stop()
+            raise
+        self._thread = threading.Thread(target=self._run, name="hotkey", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        """Thread body: wait for X events and handle them."""
+        try:
+            fd = self.display.fileno()
+            while True:
+                while self.display.pending_events():
+                    self._handle(self.display.next_event())
+                readable, _, _ = select.select([fd, self._wake_read], [], [])
+                if self._wake_read in readable:
+                    break
+        except Exception as e:
+            print(f"WARNING: Hotkey listener stopped: {e}")
+        finally:
+            try:
+                self._ungrab()
+                self.display.close()
+            except Exception:
+                pass
+            os.close(self._wake_read)
+
+    def _handle(self, event):
+        """React to one X event."""
+        if event.type == X.MappingNotify:
+            # The layout or modifier map changed; the keycodes or masks may have too
+            if event.request in (X.MappingKeyboard, X.MappingModifier):
+                self.display.refresh_keyboard_mapping(event)
+                self._ungrab()
+                try:
+                    self._grab()
+                except RuntimeError as e:
+                    print(f"WARNING: Could not grab the shortcuts again: {e}")
+
+        elif event.type == X.KeyPress:
+            # While a grab is active, every key is reported to this client
+            if event.detail not in self._active or event.detail in self._held:
+                return  # Another key, or key repeat
+            for base, ignored, on_activate in self._active[event.detail]:
+                if event.state & self.MODIFIER_BITS & ~ignored == base:
+                    self._held.add(event.detail)
+                    try:
+                        on_activate()
+                    except Exception as e:
+                        print(f"ERROR: Hotkey callback failed: {e}")
+                    return
+
+        elif event.type == X.KeyRelease and event.detail in self._held:
+            # Auto-repeat sends a release immediately followed by a press with
+            # the same timestamp; the key is still held in that case
+            if self.display.pending_events():
+                following = self.display.next_event()
+                if (
+                    following.type == X.KeyPress
+                    and following.detail == event.detail
+                    and following.time == event.time
+                ):
+                    return
+                self._held.discard(event.detail)
+                self._handle(following)
+                return
+            self._held.discard(event.detail)
+
+    def stop(self):
+        """Release the grabs and stop the listener thread."""
+        if self._stopped:
+            return
+        self._stopped = True
+        if self._thread is None:
+            self.display.close()
+            os.close(self._wake_read)
+            os.close(self._wake_write)
+            return
+        os.write(self._wake_write, b"\0")
+        os.close(self._wake_write)
+        if self._thread is not threading.current_thread():
+            self._thread.join(timeout=2)
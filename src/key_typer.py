@@ -0,0 +1,223 @@
+"""Direct text entry with XTest fake key events."""
+
+import threading
+from collections import OrderedDict
+
+try:
+    from Xlib import X, XK, display as xdisplay
+    from Xlib.ext import xtest
+    XLIB_AVAILABLE = True
+except ImportError:
+    XLIB_AVAILABLE = False
+
+
+# Keysyms of characters that are not printable
+RETURN_KEYSYM = 0xff0d
+TAB_KEYSYM = 0xff09
+
+
+def char_to_keysym(char):
+    """Get the X keysym that produces a character.
+
+    Latin-1 characters have keysyms equal to their code point; everything
+    else uses the Unicode keysym range.
+
+    Args:
+        char: Single character
+
+    Returns:
+        Keysym number, or None for control characters that cannot be typed
+    """
+    if char == "\n":
+        return RETURN_KEYSYM
+    if char == "\t":
+        return TAB_KEYSYM
+    code = ord(char)
+    if 0x20 <= code <= 0x7e or 0xa0 <= code <= 0xff:
+        return code
+    if code < 0xa0:
+        return None
+    return 0x01000000 | code
+
+
+class KeyTyper:
+    """Types text into the focused window with XTest.
+
+    Typing skips the clipboard entirely: no selection is taken over, there is
+    nothing to restore, and the target application does not have to fetch
+    anything, which makes it the fastest way to insert short texts.
+
+    Characters on the current keyboard layout are typed with their own key
+    (with Shift when needed). Other characters, such as accented letters
+    missing from the layout, are temporarily assigned to unused keycodes.
+    All events for one text are sent in a single batch.
+    """
+
+    # Modifiers that would turn typed characters into shortcuts
+    SHORTCUT_MODIFIERS = X.ControlMask | X.Mod1Mask | X.Mod4Mask if XLIB_AVAILABLE else 0
+
+    def __init__(self, display_name=None):
+        """Connect to the X server.
+
+        Args:
+            display_name: X display to use (defaults to $DISPLAY)
+
+        Raises:
+            RuntimeError: If python-xlib is missing, the display cannot be
+                opened or the server lacks the XTEST extension
+        """
+        if not XLIB_AVAILABLE:
+            raise RuntimeError("python-xlib is not installed")
+
+        try:
+            self.display = xdisplay.Display(display_name)
+        except Exception as e:
+            raise RuntimeError(f"Cannot open X display: {e}")
+
+        if not self.display.has_extension("XTEST"):
+            self.display.close()
+            raise RuntimeError("X server does not support XTEST")
+
+        self.root = self.display.screen().root
+        self._lock = threading.Lock()
+        self._remap_codes = set()  # Spare keycodes this typer has assigned
+        self._remapped = OrderedDict()  # keysym -> spare keycode, least recently used first
+        self._load_keymap()
+
+    def _load_keymap(self):
+        """Read the keyboard mapping and find unused keycodes."""
+        info = self.display.display.info
+        first = info.min_keycode
+        mapping = self.display.get_keyboard_mapping(first, info.max_keycode - first + 1)
+
+        self._keys = {}  # keysym -> (keycode, shifted)
+        self._spare = []
+        self._keysyms_per_keycode = len(mapping[0]) if mapping else 2
+        for offset, keysyms in enumerate(mapping):
+            keycode = first + offset
+            if keycode in self._remap_codes or not any(keysyms):
+                self._spare.append(keycode)
+                continue
+            for level in (0, 1):
+                if level < len(keysyms) and keysyms[level] and keysyms[level] not in self._keys:
+                    self._keys[keysyms[level]] = (keycode, level == 1)
+
+        self._shift = self.display.keysym_to_keycode(XK.XK_Shift_L)
+
+    def _process_events(self):
+        """Reload the keymap if the layout changed since the last call."""
+        changed = False
+        while self.display.pending_events():
+            if self.display.next_event().type == X.MappingNotify:
+                changed = True
+        if changed:
+            self._load_keymap()
+
+    def _remap(self, keysym, in_use):
+        """Assign a keysym to a spare keycode.
+
+        Args:
+            keysym: Keysym to make typeable
+            in_use: Spare keycodes needed by the text being typed
+
+        Returns:
+            (keycode, shifted), or None if no spare keycode is free
+        """
+        if keysym in self._remapped:
+            self._remapped.move_to_end(keysym)
+            return self._remapped[keysym], False
+
+        assigned = set(self._remapped.values())
+        free = [keycode for keycode in self._spare if keycode not in assigned]
+        if free:
+            keycode = free[0]
+        else:
+            # Reuse the least recently used assignment not needed by this text
+            victim = next((sym for sym, code in self._remapped.items() if code not in in_use), None)
+            if victim is None:
+                return None
+            keycode = self._remapped.pop(victim)
+
+        # Same keysym on both levels, so Shift and Caps Lock do not matter
+        keysyms = [keysym, keysym] + [X.NoSymbol] * max(0, self._keysyms_per_keycode - 2)
+        self.display.change_keyboard_mapping(keycode, [keysyms])
+        self._remap_codes.add(keycode)
+        self._remapped[keysym] = keycode
+        return keycode, False
+
+    def type_text(self, text):
+        """Type text into the focused window.
+
+        Args:
+            text: Text to type
+
+        Returns:
+            True if the text was typed, False if it could not be (nothing is
+            typed then, so the caller can paste instead)
+        """
+        with self._lock:
+            try:
+                self._process_events()
+
+                # Held Ctrl/Alt/Super would turn every character into a shortcut
+                state = self.root.query_pointer().mask
+                if state & self.SHORTCUT_MODIFIERS:
+                    print("WARNING: Modifier keys held, not typing")
+                    return False
+                caps_lock = bool(state & X.LockMask)
+
+                keys = []
+                in_use = set()
+                for char in text:
+                    keysym = char_to_keysym(char)
+                    if keysym is None:
+                        continue
+                    key = self._keys.get(keysym)
+                    if key is None:
+                        key = self._remap(keysym, in_use)
+                        if key is None:
+                            print("WARNING: Too many characters missing from the keyboard layout")
+                            return False
+                        in_use.add(key[0])
+                    elif caps_lock and char.lower() != char.upper():
+                        key = (key[0], not key[1])
+                    keys.append(key)
+
+                if in_use:
+                    # The mapping must be in place before the key events arrive
+                    self.display.sync()
+                self._send(keys)
+                return True
+
+            except Exception as e:
+                print(f"WARNING: Typing with XTest failed: {e}")
+                return False
+
+    def _send(self, keys):
+        """Send the key events for one text as a single batch.
+
+        Args:
+            keys: List of (keycode, shifted)
+        """
+        shift_down = False
+        for keycode, shifted in keys:
+            if shifted != shift_down:
+                xtest.fake_input(self.display, X.KeyPress if shifted else X.KeyRelease, self._shift)
+                shift_down = shifted
+            xtest.fake_input(self.display, X.KeyPress, keycode)
+            xtest.fake_input(self.display, X.KeyRelease, keycode)
+        if shift_down:
+            xtest.fake_input(self.display, X.KeyRelease, self._shift)
+        self.display.sync()
+
+    def close(self):
+        """Give back the spare keycodes and close the X connection."""
+        with self._lock:
+            try:
+                blank = [X.NoSymbol] * self._keysyms_per_keycode
+                for keycode in self._remap_codes:
+                    self.display.change_keyboard_mapping(keycode, [blank])
+                self.display.sync()
+                self.display.close()
+            except Exception:
+                pass
@@ -0,0 +1,279 @@
+"""Local speech-to-text engines selected by the local_engine setting.
+
+Every engine loads a model object with the transcribe() interface of
+faster-whisper's WhisperModel: transcribe(audio, **options) returns an
+iterator of segments with a .text attribute plus an info object with
+.language and .duration, and segments are decoded as they are iterated.
+LocalTranscriber and the batch workers only use that interface.
+"""
+
+import os
+import shutil
+import subprocess
+import tempfile
+import wave
+from collections import namedtuple
+from pathlib import Path
+
+
+Segment = namedtuple("Segment", ["text"])
+TranscriptionInfo = namedtuple("TranscriptionInfo", ["language", "duration"])
+
+# Directories searched for ggml models given by name, such as "base.en"
+GGML_MODEL_DIRS = [
+    Path.home() / ".cache" / "whisper.cpp",
+    Path.home() / ".cache" / "whisper",
+    Path.home() / ".local" / "share" / "whisper.cpp",
+    Path.home() / "whisper.cpp" / "models",
+]
+
+# First bytes of whisper.cpp model files: ggml, ggjt and ggmf (little-endian) and GGUF
+GGML_MAGICS = (b"lmgg", b"tjgg", b"fmgg", b"GGUF")
+
+# whisper.cpp command line programs, newest name first
+WHISPER_CPP_PROGRAMS = ("whisper-cli", "whisper-cpp", "whisper.cpp")
+
+
+def wav_duration(path):
+    """Get the duration of a WAV file whisper.cpp can read as is.
+
+    Args:
+        path: Audio file path
+
+    Returns:
+        Duration in seconds, or None if the file is not a 16 kHz mono 16-bit WAV
+    """
+    if Path(path).suffix.lower() != ".wav":
+        return None
+    try:
+        with wave.open(str(path), "rb") as f:
+            if (f.getframerate(), f.getnchannels(), f.getsampwidth()) != (16000, 1, 2):
+                return None
+            return f.getnframes() / f.getframerate()
+    except (wave.Error, EOFError):
+        return None
+
+
+def decode_audio(path, sample_rate=16000):
+    """Decode any audio file to mono float32 samples with PyAV.
+
+    Args:
+        path: Audio file path (mp3, m4a, ogg, flac, ...)
+        sample_rate: Sample rate of the result in Hz
+
+    Returns:
+        1-D float32 numpy array in [-1, 1]
+    """
+    import av
+    import numpy as np
+
+    resampler = av.AudioResampler(format="s16", layout="mono", rate=sample_rate)
+    chunks = []
+    with av.open(str(path)) as container:
+        for frame in container.decode(audio=0):
+            for resampled in resampler.resample(frame):
+                chunks.append(resampled.to_ndarray().reshape(-1))
+    for resampled in resampler.resample(None):
+        chunks.append(resampled.to_ndarray().reshape(-1))
+
+    if not chunks:
+        return np.zeros(0, dtype=np.float32)
+    return np.concatenate(chunks).astype(np.float32) / 32768.0
+
+
+def is_ggml_model(path):
+    """Check whether a file is a whisper.cpp (ggml or GGUF) model.
+
+    Args:
+        path: Path object to a file
+
+    Returns:
+        True if the file has a .bin or .gguf extension and a ggml magic number
+    """
+    if path.suffix.lower() not in (".bin", ".gguf"):
+        return False
+    try:
+        with open(path, "rb") as f:
+            return f.read(4) in GGML_MAGICS
+    except OSError:
+        return False
+
+
+def find_ggml_model(source):
+    """Resolve a model path or name to a whisper.cpp model file.
+
+    Args:
+        source: Path to a model file, or a name like "base.en" or
+            "base.en-q5_1" looked up as ggml-<name>.bin in GGML_MODEL_DIRS
+
+    Returns:
+        Path to the model file, or None if not found
+    """
+    path = Path(source).expanduser()
+    if path.is_file():
+        return path
+    for directory in GGML_MODEL_DIRS:
+        for name in (source, f"ggml-{source}.bin", f"ggml-{source}.gguf"):
+            candidate = directory / name
+            if candidate.is_file() and is_ggml_model(candidate):
+                return candidate
+    return None
+
+
+class WhisperCppModel:
+    """whisper.cpp model with the transcribe() interface of WhisperModel.
+
+    With the pywhispercpp bindings installed the model stays in memory like
+    a faster-whisper model. Otherwise every transcription runs the
+    whisper-cli program, which maps the quantized model file and exits, so
+    nothing stays resident between dictations; the page cache keeps the
+    next load fast.
+    """
+
+    # Prompts are passed as text; whisper.cpp tokenizes them itself
+    hf_tokenizer = None
+
+    def __init__(self, model_path, cpu_threads=0):
+        """Load the model.
+
+        Args:
+            model_path: Path to a ggml or GGUF model file
+            cpu_threads: Threads used for decoding (0 lets whisper.cpp decide)
+
+        Raises:
+            ImportError: If neither pywhispercpp nor a whisper.cpp program is installed
+        """
+        self.model_path = Path(model_path)
+        self.cpu_threads = cpu_threads
+        self._model = None
+        self._program = None
+
+        try:
+            from pywhispercpp.model import Model
+        except ImportError:
+            self._program = next(filter(None, map(shutil.which, WHISPER_CPP_PROGRAMS)), None)
+            if self._program is None:
+                raise ImportError("whisper.cpp not installed (pip install pywhispercpp, or put whisper-cli on PATH)")
+            return
+
+        params = {"print_progress": False, "print_realtime": False}
+        if cpu_threads:
+            params["n_threads"] = cpu_threads
+        self._model = Model(str(self.model_path), **params)
+
+    def transcribe(self, audio, language=None, initial_prompt=None, beam_size=None, **unsupported):
+        """Transcribe audio.
+
+        Args:
+            audio: Audio file path, or 16 kHz mono float32 samples; files
+                other than 16 kHz mono WAV are decoded first
+            language: Language code, or None to detect it
+            initial_prompt: Prompt text
+            beam_size: Beam size (the command line program only; the bindings decode greedily)
+            **unsupported: faster-whisper options without a whisper.cpp equivalent, such as vad_filter
+
+        Returns:
+            Tuple of (iterator of Segment, TranscriptionInfo)
+        """
+        duration = None
+        if isinstance(audio, (str, os.PathLike)):
+            duration = wav_duration(audio)
+            if duration is None:
+                # whisper.cpp only reads 16 kHz WAV reliably; hand it samples instead
+                audio = decode_audio(audio)
+        if duration is None:
+            duration = len(audio) / 16000
+        info = TranscriptionInfo(language or "auto", duration)
+
+        if self._model is not None:
+            params = {}
+            if language:
+                params["language"] = language
+            if initial_prompt:
+                params["initial_prompt"] = initial_prompt
+            segments = self._model.transcribe(str(audio) if isinstance(audio, os.PathLike) else audio, **params)
+            return (Segment(segment.text) for segment in segments), info
+
+        return self._run_program(audio, language, initial_prompt, beam_size), info
+
+    def _run_program(self, audio, language, initial_prompt, beam_size):
+        """Run whisper-cli and yield each segment as it is printed."""
+        temp_path = None
+        if not isinstance(audio, (str, os.PathLike)):
+            # The program reads files only
+            import numpy as np
+            fd, temp_path = tempfile.mkstemp(suffix=".wav")
+            os.close(fd)
+            with wave.open(temp_path, "wb") as f:
+                f.setnchannels(1)
+                f.setsampwidth(2)
+                f.setframerate(16000)
+                f.writeframes((np.clip(audio, -1.0, 1.0) * 32767).astype(np.int16).tobytes())
+            audio = temp_path
+
+        command = [self._program, "-m", str(self.model_path), "-f", str(audio), "-nt", "-np"]
+        command += ["-l", language or "auto"]
+        if self.cpu_threads:
+            command += ["-t", str(self.cpu_threads)]
+        if beam_size:
+            command += ["-bs", str(beam_size)]
+        if initial_prompt:
+            command += ["--prompt", initial_prompt]
+
+        try:
+            process = subprocess.Popen(
+                command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, encoding="utf-8"
+            )
+            for line in process.stdout:
+                text = line.rstrip("\n")
+                if text.strip():
+                    yield Segment(text)
+            stderr = process.stderr.read()
+            if process.wait() != 0:
+                raise RuntimeError(f"whisper.cpp failed: {stderr.strip()[-200:]}")
+        finally:
+            if temp_path:
+                os.unlink(temp_path)
+
+
+def load_faster_whisper(source, cpu_threads=0, compute_type="int8"):
+    """Load a faster-whisper (CTranslate2) model on the CPU."""
+    from faster_whisper import WhisperModel
+    return WhisperModel(source, device="cpu", compute_type=compute_type, cpu_threads=cpu_threads)
+
+
+def load_whisper_cpp(source, cpu_threads=0, compute_type=None):
+    """Load a whisper.cpp model; the weight type is fixed by the quantized file."""
+    model_path = find_ggml_model(source)
+    if model_path is None:
+        raise FileNotFoundError(f"No whisper.cpp model file for '{source}'")
+    return WhisperCppModel(model_path, cpu_threads=cpu_threads)
+
+
+# Loaders by local_engine setting
+ENGINES = {
+    "faster-whisper": load_faster_whisper,
+    "whisper.cpp": load_whisper_cpp,
+}
+
+
+def load_model(engine, source, cpu_threads=0, compute_type="int8"):
+    """Load a model with the given engine.
+
+    Args:
+        engine: Engine name, a key of ENGINES
+        source: Model path or ID
+        cpu_threads: Threads used for decoding (0 lets the engine decide)
+        compute_type: Weight type for engines that convert at load time
+
+    Returns:
+        Model object with the transcribe() interface of WhisperModel
+
+    Raises:
+        ImportError: If the engine's library or program is not installed
+        ValueError: If the engine is unknown
+    """
+    loader = ENGINES.get(engine)
+    if loader is None:
+        raise ValueError(f"Unknown local engine '{engine}'")
+    return loader(source, cpu_threads=cpu_threads, compute_type=compute_type)
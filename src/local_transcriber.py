@@ -1,112 +1,378 @@
-"""Local audio transcription module using faster-whisper."""
+"""Local audio transcription module using faster-whisper or whisper.cpp."""
 
 import logging
+import threading
+import time
+from collections import deque, namedtuple
 from pathlib import Path
 from .notifier import Notifier
 from .config import Config
+from .transcript_cache import audio_digest, make_key, get_transcript_cache
+from .prompt_builder import EMPTY_PROMPT
+from .local_engines import load_model, load_faster_whisper
+from .compute_types import get_compute_type_selector
+from .transcriber_pool import estimate_model_mb
+
+
+# Settings a model was loaded with; transcripts are cached under them
+ModelSettings = namedtuple("ModelSettings", ["engine", "model_path", "model_id", "compute_type"])
 
 
 class LocalTranscriber:
-    """Transcribes audio files using faster-whisper locally."""
+    """Transcribes audio files locally with the engine chosen by local_engine."""
+
+    # Local transcriptions in progress in this process; the compute type
+    # benchmark waits until there are none
+    _active = 0
+    _active_changed = threading.Condition()
+
+    # Config keys that select the model
+    CONFIG_KEYS = ("local_engine", "local_model_path", "local_model_id", "local_compute_type")
+
+    # Decoding options passed to WhisperModel.transcribe
+    TRANSCRIBE_OPTIONS = {
+        "language": "en",  # Default to English
+        "beam_size": 5,  # Default beam size
+        "vad_filter": True,  # Enable voice activity detection
+    }
 
-    def __init__(self, config=None):
+    def __init__(self, config=None, cpu_threads=0, model=None, options=None, benchmark=True):
         """Initialize the local transcriber.
 
         Args:
             config: Config object (if None, will create a new one)
+            cpu_threads: Threads used by the model (0 lets CTranslate2 decide)
+            model: Model path or ID to use instead of the configured one; the
+                transcriber then ignores model setting changes
+            options: Decoding options overriding TRANSCRIBE_OPTIONS, such as
+                {"language": "de", "beam_size": 1}
+            benchmark: If False, never benchmark compute types; "auto" then uses
+                the saved result or the CPU-based guess (for batch workers, which
+                would benchmark concurrently and outgrow their memory budget)
         """
         # Use provided config or create new one
         self.config = config if config else Config()
 
-        # Set default paths
-        config_dir = Path.home() / ".config" / "voice-ctrl"
-        self.log_path = config_dir / "voice-ctrl.log"
-
-        # Ensure config directory exists
-        config_dir.mkdir(parents=True, exist_ok=True)
-
-        # Set up logging
-        self._setup_logging()
+        # Log through the process-wide logging set up by Config
+        self.log_path = self.config.log_path
+        self.logger = logging.getLogger(__name__)
 
         # Initialize notifier
         self.notifier = Notifier(log_path=self.log_path)
 
-        # Load local STT configuration
-        self.engine = self.config.get_local_engine()
-        self.model_path = self.config.get_local_model_path()
-        self.model_id = self.config.get_local_model_id()
+        # Load local STT configuration; while a model is loaded these describe
+        # it, and they only change together with the model
+        self.cpu_threads = cpu_threads
+        self.options = dict(self.TRANSCRIBE_OPTIONS, **(options or {}))
+        self.benchmark = benchmark
+        self._fixed_model = model
+        self._apply(self._configured_settings())
 
         # Initialize model (lazy loading)
-        self.model = None
-
-    def _setup_logging(self):
-        """Configure logging to file."""
-        logging.basicConfig(
-            filename=str(self.log_path),
-            level=logging.ERROR,
-            format='[%(asctime)s] %(levelname)s: %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S',
-            force=True
-        )
-        self.logger = logging.getLogger(__name__)
+        self._loaded = (None, None)  # (model, ModelSettings it was loaded with)
+        self._model_lock = threading.Lock()
+        # Monotonic time of the last load or transcription, for idle unloading
+        self.last_used = time.monotonic()
+        # Recent model load times, and how long transcriptions waited for a model
+        self.load_latencies_ms = deque(maxlen=20)
+        self.wait_latencies_ms = deque(maxlen=50)
+
+        # Swap the model in the background when the model settings change
+        if not model:
+            self.config.subscribe(self.CONFIG_KEYS, self._on_config_changed)
+
+    @property
+    def model(self):
+        """The loaded model, or None."""
+        return self._loaded[0]
+
+    def _settings(self):
+        """Get the settings of the loaded model, or of the next one to load."""
+        return ModelSettings(self.engine, self.model_path, self.model_id, self.compute_type)
+
+    def _apply(self, settings):
+        """Make settings the ones reported by the transcriber's attributes."""
+        self.engine, self.model_path, self.model_id, self.compute_type = settings
+
+    def _configured_settings(self):
+        """Read the model settings from the config.
 
-    def _load_model(self):
-        """Load the faster-whisper model.
+        Returns:
+            ModelSettings for the configured (or fixed) model
+        """
+        engine = self.config.get_local_engine()
+        if self._fixed_model:
+            model_path, model_id = "", self._fixed_model
+        else:
+            model_path, model_id = self.config.get_local_model_path(), self.config.get_local_model_id()
+        name = (model_path or "").strip() or (model_id or "").strip() or "base"
+        return ModelSettings(engine, model_path, model_id, self._choose_compute_type(engine, name))
+
+    def _swap(self, settings, new_model):
+        """Serve new_model from now on (called under the model lock)."""
+        self._apply(settings)
+        self._loaded = (new_model, settings)
+
+    def _on_config_changed(self, changes):
+        """Pick up new model settings, reloading in the background if warm.
+
+        The current model keeps serving transcriptions, and the attributes
+        keep describing it, until the new one has finished loading, so a
+        settings change never leaves the hotkey without a model and never
+        caches the old model's transcripts under the new settings.
+
+        Args:
+            changes: Dict of key -> ConfigChange from Config.subscribe
+        """
+        settings = self._configured_settings()
+
+        def reload_worker():
+            with self._model_lock:
+                if self.model is None:
+                    # Nothing warm to replace; the next transcription loads lazily
+                    self._apply(settings)
+                    return
+                if settings == self._settings():
+                    return
+                new_model = self._create_model(settings)
+                if new_model is not None:
+                    self._swap(settings, new_model)
+
+        threading.Thread(target=reload_worker, daemon=True).start()
+
+    def _model_name(self):
+        """Get the configured model path or ID without logging."""
+        return (self.model_path or "").strip() or (self.model_id or "").strip() or "base"
+
+    def _choose_compute_type(self, engine, model):
+        """Pick the weight type for an engine and model.
+
+        Args:
+            engine: Local engine name
+            model: Model path or ID
 
         Returns:
-            True if model loaded successfully, False otherwise
+            CTranslate2 compute type, or None for engines whose model files fix it
         """
-        if self.model is not None:
-            return True
+        if engine != "faster-whisper":
+            return None
+        compute_type = self.config.get_local_compute_type()
+        if compute_type == "auto":
+            compute_type = get_compute_type_selector().choose(model)
+        return compute_type
+
+    @classmethod
+    def _wait_until_idle(cls):
+        """Block while any local transcription is in progress."""
+        with cls._active_changed:
+            cls._active_changed.wait_for(lambda: cls._active == 0)
+
+    @classmethod
+    def _set_active(cls, delta):
+        """Count a local transcription starting (1) or finishing (-1)."""
+        with cls._active_changed:
+            cls._active += delta
+            cls._active_changed.notify_all()
+
+    def _benchmark_compute_types(self, model):
+        """Benchmark compute types for a model once, switching to the fastest.
+
+        Runs in the background after the first load; the model loaded with
+        the CPU-based guess serves transcriptions meanwhile. Each candidate
+        is loaded next to the warm model, so the benchmark is skipped when two
+        copies do not fit in warm_models_max_mb, and it pauses while
+        dictations are transcribed.
+        """
+        selector = get_compute_type_selector()
+        if selector.get(model) or len(selector.candidates) < 2:
+            return
+        budget_mb = self.config.get_warm_models_max_mb()
+        if estimate_model_mb(model) * 2 > budget_mb:
+            print(f"Not benchmarking compute types for {model}: two copies exceed warm_models_max_mb ({budget_mb} MB)")
+            return
+
+        def benchmark_worker():
+            options = {key: self.options[key] for key in ("language", "beam_size") if key in self.options}
+            result = selector.benchmark(
+                model, load_faster_whisper, self.cpu_threads, options, wait_idle=self._wait_until_idle
+            )
+            if not result:
+                return
+
+            with self._model_lock:
+                if result["compute_type"] == self.compute_type:
+                    return
+                if self._model_name() != model or self.config.get_local_compute_type() != "auto":
+                    return  # The settings changed meanwhile
+                settings = self._settings()._replace(compute_type=result["compute_type"])
+                if self.model is None:
+                    self._apply(settings)  # Unloaded; the next load uses the new type
+                    return
+                new_model = self._create_model(settings)
+                if new_model is not None:
+                    self._swap(settings, new_model)
+
+        threading.Thread(target=benchmark_worker, name="compute-type-benchmark", daemon=True).start()
+
+    def _get_model_source(self, settings):
+        """Determine which model to use: model_path, model_id or the default.
 
+        Args:
+            settings: ModelSettings to load
+
+        Returns:
+            Model path or ID string for WhisperModel
+        """
+        if settings.model_path and settings.model_path.strip():
+            # Use local model path
+            print(f"Loading local model from: {settings.model_path}")
+            return settings.model_path
+        elif settings.model_id and settings.model_id.strip():
+            # Use model ID (Hugging Face model name)
+            print(f"Loading model by ID: {settings.model_id}")
+            return settings.model_id
+        else:
+            # No model specified, use default
+            print("No model specified, using default: base")
+            return "base"
+
+    def _create_model(self, settings):
+        """Create a model for the given settings.
+
+        Args:
+            settings: ModelSettings to load
+
+        Returns:
+            Model with the WhisperModel transcribe() interface, or None if loading failed
+        """
+        engine = settings.engine
         try:
-            # Import faster_whisper here to avoid dependency issues
-            from faster_whisper import WhisperModel
-
-            # Determine which model to use: model_path or model_id
-            if self.model_path and self.model_path.strip():
-                # Use local model path
-                model_source = self.model_path
-                print(f"Loading local model from: {model_source}")
-            elif self.model_id and self.model_id.strip():
-                # Use model ID (Hugging Face model name)
-                model_source = self.model_id
-                print(f"Loading model by ID: {model_source}")
-            else:
-                # No model specified, use default
-                model_source = "base"
-                print(f"No model specified, using default: {model_source}")
-
-            # Load the model
-            # device can be "cpu", "cuda", or "auto"
-            # compute_type can be "int8", "float16", "float32"
-            self.model = WhisperModel(
-                model_source,
-                device="cpu",  # Default to CPU for compatibility
-                compute_type="int8"  # Efficient on CPU
-            )
+            model_source = self._get_model_source(settings)
 
-            print(f"Successfully loaded faster-whisper model: {model_source}")
-            return True
+            # Engine libraries are imported here to avoid dependency issues
+            model = load_model(engine, model_source, self.cpu_threads, settings.compute_type)
+
+            if settings.compute_type:
+                print(f"Successfully loaded {engine} model: {model_source} ({settings.compute_type})")
+            else:
+                print(f"Successfully loaded {engine} model: {model_source}")
+            if self.benchmark and engine == "faster-whisper" and self.config.get_local_compute_type() == "auto":
+                self._benchmark_compute_types(model_source.strip())
+            return model
 
         except ImportError as e:
-            error_msg = "faster-whisper library not installed"
+            error_msg = f"{engine} not installed"
             self.logger.error(f"{error_msg}: {e}")
-            self.notifier.notify_transcription_error("Local STT not available - faster-whisper not installed")
-            return False
+            self.notifier.notify_transcription_error(f"Local STT not available - {error_msg}")
+            return None
 
         except Exception as e:
-            error_msg = f"Failed to load faster-whisper model: {e}"
+            error_msg = f"Failed to load {engine} model: {e}"
             self.logger.error(error_msg)
             self.notifier.notify_transcription_error(f"Failed to load local model: {str(e)[:50]}")
-            return False
+            return None
+
+    def warm_up(self):
+        """Load the model ahead of the first dictation."""
+        self._load_model()
+
+    def is_loaded(self):
+        """Check whether the model is in memory."""
+        return self.model is not None
+
+    def unload(self):
+        """Release the model; the next transcription loads it again."""
+        with self._model_lock:
+            self._loaded = (None, None)
+
+    def idle_seconds(self):
+        """Get the time since the model was last loaded or used."""
+        return time.monotonic() - self.last_used
+
+    def _load_model(self):
+        """Load the model.
+
+        Returns:
+            True if model loaded successfully, False otherwise
+        """
+        if self.model is not None:
+            return True
+
+        with self._model_lock:
+            if self.model is None:
+                start = time.perf_counter()
+                settings = self._settings()
+                new_model = self._create_model(settings)
+                if new_model is not None:
+                    self._loaded = (new_model, settings)
+                    self.load_latencies_ms.append(round((time.perf_counter() - start) * 1000))
+            self.last_used = time.monotonic()
+            return self.model is not None
+
+    def decode(self, audio, **options):
+        """Decode audio with the model, loading it first if needed.
+
+        Unlike transcribe(), nothing is cached, notified or cleaned up, and
+        the caller gets the segments and the detected language.
 
-    def transcribe(self, audio_file_path, cleanup=True):
-        """Transcribe audio file using faster-whisper.
+        Args:
+            audio: Audio file path, or 16 kHz mono float32 samples
+            **options: Decoding options overriding the transcriber's options
+
+        Returns:
+            Tuple of (iterator of segments, info) as returned by WhisperModel.transcribe
+
+        Raises:
+            RuntimeError: If the model cannot be loaded
+        """
+        self.last_used = time.monotonic()
+        if not self._load_model():
+            raise RuntimeError("Failed to load local model")
+        model = self.model
+        if model is None:
+            raise RuntimeError("Local model was unloaded")
+        return model.transcribe(str(audio) if isinstance(audio, Path) else audio, **dict(self.options, **options))
+
+    def cache_key(self, audio_path, audio=None, prompt="", settings=None):
+        """Build the transcript cache key for a recording.
+
+        Args:
+            audio_path: Path object to audio file
+            audio: Optional 16 kHz mono float32 samples of the same recording
+            prompt: Context prompt text the recording is transcribed with
+            settings: ModelSettings of the model that transcribes it (defaults
+                to the loaded model's, or the next one to load)
+
+        Returns:
+            Cache key string, or None if caching is disabled or the file is unreadable
+        """
+        if not self.config.is_transcript_cache_enabled():
+            return None
+        try:
+            digest = audio_digest(audio_path, audio)
+        except OSError:
+            return None
+        settings = settings or self._loaded[1] or self._settings()
+        model = (settings.model_path or "").strip() or (settings.model_id or "").strip() or "base"
+        options = dict(self.options)
+        if settings.compute_type:
+            options["compute_type"] = settings.compute_type
+        if prompt:
+            options["initial_prompt"] = prompt
+        return make_key(digest, settings.engine, model, options)
+
+    def transcribe(self, audio_file_path, cleanup=True, audio=None, prompt=None, on_segment=None):
+        """Transcribe audio file with the local model.
 
         Args:
             audio_file_path: Path to audio file (WAV format)
             cleanup: If True, delete audio file after transcription (default: True)
+            audio: Optional 16 kHz mono float32 samples of the same recording; when
+                given, the WAV file is not decoded again
+            prompt: Optional function taking the model tokenizer (or None) and
+                returning a Prompt, such as PromptBuilder.build
+            on_segment: Optional function called with the text of each segment
+                as soon as it is decoded (once with the whole text on a cache hit)
 
         Returns:
             Transcribed text as string, or None if error occurred
@@ -122,26 +388,74 @@ class LocalTranscriber:
                 self.notifier.notify_transcription_error("Audio file not found")
                 return None
 
-            # Load model if not already loaded
-            if not self._load_model():
-                return None
+            # A background reload may swap the model meanwhile; keep this one
+            # together with the settings it was loaded with
+            model, settings = self._loaded
+            settings = settings or self._settings()
+
+            # Tokenize the prompt with the warm model's vocabulary; a cold model gets text
+            context = EMPTY_PROMPT
+            if prompt is not None:
+                context = prompt(getattr(model, "hf_tokenizer", None))
+
+            # Identical audio was already transcribed with this model: skip decoding
+            cache = get_transcript_cache(self.config.get_transcript_cache_max_bytes())
+            cache_key = self.cache_key(audio_path, audio, context.text, settings)
+            cached = cache.get(cache_key) if cache_key else None
+            if cached:
+                print(f"Transcription served from cache: {cached['text'][:100]}")
+                if on_segment is not None:
+                    on_segment(cached["text"])
+                return cached["text"]
+
+            # Load model if not already loaded; a load started when recording
+            # began is usually finished or close to it by now
+            self.last_used = time.monotonic()
+            if model is None:
+                start = time.perf_counter()
+                if not self._load_model():
+                    return None
+                model, loaded_settings = self._loaded
+                if model is None:
+                    raise RuntimeError("Local model was unloaded")
+                if cache_key and loaded_settings != settings:
+                    cache_key = self.cache_key(audio_path, audio, context.text, loaded_settings)
+                self.wait_latencies_ms.append(round((time.perf_counter() - start) * 1000))
+            else:
+                self.wait_latencies_ms.append(0)
 
-            print(f"Transcribing audio file with faster-whisper: {audio_file_path}")
+            print(f"Transcribing audio file with {self.engine}: {audio_file_path}")
+
+            options = dict(self.options)
+            if context.text:
+                # Token IDs skip re-tokenizing; they match the model they were built with
+                options["initial_prompt"] = context.tokens if context.tokens is not None else context.text
 
             # Transcribe the audio file
             # faster-whisper returns segments, we need to combine them
-            segments, info = self.model.transcribe(
-                str(audio_path),
-                language="en",  # Default to English
-                beam_size=5,  # Default beam size
-                vad_filter=True,  # Enable voice activity detection
-            )
+            self._set_active(1)
+            try:
+                segments, info = model.transcribe(
+                    audio if audio is not None else str(audio_path),
+                    **options
+                )
+
+                # Segments are decoded lazily; hand each one on as soon as it exists
+                texts = []
+                for segment in segments:
+                    texts.append(segment.text)
+                    if on_segment is not None and segment.text.strip():
+                        on_segment(segment.text.strip())
+            finally:
+                self._set_active(-1)
 
             # Combine all segments into a single text
-            transcribed_text = " ".join(segment.text for segment in segments).strip()
+            transcribed_text = " ".join(texts).strip()
 
             if transcribed_text:
                 print(f"Transcription successful: {transcribed_text[:100]}..." if len(transcribed_text) > 100 else f"Transcription successful: {transcribed_text}")
+                if cache_key:
+                    cache.put(cache_key, {"text": transcribed_text})
                 return transcribed_text
             else:
                 print("No speech detected in audio")
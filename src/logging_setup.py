@@ -0,0 +1,198 @@
+"""Process-wide logging setup for VoiceControl.
+
+Logging is initialized once. Records go through a QueueHandler so that
+logging calls on hot paths (audio, hotkey, transcription threads) only
+enqueue; a single QueueListener thread writes them to a size-rotated log
+file. Performance spans go to a separate JSON-lines file through the same
+listener.
+"""
+
+import atexit
+import json
+import logging
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from pathlib import Path
+
+
+DEFAULT_LOG_PATH = Path.home() / ".config" / "voice-ctrl" / "voice-ctrl.log"
+LOG_FORMAT = '[%(asctime)s] %(levelname)s: %(message)s'
+DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+PERF_LOGGER_NAME = "voice_ctrl.perf"
+
+_lock = threading.Lock()
+_listener = None
+_file_handler = None
+_perf_handler = None
+
+
+class _PerfFilter(logging.Filter):
+    """Routes perf span records to the perf handler only."""
+
+    def __init__(self, perf_only):
+        super().__init__()
+        self.perf_only = perf_only
+
+    def filter(self, record):
+        return (record.name == PERF_LOGGER_NAME) == self.perf_only
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Formats perf span records as one JSON object per line."""
+
+    def format(self, record):
+        entry = {
+            "time": round(record.created, 3),
+            "span": record.getMessage(),
+        }
+        entry.update(getattr(record, "perf_fields", {}))
+        return json.dumps(entry)
+
+
+def setup_logging(log_path=None, max_bytes=1048576, backup_count=3):
+    """Initialize logging for the process. Later calls are no-ops.
+
+    Args:
+        log_path: Path to log file (defaults to ~/.config/voice-ctrl/voice-ctrl.log)
+        max_bytes: Rotate the log file once it reaches this size (default 1 MB)
+        backup_count: Number of rotated files to keep (default 3)
+    """
+    global _listener, _file_handler, _perf_handler
+
+    with _lock:
+        if _listener is not None:
+            return
+
+        log_path = Path(log_path) if log_path else DEFAULT_LOG_PATH
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+
+        _file_handler = RotatingFileHandler(
+            str(log_path), maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8', delay=True
+        )
+        _file_handler.setFormatter(logging.Formatter(LOG_FORMAT, datefmt=DATE_FORMAT))
+        _file_handler.addFilter(_PerfFilter(perf_only=False))
+
+        _perf_handler = RotatingFileHandler(
+            str(log_path.with_name("perf.jsonl")), maxBytes=max_bytes, backupCount=backup_count,
+            encoding='utf-8', delay=True
+        )
+        _perf_handler.setFormatter(JsonLinesFormatter())
+        _perf_handler.addFilter(_PerfFilter(perf_only=True))
+
+        log_queue = queue.SimpleQueue()
+        queue_handler = QueueHandler(log_queue)
+
+        root = logging.getLogger()
+        root.addHandler(queue_handler)
+        root.setLevel(logging.ERROR)
+
+        # Perf spans are disabled until configure_logging(perf_log_enabled=True)
+        perf_logger = logging.getLogger(PERF_LOGGER_NAME)
+        perf_logger.propagate = False
+        perf_logger.addHandler(queue_handler)
+        perf_logger.setLevel(logging.CRITICAL + 1)
+
+        _listener = QueueListener(log_queue, _file_handler, _perf_handler, respect_handler_level=True)
+        _listener.start()
+        atexit.register(shutdown_logging)
+
+
+def configure_logging(level=None, max_bytes=None, backup_count=None, perf_log_enabled=None):
+    """Adjust logging settings at runtime. Arguments left as None are unchanged.
+
+    Args:
+        level: Level name for the main log, e.g. "ERROR", "INFO", "DEBUG"
+        max_bytes: Rotation size in bytes for both log files
+        backup_count: Number of rotated files to keep
+        perf_log_enabled: Whether perf spans are written to perf.jsonl
+    """
+    if level is not None:
+        logging.getLogger().setLevel(level.upper() if isinstance(level, str) else level)
+
+    for handler in (_file_handler, _perf_handler):
+        if handler is None:
+            continue
+        if max_bytes is not None:
+            handler.maxBytes = max_bytes
+        if backup_count is not None:
+            handler.backupCount = backup_count
+
+    if perf_log_enabled is not None:
+        logging.getLogger(PERF_LOGGER_NAME).setLevel(
+            logging.INFO if perf_log_enabled else logging.CRITICAL + 1
+        )
+
+
+def shutdown_logging():
+    """Flush queued records and stop the listener thread."""
+    global _listener
+
+    with _lock:
+        if _listener is None:
+            return
+        _listener.stop()
+        _listener = None
+        for handler in (_file_handler, _perf_handler):
+            if handler is not None:
+                handler.close()
+
+
+def log_span(name, seconds, **fields):
+    """Record a completed performance span.
+
+    Args:
+        name: Span name, e.g. "transcribe"
+        seconds: Duration in seconds
+        **fields: Extra JSON-serializable fields for the record
+    """
+    perf_logger = logging.getLogger(PERF_LOGGER_NAME)
+    if not perf_logger.isEnabledFor(logging.INFO):
+        return
+    fields["duration_ms"] = round(seconds * 1000, 2)
+    perf_logger.info(name, extra={"perf_fields": fields})
+
+
+@contextmanager
+def perf_span(name, **fields):
+    """Time a block of code and record it as a performance span.
+
+    The yielded dictionary can be filled with extra fields inside the block;
+    its "duration_ms" is set when the block exits, even if the perf log is off.
+
+    Args:
+        name: Span name, e.g. "transcribe"
+        **fields: Extra JSON-serializable fields for the record
+    """
+    started = time.perf_counter()
+    try:
+        yield fields
+    finally:
+        seconds = time.perf_counter() - started
+        fields["duration_ms"] = round(seconds * 1000, 2)
+        log_span(name, seconds, **fields)
+
+
+def summarize_latencies(samples):
+    """Summarize recent latency samples for metrics and the settings window.
+
+    Args:
+        samples: Iterable of durations in milliseconds
+
+    Returns:
+        Dict with count, last, mean, p50, p95 and max (empty if no samples)
+    """
+    samples = list(samples)
+    if not samples:
+        return {"count": 0}
+    ordered = sorted(samples)
+    return {
+        "count": len(samples),
+        "last": samples[-1],
+        "mean": round(sum(samples) / len(samples), 2),
+        "p50": ordered[len(ordered) // 2],
+        "p95": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+        "max": ordered[-1],
+    }
@@ -1,100 +1,84 @@
-"""Main entry point for VoiceControl application."""
+"""Main entry point for VoiceControl application.
 
+Only what the hotkey path needs is imported here. GUI windows, the tray
+icon and provider SDKs are imported on first use or warmed up after the
+hotkey is registered, to keep autostart at login fast.
+"""
+
+import argparse
+import functools
+import os
 import sys
 import time
-from pynput import keyboard
-from .config import Config
-from .recorder import AudioRecorder
-from .transcriber import WhisperTranscriber
-from .local_transcriber import LocalTranscriber
-from .paster import TextPaster
-from .tray_icon import TrayIcon
-from .settings_window import SettingsWindow, show_about_dialog
-from .history_window import HistoryWindow
-from .setup_wizard import SetupWizard, should_show_setup_wizard
-from .history import HistoryManager
+import threading
+from collections import deque
 from pathlib import Path
-
-
-def parse_keyboard_shortcut(shortcut_str):
-    """Parse a keyboard shortcut string into pynput format.
+from .startup_profiler import StartupProfiler
+
+# Installed before the package imports below so they show up in the profile
+startup_profiler = StartupProfiler(enabled="--profile-startup" in sys.argv)
+
+with startup_profiler.phase("import hotkey path modules"):
+    from pynput import keyboard
+    from .config import Config
+    from .hotkey_grabber import HotkeyGrabber
+    from .shortcuts import parse_keyboard_shortcut
+    from .recorder import AudioRecorder
+    from .transcriber import WhisperTranscriber
+    from .transcriber_pool import TranscriberPool
+    from .paster import TextPaster
+    from .progressive_paste import ProgressivePaste
+    from .history import HistoryManager
+    from .prompt_builder import PromptBuilder
+    from .logging_setup import perf_span, log_span, summarize_latencies
+    from .control_server import ControlServer
+    from .ui_thread import get_ui_thread
+    from . import ctl
+    from .memory_usage import rss_mb
+
+# Seconds between checks for local models to unload after model_idle_unload_minutes
+IDLE_CHECK_SECONDS = 30
+# Seconds to let a fatal startup notification be shown before exiting
+EXIT_NOTIFY_SECONDS = 2.0
+
+
+def parse_args(argv=None):
+    """Parse command line arguments.
 
     Args:
-        shortcut_str: String like "Ctrl+Shift+Space" or "Alt+F1"
+        argv: Argument list (defaults to sys.argv[1:])
 
     Returns:
-        String in pynput format like "<ctrl>+<shift>+<space>" or None if invalid
-
-    Examples:
-        "Ctrl+Shift+Space" -> "<ctrl>+<shift>+<space>"
-        "Alt+F1" -> "<alt>+<f1>"
-        "Ctrl+A" -> "<ctrl>+a"
+        argparse.Namespace with the parsed options
     """
-    if not shortcut_str or not isinstance(shortcut_str, str):
-        return None
-
-    # Map of common key names to pynput format
-    key_map = {
-        "ctrl": "<ctrl>",
-        "shift": "<shift>",
-        "alt": "<alt>",
-        "cmd": "<cmd>",
-        "space": "<space>",
-        "enter": "<enter>",
-        "tab": "<tab>",
-        "backspace": "<backspace>",
-        "delete": "<delete>",
-        "esc": "<esc>",
-        "up": "<up>",
-        "down": "<down>",
-        "left": "<left>",
-        "right": "<right>",
-        "home": "<home>",
-        "end": "<end>",
-        "page_up": "<page_up>",
-        "page_down": "<page_down>",
-        "insert": "<insert>",
-    }
-
-    # Add function keys F1-F12
-    for i in range(1, 13):
-        key_map[f"f{i}"] = f"<f{i}>"
-
-    try:
-        # Split the shortcut by + and process each part
-        parts = shortcut_str.split("+")
-        if len(parts) < 2:
-            return None  # Need at least modifier + key
-
-        parsed_parts = []
-        for part in parts:
-            part_lower = part.strip().lower()
-
-            # Check if it's a known modifier/special key
-            if part_lower in key_map:
-                parsed_parts.append(key_map[part_lower])
-            # Single character keys (a-z, 0-9, etc.) stay lowercase
-            elif len(part.strip()) == 1:
-                parsed_parts.append(part.strip().lower())
-            else:
-                # Unknown key format
-                return None
-
-        return "+".join(parsed_parts)
-
-    except Exception:
-        return None
+    parser = argparse.ArgumentParser(prog="voice-ctrl", description="System-wide voice dictation tool.")
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="print a breakdown of startup and import times once the hotkey is ready"
+    )
+    return parser.parse_args(argv)
 
 
-def main():
+def main(argv=None):
     """Main function to run the voice control application."""
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] in ctl.COMMANDS:
+        # Client subcommand for an already running daemon
+        sys.exit(ctl.main(argv))
+
+    parse_args(argv)
+    started_at = time.time()
     print("VoiceControl started!")
 
     # Load configuration
-    config = Config()
+    with startup_profiler.phase("load config"):
+        config = Config()
 
-    # Check if we need to show the setup wizard
-    if should_show_setup_wizard(config):
+    # Check if we need to show the setup wizard (tkinter is only loaded if so);
+    # a self-hosted server may not need an API key
+    if not config.has_api_key() and config.uses_openai_api():
+        from .setup_wizard import SetupWizard
         print("\nFirst time setup required...")
         config_path = Path.home() / ".config" / "voice-ctrl" / "config.json"
         wizard = SetupWizard(config_path)
@@ -129,89 +113,206 @@ def main():
             "Invalid Keyboard Shortcut",
             f"'{shortcut_str}' is not valid. See console for examples."
         )
+        config.notifier.dispatcher.wait_until_idle(timeout=EXIT_NOTIFY_SECONDS)
         sys.exit(1)
 
     print(f"Keyboard shortcut: {shortcut_str}")
+    for profile in config.get_hotkey_profiles():
+        print(f"Keyboard shortcut: {profile['shortcut']} ({profile['name']})")
     print("Press Ctrl+C to exit\n")
 
     # Initialize components with config settings
-    recorder = AudioRecorder(
-        max_duration=config.get_max_duration(),
-        audio_feedback_enabled=config.is_audio_feedback_enabled()
-    )
+    with startup_profiler.phase("create recorder"):
+        recorder = AudioRecorder(
+            max_duration=config.get_max_duration(),
+            audio_feedback_enabled=config.is_audio_feedback_enabled(),
+            device=config.get_input_device(),
+            device_cache=config.get_input_device_cache(),
+            blocksize=config.get_audio_blocksize(),
+            latency=config.get_audio_latency()
+        )
+    recorder.set_device_resolved_callback(config.set_input_device_cache)
+    config.subscribe(AudioRecorder.CONFIG_KEYS, recorder.on_config_changed)
+
+    # The OpenAI transcriber is either the primary provider or the fallback
+    openai_transcriber = WhisperTranscriber(config=config)
+    # Local transcribers of the main shortcut, hotkey profiles and re-transcription
+    transcriber_pool = TranscriberPool(config, openai_transcriber)
+    local_transcriber = None
+    transcriber = None
+    fallback_transcriber = None
+
+    def select_transcribers(stt_provider):
+        """Point transcriber/fallback_transcriber at the given provider.
+
+        Transcribers are kept once created, so switching providers back and
+        forth reuses the warm model and HTTP client.
+        """
+        nonlocal transcriber, fallback_transcriber, local_transcriber
+        if stt_provider == "local":
+            print("Using local STT (faster-whisper)")
+            if local_transcriber is None:
+                local_transcriber = transcriber_pool.get({"provider": "local"})
+            transcriber = local_transcriber
+            # Also use OpenAI transcriber for fallback
+            fallback_transcriber = openai_transcriber
+        else:
+            print("Using OpenAI Whisper API")
+            transcriber = openai_transcriber
+            fallback_transcriber = None
 
     # Initialize transcriber based on stt_provider setting
-    stt_provider = config.get_stt_provider()
-    if stt_provider == "local":
-        print("Using local STT (faster-whisper)")
-        transcriber = LocalTranscriber(config=config)
-        # Also initialize OpenAI transcriber for fallback
-        fallback_transcriber = WhisperTranscriber(config=config)
-    else:
-        print("Using OpenAI Whisper API")
-        transcriber = WhisperTranscriber(config=config)
-        fallback_transcriber = None
-
-    paster = TextPaster(restore_clipboard=True)
+    select_transcribers(config.get_stt_provider())
+    config.subscribe(["stt_provider"], lambda changes: select_transcribers(changes["stt_provider"].new_value))
+
+    with startup_profiler.phase("create paster"):
+        paster = TextPaster(
+            restore_clipboard=True,
+            typing_max_chars=config.get_typing_max_chars(),
+            typing_apps=config.get_typing_apps(),
+            paste_overrides=config.get_paste_app_overrides()
+        )
+    config.subscribe(TextPaster.CONFIG_KEYS, paster.on_config_changed)
     history_manager = HistoryManager()
+    # Primes the model with the glossary and the dictations just before this one
+    prompt_builder = PromptBuilder(history_manager, config)
+
+    # Re-transcription of retained recordings, created when history is first opened
+    retranscriber = None
+
+    # Define callback functions for tray menu; windows are imported on first use.
+    # They are built on the UI thread, so the tray menu never waits for them,
+    # and kept so that choosing an open window again raises it
+    history_window = None
+    settings_window = None
 
-    # Define callback functions for tray menu
     def on_view_history():
         """Show history viewer window."""
-        history_window = HistoryWindow(history_manager)
+        nonlocal retranscriber, history_window
+        from .history_window import HistoryWindow
+        from .audio_archive import get_audio_archive
+        from .retranscriber import Retranscriber, DEFAULT_PROFILES
+        if retranscriber is None:
+            retranscriber = Retranscriber(get_audio_archive(), transcriber_pool.get, prompt_builder)
+        if history_window is None:
+            history_window = HistoryWindow(history_manager, retranscriber, DEFAULT_PROFILES)
         history_window.show()
 
     def on_settings():
         """Show settings window."""
-        settings_window = SettingsWindow(config, recorder)
+        nonlocal settings_window
+        from .settings_window import SettingsWindow
+        if settings_window is None:
+            settings_window = SettingsWindow(config, recorder, openai_transcriber)
         settings_window.show()
 
     def on_about():
         """Show about dialog."""
+        from .settings_window import show_about_dialog
         show_about_dialog()
 
     # Quit handler will be set after hotkey is created
     quit_handler = {'hotkey': None}
+    shutdown_event = threading.Event()
 
     def on_quit():
         """Quit the application."""
         print("\nQuitting VoiceControl...")
         if recorder.is_recording:
             recorder.stop_recording()
-        # Stop the keyboard listener
+        # Stop the keyboard listener and wake up the main thread
         if quit_handler['hotkey']:
             quit_handler['hotkey'].stop()
+        if control_server:
+            control_server.stop()
+        shutdown_event.set()
         sys.exit(0)
 
-    # Initialize tray icon with menu callbacks
-    tray_icon = TrayIcon(
-        on_view_history=on_view_history,
-        on_settings=on_settings,
-        on_about=on_about,
-        on_quit=on_quit
-    )
+    # The tray icon is started after the hotkey is registered
+    tray_icon = None
+    control_server = None
+
+    # Counters and recent latencies reported by the metrics command
+    metrics = {
+        "dictations": 0,
+        "failures": 0,
+        "transcribe_ms": deque(maxlen=100),
+        "paste_ms": deque(maxlen=100),
+        "idle_unloads": 0,
+        "idle_freed_mb": deque(maxlen=20),
+    }
+    # Serializes toggles from the hotkey and the control socket
+    dictation_lock = threading.Lock()
+    # Hotkey profile of the current or last recording (None for the main shortcut)
+    recording_profile = None
 
-    # Start system tray icon
-    tray_icon.start()
+    def transcribers_for(profile):
+        """Get the transcriber and the fallback (None without one) for a hotkey profile.
 
-    def process_audio_file(audio_file, duration_seconds=None):
+        Args:
+            profile: Hotkey profile dictionary, or None for the main shortcut
+        """
+        if profile is None:
+            if transcriber is local_transcriber:
+                # Through the pool, so a model a profile evicted is reloaded
+                # within warm_models_max_mb like the profiles' models
+                return transcriber_pool.get({"provider": "local"}), fallback_transcriber
+            return transcriber, fallback_transcriber
+        if profile.get("provider", "local") == "openai":
+            return openai_transcriber, None
+        return transcriber_pool.get(profile), openai_transcriber
+
+    def process_audio_file(audio_file, duration_seconds=None, profile=None, blocks=None):
         """Process an audio file by transcribing and pasting.
 
         Args:
             audio_file: Path to the audio file to process
             duration_seconds: Duration of the recording in seconds
-        """
-        from pathlib import Path
+            profile: Hotkey profile the recording was started with, or None
+                for the main shortcut
+            blocks: The recording's int16 blocks, taken from the recorder when
+                it stopped; a new recording may already be filling its buffers
 
+        Returns:
+            Transcribed text, or None if transcription failed
+        """
         print("Processing audio...")
         audio_path = Path(audio_file)
+        transcriber, fallback_transcriber = transcribers_for(profile)
+        provider = profile.get("provider", "local") if profile else config.get_stt_provider()
+        paste_strategy = profile.get("paste_strategy") if profile else None
 
         try:
-            # If using local transcriber with fallback, don't clean up on first attempt
-            if fallback_transcriber is not None:
-                transcribed_text = transcriber.transcribe(audio_file, cleanup=False)
-            else:
-                transcribed_text = transcriber.transcribe(audio_file)
+            # The local model can paste each segment as soon as it is decoded
+            progressive = None
+            if fallback_transcriber is not None and config.is_progressive_paste_enabled():
+                progressive = ProgressivePaste(paster, strategy=paste_strategy)
+
+            # If using local transcriber with fallback, don't clean up on first attempt.
+            # Hand it the recorded samples directly so the WAV is not decoded again
+            started = time.perf_counter()
+            with perf_span("transcribe", provider=provider, profile=profile["name"] if profile else None) as span:
+                if fallback_transcriber is not None:
+                    transcribed_text = transcriber.transcribe(
+                        audio_file, cleanup=False, audio=recorder.get_audio_float32(blocks),
+                        prompt=prompt_builder.build,
+                        on_segment=progressive.add if progressive else None
+                    )
+                else:
+                    transcribed_text = transcriber.transcribe(audio_file, prompt=prompt_builder.build)
+                span["ok"] = transcribed_text is not None
+            metrics["transcribe_ms"].append(span["duration_ms"])
+
+            if progressive is not None:
+                pasted_text = progressive.finish()
+                if progressive.first_paste_at is not None:
+                    log_span("first_paste", progressive.first_paste_at - started, segments=len(progressive.parts))
+                if pasted_text:
+                    # History gets what was typed, even if decoding failed part way;
+                    # a fallback would paste the whole text a second time
+                    transcribed_text = pasted_text
+                else:
+                    progressive = None
 
             # If local transcription failed and fallback is available, try OpenAI
             if transcribed_text is None and fallback_transcriber is not None:
@@ -222,7 +323,9 @@ def main():
                 )
 
                 # Try OpenAI fallback (it will handle cleanup)
-                transcribed_text = fallback_transcriber.transcribe(audio_file)
+                with perf_span("transcribe", provider="openai", fallback=True) as span:
+                    transcribed_text = fallback_transcriber.transcribe(audio_file, prompt=prompt_builder.build)
+                    span["ok"] = transcribed_text is not None
 
                 if transcribed_text is None:
                     # Both local and OpenAI failed
@@ -234,8 +337,12 @@ def main():
                     print("OpenAI fallback successful!")
 
             if transcribed_text:
-                print("Pasting transcribed text...")
-                paster.paste_text(transcribed_text)
+                if progressive is None:
+                    print("Pasting transcribed text...")
+                    with perf_span("paste", chars=len(transcribed_text)) as span:
+                        paster.paste_text(transcribed_text, strategy=paste_strategy)
+                    metrics["paste_ms"].append(span["duration_ms"])
+                metrics["dictations"] += 1
 
                 # Add to history
                 if duration_seconds is None:
@@ -245,11 +352,22 @@ def main():
                     else:
                         duration_seconds = 0
 
-                history_manager.add_entry(transcribed_text, duration_seconds)
+                entry = history_manager.add_entry(transcribed_text, duration_seconds)
                 print(f"Added to history (duration: {duration_seconds:.2f}s)")
+
+                if config.is_audio_retention_enabled():
+                    # From the blocks taken at stop; the next recording may already be running
+                    samples = recorder.get_audio_int16(blocks)
+                    if samples is not None:
+                        threading.Thread(
+                            target=archive_recording, args=(entry, samples), daemon=True
+                        ).start()
             else:
+                metrics["failures"] += 1
                 print("No transcription result to paste")
 
+            return transcribed_text
+
         finally:
             # Clean up audio file if it still exists (in case local transcriber didn't)
             if fallback_transcriber is not None and audio_path.exists():
@@ -260,42 +378,213 @@ def main():
                     print(f"WARNING: Error deleting temporary audio file {audio_path}: {e}")
 
             # Update tray icon to idle state after processing
-            tray_icon.set_recording_state(False)
+            if tray_icon:
+                tray_icon.set_recording_state(False)
 
-    def on_auto_stop(audio_file):
+    def archive_recording(entry, samples):
+        """Compress a recording into the audio archive and link it to its history entry."""
+        from .audio_archive import get_audio_archive
+        try:
+            archive = get_audio_archive(
+                max_bytes=config.get_audio_retention_max_bytes(),
+                codec=config.get_audio_retention_codec()
+            )
+            history_manager.set_entry_audio(entry, archive.store(samples, recorder.sample_rate))
+        except Exception as e:
+            print(f"WARNING: Could not archive recording: {e}")
+
+    def on_auto_stop(audio_file, blocks):
         """Callback for when recording auto-stops at max duration."""
         # Calculate duration from recorder
         duration_seconds = time.time() - recorder.start_time if recorder.start_time else 0
-        process_audio_file(audio_file, duration_seconds)
+        process_audio_file(audio_file, duration_seconds, recording_profile, blocks)
+
+    def on_hotkey(profile=None):
+        """Callback function when hotkey is pressed.
 
-    def on_hotkey():
-        """Callback function when hotkey is pressed."""
-        # Capture start time before toggling
-        start_time = recorder.start_time
+        Any shortcut stops a recording; the one that started it decides how
+        it is transcribed and pasted.
 
-        audio_file = recorder.toggle_recording()
+        Args:
+            profile: Hotkey profile of the pressed shortcut, or None for the main shortcut
+
+        Returns:
+            Transcribed text if recording just stopped, otherwise None
+        """
+        nonlocal recording_profile
+        with dictation_lock:
+            # Capture start time before toggling
+            start_time = recorder.start_time
+
+            if not recorder.is_recording:
+                recording_profile = profile
+                active, _ = transcribers_for(profile)
+                if active is not openai_transcriber and not active.is_loaded():
+                    # Load a cold or idle-unloaded model while the user is still speaking
+                    threading.Thread(target=active.warm_up, daemon=True).start()
+
+            audio_file = recorder.toggle_recording()
+
+            # Update tray icon based on recording state
+            if tray_icon:
+                tray_icon.set_recording_state(recorder.is_recording)
+
+            # If recording just stopped, transcribe and paste
+            if audio_file:
+                # Calculate duration
+                duration_seconds = time.time() - start_time if start_time else 0
+                return process_audio_file(audio_file, duration_seconds, recording_profile, recorder.last_recording)
+            return None
+
+    # Control socket commands; they run on the server's connection threads
+    def control_start():
+        """Start recording unless already recording."""
+        if recorder.is_recording:
+            return "Already recording"
+        on_hotkey()
+        return "Recording started"
 
-        # Update tray icon based on recording state
-        tray_icon.set_recording_state(recorder.is_recording)
+    def control_stop():
+        """Stop recording, transcribe and paste; returns the text."""
+        if not recorder.is_recording:
+            raise RuntimeError("Not recording")
+        return on_hotkey() or ""
 
-        # If recording just stopped, transcribe and paste
-        if audio_file:
-            # Calculate duration
-            duration_seconds = time.time() - start_time if start_time else 0
-            process_audio_file(audio_file, duration_seconds)
+    def control_toggle():
+        """Toggle recording like the hotkey."""
+        text = on_hotkey()
+        return "Recording started" if recorder.is_recording else (text or "")
+
+    def control_transcribe_file(path, paste=False):
+        """Transcribe an existing audio file with the warm transcriber.
+
+        The file is never deleted and nothing is added to the history.
+        """
+        if not Path(path).is_file():
+            raise FileNotFoundError(f"No such file: {path}")
+
+        active, fallback = transcribers_for(None)
+        with perf_span("transcribe", provider=config.get_stt_provider(), source="file") as span:
+            text = active.transcribe(path, cleanup=False)
+            if text is None and fallback is not None:
+                text = fallback.transcribe(path, cleanup=False)
+            span["ok"] = text is not None
+        metrics["transcribe_ms"].append(span["duration_ms"])
+
+        if text is None:
+            raise RuntimeError("Transcription failed")
+        if paste:
+            paster.paste_text(text)
+        return text
+
+    def control_status():
+        """Report the daemon state."""
+        return {
+            "pid": os.getpid(),
+            "uptime_seconds": round(time.time() - started_at, 1),
+            "recording": recorder.is_recording,
+            "recording_seconds": round(time.time() - recorder.start_time, 1) if recorder.is_recording and recorder.start_time else 0,
+            "stt_provider": config.get_stt_provider(),
+            "local_model_loaded": local_transcriber is not None and local_transcriber.model is not None,
+            "local_compute_type": local_transcriber.compute_type if local_transcriber is not None else None,
+            "keyboard_shortcut": config.get_keyboard_shortcut(),
+            "hotkey_profiles": {profile["shortcut"]: profile["name"] for profile in config.get_hotkey_profiles()},
+            "loaded_models": transcriber_pool.loaded_models(),
+        }
+
+    def control_metrics():
+        """Report dictation counters and recent latencies."""
+        from .transcript_cache import get_transcript_cache
+        dispatcher = config.notifier.dispatcher
+        cache = get_transcript_cache()
+        load_stats = transcriber_pool.load_stats()
+        return {
+            "dictations": metrics["dictations"],
+            "failures": metrics["failures"],
+            "transcribe_ms": summarize_latencies(metrics["transcribe_ms"]),
+            "paste_ms": summarize_latencies(metrics["paste_ms"]),
+            "local_models": {
+                "rss_mb": round(rss_mb() or 0),
+                "load_ms": summarize_latencies(load_stats["load_ms"]),
+                "wait_ms": summarize_latencies(load_stats["wait_ms"]),
+                "idle_unloads": metrics["idle_unloads"],
+                "idle_freed_mb": list(metrics["idle_freed_mb"]),
+            },
+            "notifications": {
+                "shown": dispatcher.shown,
+                "coalesced": dispatcher.coalesced,
+                "dropped": dispatcher.dropped,
+            },
+            "transcript_cache": {
+                "hits": cache.hits,
+                "misses": cache.misses,
+            },
+        }
 
     # Set up auto-stop callback
     recorder.set_auto_stop_callback(on_auto_stop)
 
-    # Set up global hotkey listener with parsed shortcut
-    # Using GlobalHotKeys for cross-platform global hotkey support
-    try:
-        hotkey = keyboard.GlobalHotKeys({
-            parsed_shortcut: on_hotkey
-        })
-        hotkey.start()
+    def register_hotkeys(parsed):
+        """Start a global hotkey listener, replacing the current one.
+
+        The main shortcut and every hotkey profile's shortcut are registered
+        together. A passive X key grab is used where possible, so the process
+        only wakes up for the shortcuts themselves; pynput's GlobalHotKeys,
+        which sees every keystroke, is the fallback outside X11 or when
+        another application already grabbed a combination.
+
+        Args:
+            parsed: Main shortcut in pynput format
+        """
+        bindings = {parsed: on_hotkey}
+        for profile in config.get_hotkey_profiles():
+            # Config validation already dropped invalid and conflicting shortcuts
+            bindings[parse_keyboard_shortcut(profile["shortcut"])] = functools.partial(on_hotkey, profile)
+
+        # The old listener lets go first, so shortcuts kept across the change can be grabbed again
+        old_hotkey = quit_handler['hotkey']
+        if old_hotkey:
+            old_hotkey.stop()
+        try:
+            hotkey = HotkeyGrabber(bindings)
+            hotkey.start()
+        except (RuntimeError, ValueError) as e:
+            print(f"WARNING: Cannot grab the shortcuts ({e}); listening to all keystrokes instead")
+            hotkey = keyboard.GlobalHotKeys(bindings)
+            hotkey.start()
         # Store hotkey reference for clean shutdown
         quit_handler['hotkey'] = hotkey
+
+    def on_shortcuts_changed(changes):
+        """Re-register the hotkeys after keyboard_shortcut or hotkey_profiles changed."""
+        new_shortcut = config.get_keyboard_shortcut()
+        parsed = parse_keyboard_shortcut(new_shortcut)
+        if not parsed:
+            config.notifier.notify_error(
+                "Invalid Keyboard Shortcut",
+                f"'{new_shortcut}' is not valid. Keeping the previous shortcut."
+            )
+            return
+        try:
+            register_hotkeys(parsed)
+            if "keyboard_shortcut" in changes:
+                print(f"Keyboard shortcut changed to: {new_shortcut}")
+            if "hotkey_profiles" in changes:
+                print(f"Hotkey profiles: {[profile['name'] for profile in config.get_hotkey_profiles()]}")
+                threading.Thread(
+                    target=transcriber_pool.warm_up, args=(config.get_hotkey_profiles(),), daemon=True
+                ).start()
+        except Exception as e:
+            print(f"ERROR: Failed to register keyboard shortcut '{new_shortcut}': {e}")
+            config.notifier.notify_error(
+                "Shortcut Registration Failed",
+                f"Could not register '{new_shortcut}'. Try a different shortcut."
+            )
+
+    # Set up global hotkey listener with parsed shortcut
+    try:
+        with startup_profiler.phase("register hotkey"):
+            register_hotkeys(parsed_shortcut)
     except Exception as e:
         error_msg = f"Failed to register keyboard shortcut '{shortcut_str}': {e}"
         print(f"ERROR: {error_msg}")
@@ -303,20 +592,89 @@ def main():
             "Shortcut Registration Failed",
             f"Could not register '{shortcut_str}'. Try a different shortcut."
         )
-        tray_icon.stop()
+        config.notifier.dispatcher.wait_until_idle(timeout=EXIT_NOTIFY_SECONDS)
         sys.exit(1)
+    startup_profiler.mark("hotkey ready")
+
+    # Let scripts and the voice-ctrl client drive this process
+    with startup_profiler.phase("start control socket"):
+        control_server = ControlServer({
+            "start": control_start,
+            "stop": control_stop,
+            "toggle": control_toggle,
+            "transcribe-file": control_transcribe_file,
+            "status": control_status,
+            "metrics": control_metrics,
+        })
+        try:
+            control_server.start()
+            print(f"Control socket: {control_server.socket_path}")
+        except (RuntimeError, OSError) as e:
+            print(f"WARNING: Control socket disabled: {e}")
+            control_server = None
+
+    # Initialize tray icon with menu callbacks
+    with startup_profiler.phase("start tray icon"):
+        from .tray_icon import TrayIcon
+        tray_icon = TrayIcon(
+            on_view_history=on_view_history,
+            on_settings=on_settings,
+            on_about=on_about,
+            on_quit=on_quit
+        )
+
+        # Start system tray icon
+        tray_icon.start()
+    startup_profiler.mark("tray icon started")
+
+    # Load the active provider's SDK now that the hotkey already works
+    with startup_profiler.phase("warm up transcriber"):
+        transcriber.warm_up()
+    startup_profiler.mark("transcriber warm")
+
+    # Then the models of the hotkey profiles, as far as the memory budget allows
+    threading.Thread(target=transcriber_pool.warm_up, args=(config.get_hotkey_profiles(),), daemon=True).start()
+
+    # Start the Tk interpreter in the background so the first window opens instantly
+    threading.Thread(target=get_ui_thread().start, daemon=True).start()
+    startup_profiler.report()
+
+    # Apply settings changes without a restart, whether saved from the
+    # Settings window or edited in config.json directly
+    config.subscribe(["keyboard_shortcut", "hotkey_profiles"], on_shortcuts_changed)
+    config.start_watching()
+
+    def unload_idle_models():
+        """Unload local models that have not been used for model_idle_unload_minutes."""
+        minutes = config.get_model_idle_unload_minutes()
+        if not minutes or recorder.is_recording or dictation_lock.locked():
+            return
+        unloaded, freed_mb = transcriber_pool.unload_idle(minutes * 60)
+        if unloaded:
+            metrics["idle_unloads"] += 1
+            if freed_mb is not None:
+                metrics["idle_freed_mb"].append(round(freed_mb))
+            freed = f", {freed_mb:.0f} MB released" if freed_mb is not None else ""
+            print(f"Unloaded idle local models: {', '.join(unloaded)}{freed}")
 
     try:
-        # Keep the application running
-        hotkey.join()
+        # Keep the application running until Quit is chosen
+        last_idle_check = time.monotonic()
+        while not shutdown_event.wait(1.0):
+            if time.monotonic() - last_idle_check >= IDLE_CHECK_SECONDS:
+                last_idle_check = time.monotonic()
+                unload_idle_models()
     except KeyboardInterrupt:
         print("\nExiting VoiceControl...")
         # Stop recording if still active
         if recorder.is_recording:
             recorder.stop_recording()
         # Stop tray icon
-        tray_icon.stop()
-        hotkey.stop()
+        if tray_icon:
+            tray_icon.stop()
+        if control_server:
+            control_server.stop()
+        quit_handler['hotkey'].stop()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,51 @@
+"""Resident memory measurement and release of freed heap memory."""
+
+import ctypes
+import ctypes.util
+import gc
+import os
+
+
+_libc = None
+
+
+def rss_mb():
+    """Get the resident memory of this process.
+
+    Returns:
+        Resident set size in megabytes, or None where /proc is unavailable
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            resident_pages = int(f.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+    return resident_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+
+
+def malloc_trim():
+    """Return free heap memory to the operating system.
+
+    glibc keeps memory freed by large model buffers in its arenas; without
+    a trim, RSS barely drops after a model is released.
+
+    Returns:
+        True if memory was released, False if nothing was or libc has no malloc_trim
+    """
+    global _libc
+    try:
+        if _libc is None:
+            _libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6")
+        return bool(_libc.malloc_trim(0))
+    except (OSError, AttributeError):
+        return False
+
+
+def release_memory():
+    """Collect garbage and trim the heap after dropping large objects.
+
+    Returns:
+        True if the heap was trimmed
+    """
+    gc.collect()
+    return malloc_trim()
@@ -4,6 +4,8 @@ import os
 import logging
 from pathlib import Path
 import threading
+from .logging_setup import setup_logging
+from .local_engines import is_ggml_model
 
 
 class ModelScanner:
@@ -16,19 +18,10 @@ class ModelScanner:
             log_path: Path to log file (optional)
         """
         self.log_path = log_path
-        self._setup_logging()
-        self.logger = logging.getLogger(__name__)
-
-    def _setup_logging(self):
-        """Configure logging to file."""
         if self.log_path:
-            logging.basicConfig(
-                filename=str(self.log_path),
-                level=logging.ERROR,
-                format='[%(asctime)s] %(levelname)s: %(message)s',
-                datefmt='%Y-%m-%d %H:%M:%S',
-                force=True
-            )
+            # No-op if logging is already initialized for this process
+            setup_logging(self.log_path)
+        self.logger = logging.getLogger(__name__)
 
     def scan_default_paths(self, callback=None):
         """Scan default paths for Whisper models in a background thread.
@@ -96,7 +89,7 @@ class ModelScanner:
             folder_path: Path to folder to scan (Path object or string)
 
         Returns:
-            List of model dictionaries with 'name' and 'path' keys
+            List of model dictionaries with 'name', 'path' and 'engine' keys
         """
         path_obj = Path(folder_path) if isinstance(folder_path, str) else folder_path
         return self._scan_directory(path_obj)
@@ -108,12 +101,13 @@ class ModelScanner:
         - Directories containing model.bin or pytorch_model.bin
         - Directories with "whisper" in the name
         - Directories with faster-whisper model structure (config.json + model.bin)
+        - whisper.cpp model files (ggml .bin or .gguf)
 
         Args:
             directory: Path object to scan
 
         Returns:
-            List of model dictionaries with 'name' and 'path' keys
+            List of model dictionaries with 'name', 'path' and 'engine' keys
         """
         models = []
 
@@ -130,9 +124,20 @@ class ModelScanner:
                     model_name = self._extract_model_name(root_path)
                     models.append({
                         'name': model_name,
-                        'path': str(root_path)
+                        'path': str(root_path),
+                        'engine': 'faster-whisper'
                     })
 
+                # whisper.cpp models are single files
+                for filename in files:
+                    file_path = root_path / filename
+                    if is_ggml_model(file_path):
+                        models.append({
+                            'name': self._extract_ggml_model_name(file_path),
+                            'path': str(file_path),
+                            'engine': 'whisper.cpp'
+                        })
+
                 # Limit depth to avoid scanning too deep (max 5 levels)
                 if root_path.relative_to(directory).parts.__len__() >= 5:
                     dirs.clear()  # Don't descend further
@@ -241,3 +246,21 @@ class ModelScanner:
             name = name[:47] + "..."
 
         return name if name else dir_name
+
+    def _extract_ggml_model_name(self, model_path):
+        """Extract a human-readable name from a whisper.cpp model file.
+
+        Args:
+            model_path: Path object of the model file (e.g. ggml-base.en-q5_1.bin)
+
+        Returns:
+            String name for the model, e.g. "whisper.cpp base.en (q5_1)"
+        """
+        name = model_path.stem
+        if name.startswith('ggml-'):
+            name = name[len('ggml-'):]
+        # Quantized models end in the weight type, e.g. -q5_1 or -q8_0
+        base, _, quantization = name.rpartition('-q')
+        if base and quantization[:1].isdigit():
+            return f"whisper.cpp {base} (q{quantization})"
+        return f"whisper.cpp {name}"
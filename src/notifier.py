@@ -1,18 +1,176 @@
 """Desktop notification module using plyer library."""
 
 import logging
+import queue
+import threading
+import time
 from pathlib import Path
 from plyer import notification
+from .logging_setup import setup_logging
+
+
+class NotificationDispatcher:
+    """Shows desktop notifications from a background thread.
+
+    plyer talks to the notification daemon over D-Bus, which can take tens
+    of milliseconds or hang. Callers only enqueue; one worker thread shows
+    the notifications. Identical notifications are coalesced: repeats that
+    arrive while one is still queued are folded into it, and repeats within
+    COALESCE_WINDOW seconds of it being shown are suppressed. The worker
+    shows at most one notification every MIN_INTERVAL seconds and the queue
+    is bounded, so an error storm cannot flood the desktop.
+    """
+
+    # Maximum number of distinct notifications waiting to be shown
+    MAX_QUEUED = 16
+    # Seconds during which an identical notification is not shown again
+    COALESCE_WINDOW = 10.0
+    # Minimum seconds between two notifications
+    MIN_INTERVAL = 1.0
+
+    def __init__(self, send=None, max_queued=None, coalesce_window=None, min_interval=None):
+        """Initialize the dispatcher. The worker thread starts on first use.
+
+        Args:
+            send: Function taking (title, message, timeout) that shows a
+                notification (defaults to plyer)
+            max_queued: Override for MAX_QUEUED
+            coalesce_window: Override for COALESCE_WINDOW
+            min_interval: Override for MIN_INTERVAL
+        """
+        self.send = send or self._send_with_plyer
+        self.coalesce_window = self.COALESCE_WINDOW if coalesce_window is None else coalesce_window
+        self.min_interval = self.MIN_INTERVAL if min_interval is None else min_interval
+
+        self._queue = queue.Queue(maxsize=max_queued or self.MAX_QUEUED)
+        self._lock = threading.Lock()
+        self._pending = {}  # (title, message) -> repeat count while queued
+        self._last_shown = {}  # (title, message) -> monotonic time shown
+        self._last_sent = 0.0
+        self._thread = None
+
+        # Counters for diagnostics
+        self.shown = 0
+        self.coalesced = 0
+        self.dropped = 0
+
+    @staticmethod
+    def _send_with_plyer(title, message, timeout):
+        """Show a notification through plyer."""
+        notification.notify(title=title, message=message, timeout=timeout)
+
+    def submit(self, title, message, timeout=5):
+        """Queue a notification without blocking.
+
+        Args:
+            title: Notification title
+            message: Notification body
+            timeout: Seconds the notification stays visible
+
+        Returns:
+            True if queued, False if coalesced with an earlier one or dropped
+        """
+        key = (title, message)
+        now = time.monotonic()
+
+        with self._lock:
+            if key in self._pending:
+                self._pending[key] += 1
+                self.coalesced += 1
+                return False
+
+            shown_at = self._last_shown.get(key)
+            if shown_at is not None and now - shown_at < self.coalesce_window:
+                self.coalesced += 1
+                return False
+
+            try:
+                self._queue.put_nowait((key, timeout))
+            except queue.Full:
+                self.dropped += 1
+                return False
+
+            self._pending[key] = 1
+            self._ensure_worker()
+        return True
+
+    def _ensure_worker(self):
+        """Start the worker thread if it is not running (called under the lock)."""
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        """Worker loop: show queued notifications at a limited rate."""
+        while True:
+            (title, message), timeout = self._queue.get()
+            try:
+                delay = self._last_sent + self.min_interval - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+
+                with self._lock:
+                    count = self._pending.pop((title, message), 1)
+                    now = time.monotonic()
+                    self._last_shown[(title, message)] = now
+                    self._last_sent = now
+                    # Forget notifications that are outside the window
+                    self._last_shown = {
+                        key: shown_at for key, shown_at in self._last_shown.items()
+                        if now - shown_at < self.coalesce_window
+                    }
+
+                if count > 1:
+                    message = f"{message} (repeated {count} times)"
+
+                try:
+                    self.send(title, message, timeout)
+                    self.shown += 1
+                except Exception as e:
+                    # If notification fails, the error has already been logged
+                    print(f"Failed to show notification: {e}")
+            finally:
+                self._queue.task_done()
+
+    def wait_until_idle(self, timeout=None):
+        """Block until every queued notification has been handled.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if the queue was drained, False on timeout
+        """
+        with self._queue.all_tasks_done:
+            return self._queue.all_tasks_done.wait_for(lambda: not self._queue.unfinished_tasks, timeout)
+
+
+_dispatcher = None
+_dispatcher_lock = threading.Lock()
+
+
+def get_dispatcher():
+    """Get the process-wide notification dispatcher.
+
+    Returns:
+        Shared NotificationDispatcher instance
+    """
+    global _dispatcher
+    with _dispatcher_lock:
+        if _dispatcher is None:
+            _dispatcher = NotificationDispatcher()
+        return _dispatcher
 
 
 class Notifier:
     """Handles desktop notifications and error logging."""
 
-    def __init__(self, log_path=None):
+    def __init__(self, log_path=None, dispatcher=None):
         """Initialize the notifier.
 
         Args:
             log_path: Path to log file (defaults to ~/.config/voice-ctrl/voice-ctrl.log)
+            dispatcher: NotificationDispatcher to use (defaults to the shared one)
         """
         # Set default log path
         config_dir = Path.home() / ".config" / "voice-ctrl"
@@ -21,37 +179,25 @@ class Notifier:
         # Ensure config directory exists
         config_dir.mkdir(parents=True, exist_ok=True)
 
-        # Set up logging
-        self._setup_logging()
-
-    def _setup_logging(self):
-        """Configure logging to file."""
-        logging.basicConfig(
-            filename=str(self.log_path),
-            level=logging.ERROR,
-            format='[%(asctime)s] %(levelname)s: %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S',
-            force=True  # Override any existing logging config
-        )
+        # Set up logging (no-op if already initialized for this process)
+        setup_logging(self.log_path)
         self.logger = logging.getLogger(__name__)
 
+        # All notifiers share one background dispatcher
+        self.dispatcher = dispatcher or get_dispatcher()
+
     def notify_error(self, error_type, message):
-        """Show desktop notification and log error.
+        """Log an error and queue a desktop notification for it.
+
+        Never blocks on the notification daemon; the notification is shown
+        by the background dispatcher.
 
         Args:
             error_type: Type of error (e.g., "API Error", "Network Error")
             message: User-friendly error message
         """
-        # Show desktop notification
-        try:
-            notification.notify(
-                title=f"Voice Control - {error_type}",
-                message=message,
-                timeout=5  # 5 seconds for errors
-            )
-        except Exception as e:
-            # If notification fails, just log it
-            print(f"Failed to show notification: {e}")
+        # Queue desktop notification (5 seconds for errors)
+        self.dispatcher.submit(f"Voice Control - {error_type}", message, timeout=5)
 
         # Log the error
         self.logger.error(f"{error_type}: {message}")
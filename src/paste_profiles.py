@@ -0,0 +1,201 @@
+"""Per-application paste strategies learned from whether pastes arrive."""
+
+import json
+import os
+import threading
+from pathlib import Path
+
+
+DEFAULT_PROFILES_PATH = Path.home() / ".config" / "voice-ctrl" / "paste_profiles.json"
+
+# Paste keystrokes, in the order they are tried for an application
+STRATEGIES = ("shift_insert", "ctrl_shift_v", "ctrl_v")
+# Strategies a user override may choose; "type" uses XTest typing
+OVERRIDE_STRATEGIES = STRATEGIES + ("type",)
+
+
+class PasteProfiles:
+    """Table of how to paste into each application, keyed by WM_CLASS.
+
+    Every application starts with Shift+Insert and no delay. When a paste
+    is not fetched by the application, its profile moves on to the next
+    keystroke; once every keystroke has failed, the delay before the
+    keystroke is doubled. A keystroke that has worked is only given up
+    after PROVEN_MISSES misses in a row, so one paste into a window without
+    a text field does not unlearn it. After a run of successes the delay
+    is halved again, so fast applications settle at no delay while slow
+    ones keep the delay they need. How long the application takes to fetch
+    the text is learned too and bounds the wait for the next paste. User
+    overrides always win and are never changed.
+
+    Learned profiles are saved as JSON so they survive restarts.
+    """
+
+    # Delay used after every keystroke failed once without a delay
+    DELAY_STEP = 0.05
+    # Longest delay before the paste keystroke
+    MAX_DELAY = 0.5
+    # Consecutive successes after which the delay is halved
+    RELAX_AFTER = 5
+    # Consecutive misses after which a keystroke that has worked is given up
+    PROVEN_MISSES = 3
+    # Seconds to wait for a fetch by an application whose latency is unknown
+    DEFAULT_TIMEOUT = 1.0
+    # Known applications get LATENCY_FACTOR times their fetch latency, within bounds
+    LATENCY_FACTOR = 4
+    MIN_TIMEOUT = 0.25
+    MAX_TIMEOUT = 2.0
+    # Applications remembered
+    MAX_APPS = 200
+
+    def __init__(self, path=None, overrides=None):
+        """Load the learned profiles.
+
+        Args:
+            path: JSON file for learned profiles (defaults to ~/.config/voice-ctrl/paste_profiles.json)
+            overrides: Dict of application -> {"strategy": ..., "delay": ...} set by the user
+        """
+        self.path = Path(path) if path else DEFAULT_PROFILES_PATH
+        self.overrides = {}
+        self.set_overrides(overrides or {})
+        self._lock = threading.Lock()
+        self._profiles = self._load()
+
+    def _load(self):
+        """Read learned profiles, ignoring malformed entries."""
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict):
+            return {}
+
+        profiles = {}
+        for app, profile in data.items():
+            if (
+                isinstance(profile, dict)
+                and profile.get("strategy") in STRATEGIES
+                and isinstance(profile.get("delay"), (int, float))
+            ):
+                profiles[app] = profile
+        return profiles
+
+    def _save(self):
+        """Write learned profiles atomically (called under the lock)."""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.path.with_suffix(".tmp")
+            with open(temp_path, "w") as f:
+                json.dump(self._profiles, f, indent=2)
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            print(f"WARNING: Could not save paste profiles: {e}")
+
+    def set_overrides(self, overrides):
+        """Replace the user overrides.
+
+        Args:
+            overrides: Dict of application -> {"strategy": ..., "delay": ...}
+        """
+        self.overrides = {app.lower(): dict(profile) for app, profile in overrides.items()}
+
+    def get(self, app):
+        """Get the strategy and delay to paste into an application.
+
+        Args:
+            app: Lowercase WM_CLASS class name, or None if unknown
+
+        Returns:
+            Dict with "strategy", "delay" (seconds) and "override" (bool)
+        """
+        if app in self.overrides:
+            override = self.overrides[app]
+            return {
+                "strategy": override.get("strategy", STRATEGIES[0]),
+                "delay": override.get("delay", 0.0),
+                "override": True,
+            }
+        with self._lock:
+            profile = self._profiles.get(app, {})
+            return {
+                "strategy": profile.get("strategy", STRATEGIES[0]),
+                "delay": profile.get("delay", 0.0),
+                "override": False,
+            }
+
+    def serve_timeout(self, app):
+        """Get how long to wait for an application to fetch pasted text.
+
+        Args:
+            app: Lowercase WM_CLASS class name, or None if unknown
+
+        Returns:
+            Seconds to wait before counting the paste as missed
+        """
+        with self._lock:
+            latency = self._profiles.get(app, {}).get("latency")
+        if latency is None:
+            return self.DEFAULT_TIMEOUT
+        return min(self.MAX_TIMEOUT, max(self.MIN_TIMEOUT, latency * self.LATENCY_FACTOR))
+
+    def record(self, app, strategy, success, latency=None):
+        """Learn from whether a paste into an application arrived.
+
+        Args:
+            app: Lowercase WM_CLASS class name (None is ignored)
+            strategy: Strategy that was used
+            success: True if the application fetched the pasted text
+            latency: Seconds from the keystroke until the text was fetched
+
+        Returns:
+            The application's profile after the update
+        """
+        if app is None or app in self.overrides or strategy not in STRATEGIES:
+            return self.get(app)
+
+        with self._lock:
+            profile = self._profiles.pop(app, None) or {
+                "strategy": STRATEGIES[0], "delay": 0.0, "successes": 0, "failures": 0, "streak": 0
+            }
+            # Most recently used last, so the oldest application is forgotten first
+            self._profiles[app] = profile
+            old = (profile["strategy"], profile["delay"])
+
+            if success:
+                profile["successes"] = profile.get("successes", 0) + 1
+                profile["streak"] = profile.get("streak", 0) + 1
+                profile["misses"] = 0
+                if strategy == profile["strategy"]:
+                    profile["proven"] = True
+                if latency is not None:
+                    # Smoothed, so one quick fetch does not shorten the wait too much
+                    previous = profile.get("latency")
+                    profile["latency"] = round(latency if previous is None else 0.7 * previous + 0.3 * latency, 3)
+                if profile["delay"] and profile["streak"] >= self.RELAX_AFTER:
+                    profile["delay"] = round(profile["delay"] / 2, 3)
+                    if profile["delay"] < self.DELAY_STEP / 2:
+                        profile["delay"] = 0.0
+                    profile["streak"] = 0
+            else:
+                profile["failures"] = profile.get("failures", 0) + 1
+                profile["streak"] = 0
+                profile["misses"] = profile.get("misses", 0) + 1
+                if strategy == profile["strategy"] and (
+                    not profile.get("proven") or profile["misses"] >= self.PROVEN_MISSES
+                ):
+                    profile["proven"] = False
+                    profile["misses"] = 0
+                    index = STRATEGIES.index(strategy) + 1
+                    if index == len(STRATEGIES):
+                        # Every keystroke failed: the application needs more time
+                        index = 0
+                        profile["delay"] = min(self.MAX_DELAY, max(self.DELAY_STEP, profile["delay"] * 2))
+                    profile["strategy"] = STRATEGIES[index]
+
+            while len(self._profiles) > self.MAX_APPS:
+                del self._profiles[next(iter(self._profiles))]
+
+            if (profile["strategy"], profile["delay"]) != old or not success or profile["successes"] == 1:
+                self._save()
+            return {"strategy": profile["strategy"], "delay": profile["delay"], "override": False}
@@ -2,29 +2,79 @@
 
 import time
 import subprocess
+import threading
 import pyperclip
 from pynput.keyboard import Controller, Key
+from .selection_owner import SelectionOwner
+from .paste_profiles import PasteProfiles
 
 
 class TextPaster:
-    """Pastes text at cursor position using clipboard and Shift+Insert simulation."""
+    """Pastes text at cursor position using clipboard and keyboard simulation.
 
-    def __init__(self, restore_clipboard=True, paste_delay=0.1):
+    The paste keystroke (Shift+Insert, Ctrl+Shift+V or Ctrl+V) and the delay
+    before it are chosen per application from PasteProfiles, which learns
+    from whether the focused application actually fetched the text.
+
+    Short texts, and any text in applications listed in typing_apps, are
+    typed with XTest key events instead, which avoids the clipboard round
+    trip altogether.
+    """
+
+    # Config keys that select how text is inserted
+    CONFIG_KEYS = ("typing_max_chars", "typing_apps", "paste_app_overrides")
+
+    # Texts larger than this go through xclip, which supports incremental transfers
+    MAX_OWNER_BYTES = 200000
+    # Seconds to keep a paste that was not fetched in time on the clipboard
+    # before restoring the previous contents, in case it is fetched late
+    RESTORE_GRACE = 3.0
+
+    def __init__(self, restore_clipboard=True, paste_delay=0.1, typing_max_chars=0, typing_apps=(),
+                 paste_overrides=None, profiles=None):
         """Initialize the text paster.
 
         Args:
             restore_clipboard: Whether to restore previous clipboard contents after pasting
-            paste_delay: Delay in seconds between clipboard copy and Shift+Insert (default 0.1)
+            paste_delay: Delay in seconds between clipboard copy and the paste keystroke
+                (default 0.1), only used when falling back to xclip
+            typing_max_chars: Type texts up to this many characters instead of pasting (0 never)
+            typing_apps: WM_CLASS names of applications where text is always typed
+            paste_overrides: Dict of application -> {"strategy": ..., "delay": ...}
+                that replaces the learned profile
+            profiles: PasteProfiles to use (defaults to the saved profiles)
         """
         self.restore_clipboard = restore_clipboard
         self.paste_delay = paste_delay
         self.keyboard = Controller()
+        self.profiles = profiles if profiles is not None else PasteProfiles(overrides=paste_overrides)
+
+        # XTest typing; X connections are opened the first time they are needed
+        self.typing_max_chars = typing_max_chars
+        self.typing_apps = {name.lower() for name in typing_apps}
+        self._key_typer = None
+        self._focused_window = None  # FocusedWindow, or False if X is unavailable
+        self._typing_unavailable = False
+
+        # Clipboard restore deferred after a paste that was not fetched in time:
+        # (timer, previous clipboard text), or None
+        self._pending_restore = None
+        self._restore_lock = threading.Lock()
 
-    def paste_text(self, text):
+        # Serve selections in-process when X11 is available; otherwise use xclip
+        try:
+            self.selection_owner = SelectionOwner()
+        except Exception as e:
+            print(f"WARNING: In-process clipboard unavailable ({e}), using xclip")
+            self.selection_owner = None
+
+    def paste_text(self, text, strategy=None):
         """Paste text at current cursor position.
 
         Args:
             text: String to paste at cursor position
+            strategy: Paste strategy to use instead of the application's
+                learned or configured one (one of Config.PASTE_STRATEGIES)
 
         Returns:
             True if paste was successful, False otherwise
@@ -34,10 +84,244 @@ class TextPaster:
             print("WARNING: No text to paste (empty or None)")
             return False
 
+        wm_class = self._focused_class()
+        app = wm_class[-1].lower() if wm_class else None
+        profile = self.profiles.get(app)
+        if strategy:
+            profile = dict(profile, strategy=strategy, override=True)
+
+        if profile["strategy"] == "type" or (not profile["override"] and self._should_type(text, wm_class)):
+            if self._type_text(text):
+                return True
+            print("WARNING: Typing failed, pasting instead")
+            if profile["strategy"] == "type":
+                profile = dict(profile, strategy="shift_insert")
+
+        if self.selection_owner is not None and len(text.encode('utf-8')) <= self.MAX_OWNER_BYTES:
+            if self._paste_with_owner(text, app, profile):
+                return True
+            print("WARNING: In-process clipboard failed, falling back to xclip")
+
+        return self._paste_with_xclip(text, profile)
+
+    def on_config_changed(self, changes):
+        """Apply changed typing settings; they take effect from the next paste.
+
+        Args:
+            changes: Dict of key -> ConfigChange from Config.subscribe
+        """
+        if "typing_max_chars" in changes:
+            self.typing_max_chars = changes["typing_max_chars"].new_value
+        if "typing_apps" in changes:
+            self.typing_apps = {name.lower() for name in changes["typing_apps"].new_value}
+        if "paste_app_overrides" in changes:
+            self.profiles.set_overrides(changes["paste_app_overrides"].new_value)
+
+    def _focused_class(self):
+        """Get the WM_CLASS of the focused window.
+
+        Returns:
+            Tuple of (instance, class) strings, or None if unknown
+        """
+        if self._focused_window is None:
+            from .focused_window import FocusedWindow
+            try:
+                self._focused_window = FocusedWindow()
+            except Exception as e:
+                print(f"WARNING: Cannot identify the focused application ({e})")
+                self._focused_window = False  # Do not try again
+        if not self._focused_window:
+            return None
+        return self._focused_window.get_class()
+
+    def _should_type(self, text, wm_class):
+        """Decide whether text is typed rather than pasted.
+
+        Args:
+            text: Text to insert
+            wm_class: WM_CLASS of the focused window, or None
+
+        Returns:
+            True if the text should be typed
+        """
+        if self._typing_unavailable:
+            return False
+        if self.typing_max_chars and len(text) <= self.typing_max_chars:
+            return True
+        if self.typing_apps and wm_class:
+            return any(part.lower() in self.typing_apps for part in wm_class)
+        return False
+
+    def _type_text(self, text):
+        """Type text with XTest key events.
+
+        Args:
+            text: Text to type
+
+        Returns:
+            True if the text was typed, False otherwise
+        """
+        if self._key_typer is None:
+            from .key_typer import KeyTyper
+            try:
+                self._key_typer = KeyTyper()
+            except Exception as e:
+                print(f"WARNING: XTest typing unavailable ({e}), pasting instead")
+                self._typing_unavailable = True
+                return False
+
+        if not self._key_typer.type_text(text):
+            return False
+        print(f"Typed: {text[:100]}..." if len(text) > 100 else f"Typed: {text}")
+        return True
+
+    def _send_paste_keystroke(self, strategy="shift_insert"):
+        """Simulate the paste keystroke of a strategy.
+
+        Args:
+            strategy: "shift_insert", "ctrl_shift_v" or "ctrl_v"
+        """
+        if strategy == "ctrl_shift_v":
+            with self.keyboard.pressed(Key.ctrl, Key.shift):
+                self.keyboard.press('v')
+                self.keyboard.release('v')
+            print("Simulated Ctrl+Shift+V keystroke")
+        elif strategy == "ctrl_v":
+            with self.keyboard.pressed(Key.ctrl):
+                self.keyboard.press('v')
+                self.keyboard.release('v')
+            print("Simulated Ctrl+V keystroke")
+        else:
+            with self.keyboard.pressed(Key.shift):
+                self.keyboard.press(Key.insert)
+                self.keyboard.release(Key.insert)
+            print("Simulated Shift+Insert keystroke")
+
+    def _paste_with_owner(self, text, app=None, profile=None):
+        """Paste by serving both selections from the in-process owner.
+
+        No processes are spawned and there are no fixed sleeps beyond the
+        application's learned delay: the paste starts once the X server
+        confirms ownership, and the clipboard is restored once the focused
+        application has fetched the text. The wait for the fetch is bounded
+        by the application's learned latency; a paste that was not fetched
+        in time is recorded in the application's profile, so the next
+        dictation may use another keystroke, and its clipboard is restored
+        in the background after RESTORE_GRACE seconds.
+
+        Args:
+            text: String to paste at cursor position
+            app: Lowercase WM_CLASS class name of the focused application
+            profile: Profile from PasteProfiles.get (defaults to Shift+Insert, no delay)
+
+        Returns:
+            True if paste was successful, False otherwise
+        """
+        if profile is None:
+            profile = {"strategy": "shift_insert", "delay": 0.0, "override": False}
+
+        try:
+            owner = self.selection_owner
+
+            # A deferred restore still pending holds the real previous contents
+            previous_clipboard = self._cancel_restore()
+            if previous_clipboard is None and self.restore_clipboard:
+                previous_clipboard = owner.get_clipboard_text()
+
+            if not owner.set_text(text):
+                return False
+            print(f"Serving CLIPBOARD and PRIMARY: {text[:100]}..." if len(text) > 100 else f"Serving CLIPBOARD and PRIMARY: {text}")
+
+            served, latency = self._send_and_wait(profile, self.profiles.serve_timeout(app))
+            if app is not None and not profile["override"]:
+                learned = self.profiles.record(app, profile["strategy"], served, latency)
+                if not served and learned["strategy"] != profile["strategy"]:
+                    print(f"Paste into {app} not fetched, using {learned['strategy']} from the next paste")
+
+            if not served:
+                print("WARNING: Paste target did not fetch the text in time")
+                if previous_clipboard is not None:
+                    # Leave the text for a late fetch; restore in the background
+                    self._schedule_restore(previous_clipboard)
+            elif previous_clipboard is not None:
+                owner.set_text(previous_clipboard, selections=("CLIPBOARD",))
+                print("Restored previous clipboard contents")
+
+            return True
+
+        except Exception as e:
+            print(f"WARNING: In-process paste failed: {e}")
+            return False
+
+    def _send_and_wait(self, profile, timeout):
+        """Send a profile's paste keystroke and wait for the text to be fetched.
+
+        Args:
+            profile: Dict with "strategy" and "delay"
+            timeout: Maximum seconds to wait for the fetch
+
+        Returns:
+            Tuple of (True if the focused application fetched the text,
+            seconds from the keystroke to the fetch or None)
+        """
+        if profile["delay"]:
+            time.sleep(profile["delay"])
+        # Only count fetches caused by the keystroke (clipboard managers fetch on ownership change)
+        self.selection_owner.served.clear()
+        start = time.perf_counter()
+        self._send_paste_keystroke(profile["strategy"])
+        if not self.selection_owner.wait_until_served(timeout):
+            return False, None
+        return True, time.perf_counter() - start
+
+    def _schedule_restore(self, previous_clipboard):
+        """Restore the clipboard after RESTORE_GRACE seconds unless another paste comes first.
+
+        Args:
+            previous_clipboard: Clipboard text from before the paste
+        """
+        def restore():
+            with self._restore_lock:
+                if self._pending_restore is not pending:
+                    return  # Taken over by a later paste
+                self._pending_restore = None
+                self.selection_owner.set_text(previous_clipboard, selections=("CLIPBOARD",))
+            print("Restored previous clipboard contents")
+
+        timer = threading.Timer(self.RESTORE_GRACE, restore)
+        timer.daemon = True
+        pending = (timer, previous_clipboard)
+        with self._restore_lock:
+            self._pending_restore = pending
+        timer.start()
+
+    def _cancel_restore(self):
+        """Cancel a deferred clipboard restore.
+
+        Returns:
+            The clipboard text it would have restored, or None if none was pending
+        """
+        with self._restore_lock:
+            pending, self._pending_restore = self._pending_restore, None
+        if pending is None:
+            return None
+        pending[0].cancel()
+        return pending[1]
+
+    def _paste_with_xclip(self, text, profile=None):
+        """Paste by copying with xclip and waiting a fixed delay.
+
+        Args:
+            text: String to paste at cursor position
+            profile: Profile from PasteProfiles.get for the keystroke and extra delay
+
+        Returns:
+            True if paste was successful, False otherwise
+        """
         try:
             # Save previous clipboard contents if restore is enabled
-            previous_clipboard = None
-            if self.restore_clipboard:
+            previous_clipboard = self._cancel_restore()
+            if previous_clipboard is None and self.restore_clipboard:
                 try:
                     previous_clipboard = pyperclip.paste()
                 except Exception as e:
@@ -75,15 +359,11 @@ class TextPaster:
             except Exception as e:
                 print(f"WARNING: Failed to copy to PRIMARY selection: {e}")
 
-            # Wait for clipboard to be ready
-            time.sleep(self.paste_delay)
-
-            # Simulate Shift+Insert keystroke
-            with self.keyboard.pressed(Key.shift):
-                self.keyboard.press(Key.insert)
-                self.keyboard.release(Key.insert)
+            # Wait for clipboard to be ready (and for the application, if it is slow)
+            time.sleep(max(self.paste_delay, profile["delay"] if profile else 0.0))
 
-            print("Simulated Shift+Insert keystroke")
+            # Simulate the paste keystroke
+            self._send_paste_keystroke(profile["strategy"] if profile else "shift_insert")
 
             # Optional: wait a bit before restoring clipboard to ensure paste completes
             if self.restore_clipboard and previous_clipboard is not None:
@@ -0,0 +1,66 @@
+"""Segment-by-segment pasting of transcriptions as they are decoded."""
+
+import queue
+import threading
+import time
+
+
+class ProgressivePaste:
+    """Pastes pieces of a transcription in order as they are decoded.
+
+    Pieces are pasted on a background thread, so the transcriber keeps
+    decoding while the focused application fetches the previous piece.
+    Pieces after the first are pasted with a leading space.
+    """
+
+    def __init__(self, paster, strategy=None):
+        """Initialize and start the paste thread.
+
+        Args:
+            paster: TextPaster used for each piece
+            strategy: Paste strategy for TextPaster.paste_text (None uses the application's)
+        """
+        self.paster = paster
+        self.strategy = strategy
+        self.parts = []
+        self.first_paste_at = None  # time.perf_counter() when the first piece was pasted
+        self._pieces = queue.Queue()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def add(self, text):
+        """Queue a piece of text for pasting.
+
+        Args:
+            text: Text of one segment
+        """
+        text = text.strip()
+        if not text:
+            return
+        self._pieces.put(text if not self.parts else " " + text)
+        self.parts.append(text)
+
+    @property
+    def text(self):
+        """Text queued so far, joined like a complete transcription."""
+        return " ".join(self.parts)
+
+    def finish(self):
+        """Wait until every queued piece has been pasted.
+
+        Returns:
+            The complete pasted text
+        """
+        self._pieces.put(None)
+        self._thread.join()
+        return self.text
+
+    def _run(self):
+        """Paste thread."""
+        while True:
+            piece = self._pieces.get()
+            if piece is None:
+                return
+            self.paster.paste_text(piece, strategy=self.strategy)
+            if self.first_paste_at is None:
+                self.first_paste_at = time.perf_counter()
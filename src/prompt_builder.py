@@ -0,0 +1,198 @@
+"""Context prompts built from the glossary and recent dictations."""
+
+import threading
+from collections import OrderedDict, namedtuple
+from datetime import datetime
+
+
+# Prompt text for the OpenAI API and token IDs for faster-whisper (None without a tokenizer)
+Prompt = namedtuple("Prompt", ["text", "tokens"])
+
+EMPTY_PROMPT = Prompt("", None)
+
+
+def estimate_tokens(text):
+    """Estimate the Whisper token count of text without a tokenizer.
+
+    English averages about four bytes per GPT-2 token; three keeps the
+    estimate on the safe side for names, numbers and non-ASCII text.
+
+    Args:
+        text: Prompt piece
+
+    Returns:
+        Estimated number of tokens
+    """
+    return -(-len(text.encode("utf-8")) // 3)
+
+
+class PromptBuilder:
+    """Builds the prompt that primes Whisper with vocabulary and context.
+
+    The prompt starts with the user's glossary and continues with the most
+    recent dictations, oldest first, so the text right before the new audio
+    is the last thing the model read. Whole dictations are added newest
+    first until the token budget is spent; the newest one is cut to its
+    last words if it does not fit on its own.
+
+    Pieces are tokenized once and the token IDs are kept in a small LRU,
+    so building the prompt for each dictation only tokenizes what is new.
+    """
+
+    # Tokenized pieces kept for reuse
+    TOKEN_CACHE_SIZE = 256
+
+    def __init__(self, history_manager, config):
+        """Initialize the prompt builder.
+
+        Args:
+            history_manager: HistoryManager providing recent dictations
+            config: Config object with the prompt settings
+        """
+        self.history_manager = history_manager
+        self.config = config
+        self._lock = threading.Lock()
+        self._tokenizer = None
+        self._tokens = OrderedDict()  # piece -> token IDs for self._tokenizer
+
+    def _encode(self, piece, tokenizer):
+        """Tokenize a prompt piece, reusing earlier results.
+
+        Args:
+            piece: Prompt piece (tokenized with a leading space, as Whisper does)
+            tokenizer: tokenizers.Tokenizer of the model
+
+        Returns:
+            List of token IDs
+        """
+        with self._lock:
+            if tokenizer is not self._tokenizer:
+                # Another model's vocabulary; earlier IDs do not apply
+                self._tokenizer = tokenizer
+                self._tokens.clear()
+            tokens = self._tokens.get(piece)
+            if tokens is not None:
+                self._tokens.move_to_end(piece)
+                return tokens
+
+        tokens = tokenizer.encode(" " + piece, add_special_tokens=False).ids
+
+        with self._lock:
+            if tokenizer is self._tokenizer:
+                self._tokens[piece] = tokens
+                if len(self._tokens) > self.TOKEN_CACHE_SIZE:
+                    self._tokens.popitem(last=False)
+        return tokens
+
+    def _count(self, piece, tokenizer):
+        """Count the tokens of a prompt piece."""
+        if tokenizer is None:
+            return estimate_tokens(" " + piece)
+        return len(self._encode(piece, tokenizer))
+
+    def _recent_texts(self, before):
+        """Get dictations usable as context, newest first.
+
+        Args:
+            before: History entry whose predecessors to use, or None for the latest
+
+        Returns:
+            List of dictation texts
+        """
+        entries = self.history_manager.get_entries()
+        if before is not None:
+            index = next((i for i, entry in enumerate(entries) if entry is before), None)
+            if index is None:
+                return []
+            entries = entries[index + 1:]
+            reference_time = self._parse_timestamp(before)
+        else:
+            reference_time = datetime.now()
+
+        max_age = self.config.get_prompt_history_max_age()
+        texts = []
+        for entry in entries:
+            timestamp = self._parse_timestamp(entry)
+            if reference_time is None or timestamp is None:
+                break
+            if (reference_time - timestamp).total_seconds() > max_age:
+                break  # Entries are newest first; the rest are older still
+            text = entry["text"].strip()
+            if text:
+                texts.append(text)
+        return texts
+
+    @staticmethod
+    def _parse_timestamp(entry):
+        try:
+            return datetime.strptime(entry["timestamp"], "%Y-%m-%d %H:%M:%S")
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def build(self, tokenizer=None, before=None):
+        """Build the prompt for the next transcription.
+
+        Args:
+            tokenizer: Model tokenizer (tokenizers.Tokenizer) to count tokens
+                exactly and return token IDs; None estimates the length and
+                returns text only
+            before: History entry being transcribed again; only dictations
+                older than it are used
+
+        Returns:
+            Prompt(text, tokens); text is empty when there is no context
+        """
+        if not self.config.is_context_prompt_enabled():
+            return EMPTY_PROMPT
+        budget = self.config.get_prompt_max_tokens()
+
+        pieces = []
+        remaining = budget
+
+        # Glossary first, dropping trailing terms that do not fit
+        terms = self.config.get_glossary()
+        while terms:
+            piece = f"Glossary: {', '.join(terms)}."
+            cost = self._count(piece, tokenizer)
+            if cost <= remaining:
+                pieces.append(piece)
+                remaining -= cost
+                break
+            terms = terms[:-1]
+
+        # Then the most recent dictations that fit
+        history = []
+        for text in self._recent_texts(before):
+            cost = self._count(text, tokenizer)
+            if cost > remaining:
+                if not history:
+                    history.append(self._tail(text, remaining, tokenizer))
+                break
+            history.append(text)
+            remaining -= cost
+        pieces.extend(piece for piece in reversed(history) if piece)
+
+        if not pieces:
+            return EMPTY_PROMPT
+        tokens = None
+        if tokenizer is not None:
+            tokens = [token for piece in pieces for token in self._encode(piece, tokenizer)]
+        return Prompt(" ".join(pieces), tokens)
+
+    def _tail(self, text, budget, tokenizer):
+        """Get the last words of text that fit in a token budget."""
+        words = text.split()
+        low, high = 0, len(words)
+        # Binary search for the longest fitting suffix; cuts are not cached
+        while low < high:
+            middle = (low + high) // 2
+            candidate = " ".join(words[middle:])
+            if tokenizer is None:
+                cost = estimate_tokens(" " + candidate)
+            else:
+                cost = len(tokenizer.encode(" " + candidate, add_special_tokens=False).ids)
+            if cost <= budget:
+                high = middle
+            else:
+                low = middle + 1
+        return " ".join(words[low:])
@@ -5,34 +5,57 @@ import numpy as np
 import wave
 import threading
 import time
+from collections import deque
 from pathlib import Path
 from datetime import datetime
 from .notifier import Notifier
 from .audio_feedback import AudioFeedback
+from .resampler import PolyphaseResampler
+from .audio_devices import resolve_input_device, descriptor_matches
 
 
 class AudioRecorder:
     """Records audio from microphone with toggle start/stop behavior."""
 
-    def __init__(self, sample_rate=16000, channels=1, max_duration=240, audio_feedback_enabled=True):
+    def __init__(self, sample_rate=16000, channels=1, max_duration=240, audio_feedback_enabled=True,
+                 device=None, device_cache=None, blocksize=0, latency="low"):
         """Initialize the audio recorder.
 
         Args:
-            sample_rate: Sample rate in Hz (default 16000 for Whisper compatibility)
+            sample_rate: Output sample rate in Hz (default 16000 for Whisper compatibility);
+                the device itself is opened at its native rate and resampled
             channels: Number of audio channels (1 for mono, 2 for stereo)
             max_duration: Maximum recording duration in seconds (default 240)
             audio_feedback_enabled: Whether to play beeps on start/stop (default True)
+            device: Input device name or index ("" or None for the system default)
+            device_cache: Previously resolved device descriptor (from Config) used
+                to open the stream without enumerating all devices
+            blocksize: Frames per audio callback (0 lets PortAudio pick the optimum)
+            latency: PortAudio latency hint, "low", "high" or seconds (default "low")
         """
         self.sample_rate = sample_rate
         self.channels = channels
         self.max_duration = max_duration
+        self.blocksize = blocksize
+        self.latency = latency
         self.is_recording = False
-        self.audio_data = []
+        self.audio_data = []  # int16 blocks at self.sample_rate
+        # Blocks of the last stopped recording; start_recording() starts a new
+        # list, so this stays intact while the recording is transcribed
+        self.last_recording = []
         self.recording_thread = None
         self.start_time = None
         self.notifier = Notifier()
         self.audio_feedback = AudioFeedback(enabled=audio_feedback_enabled)
         self.on_auto_stop_callback = None  # Callback for auto-stop events
+        self.device = device
+        self.device_descriptor = device_cache or {}
+        self.on_device_resolved_callback = None  # Callback to persist new descriptors
+        self.device_rate = None  # Native rate the input stream was opened at
+        self._raw_blocks = deque()  # Blocks from the audio callback awaiting resampling
+        self._resampler = None
+        self._callback_time = 0.0  # Seconds spent inside the audio callback
+        self._callback_count = 0
 
     def start_recording(self):
         """Start audio recording in a separate thread."""
@@ -72,6 +95,7 @@ class AudioRecorder:
         print(f"Recording stopped. Duration: {duration:.2f}s")
 
         # Save to temporary WAV file
+        self.last_recording = self.audio_data
         return self._save_to_wav()
 
     def toggle_recording(self):
@@ -86,7 +110,8 @@ class AudioRecorder:
         """Set callback function to be called when recording auto-stops.
 
         Args:
-            callback: Function that takes audio_file path as argument
+            callback: Function called with the audio file path and the
+                recording's int16 blocks (see last_recording)
         """
         self.on_auto_stop_callback = callback
 
@@ -103,6 +128,7 @@ class AudioRecorder:
         print(f"Recording auto-stopped. Duration: {duration:.2f}s")
 
         # Save to WAV file
+        blocks = self.last_recording = self.audio_data
         audio_file = self._save_to_wav()
 
         # Notify user that auto-stop occurred
@@ -114,26 +140,162 @@ class AudioRecorder:
 
         # Invoke callback to trigger transcription
         if self.on_auto_stop_callback and audio_file:
-            self.on_auto_stop_callback(audio_file)
+            self.on_auto_stop_callback(audio_file, blocks)
+
+    # Config keys handled by on_config_changed
+    CONFIG_KEYS = (
+        "max_duration_seconds", "audio_feedback_enabled", "input_device",
+        "audio_blocksize", "audio_latency",
+    )
+
+    def on_config_changed(self, changes):
+        """Apply changed settings; they take effect from the next recording.
+
+        Args:
+            changes: Dict of key -> ConfigChange from Config.subscribe
+        """
+        if "max_duration_seconds" in changes:
+            self.max_duration = changes["max_duration_seconds"].new_value
+        if "audio_feedback_enabled" in changes:
+            self.audio_feedback.set_enabled(changes["audio_feedback_enabled"].new_value)
+        if "input_device" in changes:
+            self.set_input_device(changes["input_device"].new_value)
+        if "audio_blocksize" in changes:
+            self.blocksize = changes["audio_blocksize"].new_value
+        if "audio_latency" in changes:
+            self.latency = changes["audio_latency"].new_value
+
+    def set_device_resolved_callback(self, callback):
+        """Set callback function to be called when the input device is re-resolved.
+
+        Args:
+            callback: Function that takes the new device descriptor dictionary
+        """
+        self.on_device_resolved_callback = callback
+
+    def set_input_device(self, device):
+        """Select a different input device for the next recording.
+
+        Args:
+            device: Input device name or index ("" or None for the system default)
+        """
+        if device != self.device:
+            self.device = device
+            self.device_descriptor = {}
+
+    def _resolve_device(self, force=False):
+        """Get the descriptor for the configured input device.
+
+        The cached descriptor is reused when it still matches, so starting a
+        recording normally costs a single device query instead of a full
+        PortAudio enumeration plus capability probe.
+
+        Args:
+            force: Ignore the cached descriptor and enumerate devices again
+
+        Returns:
+            Device descriptor dictionary
+        """
+        if not force and descriptor_matches(self.device_descriptor, self.device):
+            return self.device_descriptor
+
+        self.device_descriptor = resolve_input_device(self.device, self.channels)
+        print(f"Input device: {self.device_descriptor['name']} "
+              f"({self.device_descriptor['samplerate']} Hz)")
+
+        if self.on_device_resolved_callback:
+            self.on_device_resolved_callback(dict(self.device_descriptor))
+        return self.device_descriptor
+
+    def _open_stream(self, callback):
+        """Open an input stream on the configured device at its native rate.
+
+        Args:
+            callback: sounddevice stream callback
+
+        Returns:
+            sd.InputStream that has not been started yet
+        """
+        try:
+            descriptor = self._resolve_device()
+            stream = sd.InputStream(
+                device=descriptor['index'],
+                samplerate=descriptor['samplerate'],
+                channels=self.channels,
+                dtype='int16',
+                blocksize=self.blocksize,
+                latency=self.latency,
+                callback=callback
+            )
+        except Exception as e:
+            # Cached index may be stale after hotplug; enumerate once more
+            print(f"WARNING: Could not open cached input device ({e}), re-scanning devices")
+            descriptor = self._resolve_device(force=True)
+            stream = sd.InputStream(
+                device=descriptor['index'],
+                samplerate=descriptor['samplerate'],
+                channels=self.channels,
+                dtype='int16',
+                blocksize=self.blocksize,
+                latency=self.latency,
+                callback=callback
+            )
+
+        self.device_rate = descriptor['samplerate']
+        return stream
+
+    def _get_resampler(self, device_rate):
+        """Get a resampler from device_rate to self.sample_rate, reusing the last one.
+
+        Args:
+            device_rate: Native sample rate of the input stream
+
+        Returns:
+            PolyphaseResampler instance with its streaming state reset
+        """
+        if self._resampler is None or self._resampler.source_rate != device_rate:
+            self._resampler = PolyphaseResampler(device_rate, self.sample_rate, self.channels)
+        self._resampler.reset()
+        return self._resampler
+
+    def _drain_raw_blocks(self, resampler):
+        """Resample all blocks queued by the audio callback into audio_data.
+
+        Args:
+            resampler: PolyphaseResampler for the current stream
+        """
+        while self._raw_blocks:
+            block = self._raw_blocks.popleft()
+            resampled = resampler.process(block)
+            if len(resampled):
+                self.audio_data.append(resampled)
 
     def _record(self):
         """Internal method to record audio (runs in separate thread)."""
         def callback(indata, frames, time_info, status):
             """Callback function called by sounddevice for each audio block."""
+            started = time.perf_counter()
             if status:
                 print(f"Recording status: {status}")
-            self.audio_data.append(indata.copy())
+            self._raw_blocks.append(indata.copy())
+            self._callback_time += time.perf_counter() - started
+            self._callback_count += 1
+
+        self._raw_blocks.clear()
+        self._callback_time = 0.0
+        self._callback_count = 0
+        resampler = None
 
         try:
-            with sd.InputStream(
-                samplerate=self.sample_rate,
-                channels=self.channels,
-                callback=callback
-            ):
-                # Record until stopped or max duration reached
+            stream = self._open_stream(callback)
+            resampler = self._get_resampler(self.device_rate)
+            with stream:
+                # Record until stopped or max duration reached, resampling in
+                # the recording thread to keep the audio callback minimal
                 elapsed = 0
                 while self.is_recording and elapsed < self.max_duration:
                     time.sleep(0.1)
+                    self._drain_raw_blocks(resampler)
                     elapsed = time.time() - self.start_time
 
                 # Auto-stop if max duration reached
@@ -147,6 +309,64 @@ class AudioRecorder:
             print(f"Error during recording: {e}")
             self.is_recording = False
 
+        finally:
+            if resampler is not None:
+                # Pick up blocks delivered after the last poll and the filter tail
+                self._drain_raw_blocks(resampler)
+                tail = resampler.flush(dtype=np.int16)
+                if len(tail):
+                    self.audio_data.append(tail)
+                if not resampler.is_passthrough:
+                    print(f"Resampled {self.device_rate} Hz -> {self.sample_rate} Hz "
+                          f"(CPU: {resampler.cpu_time * 1000:.1f} ms)")
+                if self._callback_count:
+                    average_us = self._callback_time / self._callback_count * 1e6
+                    print(f"Audio callback: {self._callback_count} blocks, {average_us:.1f} us average")
+
+    def get_audio_int16(self, blocks=None):
+        """Get the last recording as a mono int16 array.
+
+        Args:
+            blocks: int16 blocks of a recording, such as last_recording
+                (defaults to the current recording's)
+
+        Returns:
+            1-D int16 numpy array, or None if nothing was recorded
+        """
+        blocks = self.audio_data if blocks is None else blocks
+        if not blocks:
+            return None
+
+        audio = np.concatenate(blocks, axis=0)
+        if self.channels > 1:
+            audio = np.rint(audio.mean(axis=1)).astype(np.int16)
+        return audio.reshape(-1)
+
+    def get_audio_float32(self, blocks=None):
+        """Get the last recording as a mono float32 array in [-1, 1].
+
+        This is the input format faster-whisper expects, so the local
+        transcriber can skip decoding the WAV file. The conversion only
+        happens when this is called; the WAV path never touches floats.
+
+        Args:
+            blocks: int16 blocks of a recording, such as last_recording
+                (defaults to the current recording's)
+
+        Returns:
+            1-D float32 numpy array, or None if nothing was recorded
+        """
+        blocks = self.audio_data if blocks is None else blocks
+        if not blocks:
+            return None
+
+        audio = np.concatenate(blocks, axis=0)
+        if self.channels > 1:
+            audio = audio.mean(axis=1)
+        audio = audio.reshape(-1).astype(np.float32)
+        audio *= 1.0 / 32768.0
+        return audio
+
     def _save_to_wav(self):
         """Save recorded audio data to WAV file in /tmp/ directory.
 
@@ -158,8 +378,7 @@ class AudioRecorder:
             self.notifier.notify_no_audio()
             return None
 
-        # Concatenate all audio chunks
-        audio_array = np.concatenate(self.audio_data, axis=0)
+        started = time.perf_counter()
 
         # Generate unique filename with timestamp
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -171,11 +390,12 @@ class AudioRecorder:
                 wf.setnchannels(self.channels)
                 wf.setsampwidth(2)  # 16-bit audio
                 wf.setframerate(self.sample_rate)
-                # Convert float32 to int16
-                audio_int16 = (audio_array * 32767).astype(np.int16)
-                wf.writeframes(audio_int16.tobytes())
+                # Blocks are already int16 PCM; write them without concatenating
+                for block in self.audio_data:
+                    wf.writeframesraw(np.ascontiguousarray(block))
 
-            print(f"Audio saved to: {filepath}")
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            print(f"Audio saved to: {filepath} ({elapsed_ms:.1f} ms)")
             return str(filepath)
 
         except Exception as e:
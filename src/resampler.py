@@ -0,0 +1,145 @@
+"""Streaming polyphase resampler for converting microphone audio to 16 kHz."""
+
+import math
+import time
+import numpy as np
+
+
+class PolyphaseResampler:
+    """Resamples audio blocks between two fixed rates using a polyphase FIR filter.
+
+    The filter bank is designed once per rate pair and every block is processed
+    with a single vectorized gather + dot product, so the CPU cost is linear in
+    the number of output samples and does not depend on block size.
+    """
+
+    # Half filter length in multiples of max(up, down), matches scipy.signal.resample_poly
+    HALF_LENGTH_FACTOR = 10
+    # Kaiser window shape parameter (same default as scipy.signal.resample_poly)
+    KAISER_BETA = 5.0
+
+    def __init__(self, source_rate, target_rate=16000, channels=1):
+        """Initialize the resampler.
+
+        Args:
+            source_rate: Sample rate of the incoming audio in Hz
+            target_rate: Sample rate of the produced audio in Hz (default 16000)
+            channels: Number of interleaved channels in each block
+        """
+        self.source_rate = int(source_rate)
+        self.target_rate = int(target_rate)
+        self.channels = channels
+
+        divisor = math.gcd(self.source_rate, self.target_rate)
+        self.up = self.target_rate // divisor
+        self.down = self.source_rate // divisor
+
+        self._bank, self._half_len = self._design_filter_bank()
+        self.taps = self._bank.shape[1]
+
+        self.reset()
+
+    def _design_filter_bank(self):
+        """Design the Kaiser-windowed sinc lowpass and split it into phases.
+
+        Returns:
+            Tuple of (bank, half_len) where bank has shape (up, taps) with each
+            row reversed so it can be applied with a plain dot product
+        """
+        max_rate = max(self.up, self.down)
+        half_len = self.HALF_LENGTH_FACTOR * max_rate
+        length = 2 * half_len + 1
+
+        cutoff = 1.0 / max_rate  # Normalized to the upsampled Nyquist frequency
+        n = np.arange(length) - half_len
+        prototype = cutoff * np.sinc(cutoff * n) * np.kaiser(length, self.KAISER_BETA)
+        prototype *= self.up / prototype.sum()  # Unity DC gain after zero-stuffing
+
+        taps = -(-length // self.up)
+        padded = np.zeros(taps * self.up)
+        padded[:length] = prototype
+
+        # bank[p, k] = h[p + k * up]; reverse taps so windows are dotted oldest-first
+        bank = padded.reshape(taps, self.up).T[:, ::-1]
+        return np.ascontiguousarray(bank, dtype=np.float32), half_len
+
+    def reset(self):
+        """Clear streaming state so the next block starts a new recording."""
+        self._history = np.zeros((self.taps - 1, self.channels), dtype=np.float32)
+        self._samples_in = 0  # Input samples consumed so far
+        self._samples_out = 0  # Output samples produced so far
+        self.cpu_time = 0.0  # Seconds spent inside process()/flush()
+
+    @property
+    def is_passthrough(self):
+        """True when source and target rates match and no work is needed."""
+        return self.up == self.down
+
+    def process(self, block):
+        """Resample one block of audio.
+
+        int16 blocks are filtered on their raw sample values and returned as
+        int16, so captured PCM never needs to be rescaled to [-1, 1].
+
+        Args:
+            block: numpy array of shape (frames, channels) or (frames,)
+
+        Returns:
+            numpy array of shape (frames_out, channels), int16 for int16 input
+            and float32 otherwise
+        """
+        block = np.asarray(block).reshape(-1, self.channels)
+        if self.is_passthrough:
+            self._samples_in += len(block)
+            self._samples_out += len(block)
+            return block
+
+        started = time.perf_counter()
+
+        buffer = np.concatenate((self._history, block.astype(np.float32, copy=False)), axis=0)
+        buffer_start = self._samples_in - len(self._history)
+        self._samples_in += len(block)
+
+        # Output n is centred on upsampled index n * down + half_len
+        end = -(-(self._samples_in * self.up - self._half_len) // self.down)
+        n = np.arange(self._samples_out, max(end, self._samples_out))
+        position = n * self.down + self._half_len
+        newest = position // self.up - buffer_start
+        phases = position % self.up
+
+        # windows[j] covers buffer[j:j + taps] for every channel
+        windows = np.lib.stride_tricks.sliding_window_view(buffer, self.taps, axis=0)
+        output = np.einsum('nct,nt->nc', windows[newest - self.taps + 1], self._bank[phases])
+
+        self._samples_out += len(n)
+        self._history = buffer[len(buffer) - (self.taps - 1):]
+
+        if block.dtype == np.int16:
+            output = np.clip(np.rint(output), -32768, 32767).astype(np.int16)
+        else:
+            output = output.astype(np.float32, copy=False)
+
+        self.cpu_time += time.perf_counter() - started
+        return output
+
+    def flush(self, dtype=np.float32):
+        """Emit the samples still held back by the filter delay.
+
+        Args:
+            dtype: Sample type of the stream, np.int16 or np.float32
+
+        Returns:
+            numpy array of shape (frames_out, channels) with the given dtype
+        """
+        if self.is_passthrough:
+            return np.zeros((0, self.channels), dtype=dtype)
+
+        expected = -(-self._samples_in * self.up // self.down)
+        real_in = self._samples_in
+        padding = np.zeros((self._half_len // self.up + 1, self.channels), dtype=dtype)
+        tail = self.process(padding)
+        self._samples_in = real_in
+
+        remaining = max(expected - (self._samples_out - len(tail)), 0)
+        self._samples_out = expected
+        return tail[:remaining]
@@ -0,0 +1,139 @@
+"""Background re-transcription of archived history recordings."""
+
+import functools
+import queue
+import tempfile
+import threading
+import time
+import wave
+from pathlib import Path
+
+
+# Profiles offered in the history window, from fastest to most accurate
+DEFAULT_PROFILES = [
+    {"name": "Online (configured endpoint)", "provider": "openai"},
+    {"name": "Local (configured model)", "provider": "local", "model": None},
+    {"name": "Local tiny.en (fastest)", "provider": "local", "model": "tiny.en"},
+    {"name": "Local base.en", "provider": "local", "model": "base.en"},
+    {"name": "Local small.en", "provider": "local", "model": "small.en"},
+    {"name": "Local large-v3 (accurate)", "provider": "local", "model": "large-v3"},
+]
+
+
+class Retranscriber:
+    """Runs archived recordings through another provider or model.
+
+    Jobs are processed one at a time on a background thread, so comparing
+    profiles on past dictations never blocks the hotkey. Each result is
+    handed to the job's callback as soon as it is ready.
+
+    A profile is a dictionary with a display "name", a "provider"
+    ("openai" or "local") and, for local profiles, an optional "model"
+    (path or model ID; None means the configured model).
+    """
+
+    def __init__(self, archive, transcriber_for, prompt_builder=None):
+        """Initialize the re-transcriber. The worker starts on first submit.
+
+        Args:
+            archive: AudioArchive holding the recordings
+            transcriber_for: Function taking a profile and returning a
+                WhisperTranscriber or LocalTranscriber
+            prompt_builder: Optional PromptBuilder; each entry is prompted
+                with the dictations that came before it
+        """
+        self.archive = archive
+        self.transcriber_for = transcriber_for
+        self.prompt_builder = prompt_builder
+        self._jobs = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def can_retranscribe(self, entry):
+        """Check whether an entry still has its recording.
+
+        Args:
+            entry: History entry dictionary
+
+        Returns:
+            True if the recording is in the archive
+        """
+        return "audio" in entry and self.archive.contains(entry["audio"])
+
+    def submit(self, entry, profile, on_result):
+        """Queue one entry for re-transcription.
+
+        Args:
+            entry: History entry dictionary with an "audio" reference
+            profile: Profile dictionary to transcribe with
+            on_result: Called from the worker thread as
+                on_result(entry, profile, text, seconds, error)
+        """
+        self._jobs.put((entry, profile, on_result))
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+
+    def pending(self):
+        """Number of jobs waiting to run."""
+        return self._jobs.qsize()
+
+    def _run(self):
+        """Worker loop."""
+        while True:
+            entry, profile, on_result = self._jobs.get()
+            started = time.perf_counter()
+            text = None
+            error = None
+            try:
+                text = self._transcribe(entry, profile)
+                if text is None:
+                    error = "Transcription failed"
+            except Exception as e:
+                error = str(e)
+            seconds = time.perf_counter() - started
+
+            try:
+                on_result(entry, profile, text, seconds, error)
+            except Exception as e:
+                print(f"WARNING: Re-transcription result handler failed: {e}")
+
+    def _transcribe(self, entry, profile):
+        """Decode an entry's recording and transcribe it with a profile.
+
+        Args:
+            entry: History entry dictionary
+            profile: Profile dictionary
+
+        Returns:
+            Transcribed text, or None if transcription failed
+        """
+        samples = self.archive.read_audio(entry.get("audio"))
+        if samples is None:
+            raise RuntimeError("Recording is no longer in the archive")
+
+        sample_rate = entry["audio"].get("sample_rate", 16000)
+        with tempfile.NamedTemporaryFile(prefix="voice_retranscribe_", suffix=".wav", delete=False) as f:
+            audio_path = Path(f.name)
+        with wave.open(str(audio_path), 'wb') as wav_file:
+            wav_file.setnchannels(1)
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(sample_rate)
+            wav_file.writeframes(samples.tobytes())
+
+        prompt = None
+        if self.prompt_builder is not None:
+            prompt = functools.partial(self.prompt_builder.build, before=entry)
+
+        try:
+            transcriber = self.transcriber_for(profile)
+            if profile["provider"] == "local":
+                return transcriber.transcribe(
+                    str(audio_path), audio=samples.astype("float32") / 32768.0, prompt=prompt
+                )
+            return transcriber.transcribe(str(audio_path), prompt=prompt)
+        finally:
+            # Transcribers normally delete the file themselves
+            if audio_path.exists():
+                audio_path.unlink()
@@ -0,0 +1,261 @@
+"""Persistent X11 selection owner for serving CLIPBOARD and PRIMARY in-process."""
+
+import os
+import queue
+import select
+import threading
+
+try:
+    from Xlib import X, Xatom, display as xdisplay
+    from Xlib.protocol import event as xevent
+    XLIB_AVAILABLE = True
+except ImportError:
+    XLIB_AVAILABLE = False
+
+
+class SelectionOwner:
+    """Owns the CLIPBOARD and PRIMARY selections from a background thread.
+
+    Replaces spawning xclip for every dictation: the text is served directly
+    to pasting applications over a single long-lived X connection. All X calls
+    happen on the owner thread; other threads talk to it through a command
+    queue and wait on events, so callers learn exactly when ownership is
+    established and when an application has fetched the text.
+
+    Note that selections owned by this process disappear when it exits.
+    """
+
+    # Text targets we can convert to, in order of preference
+    TEXT_TARGETS = ("UTF8_STRING", "text/plain;charset=utf-8", "STRING", "TEXT", "text/plain")
+
+    def __init__(self, display_name=None):
+        """Connect to the X server and start the owner thread.
+
+        Args:
+            display_name: X display to use (defaults to $DISPLAY)
+
+        Raises:
+            RuntimeError: If python-xlib is missing or the display cannot be opened
+        """
+        if not XLIB_AVAILABLE:
+            raise RuntimeError("python-xlib is not installed")
+
+        try:
+            self.display = xdisplay.Display(display_name)
+        except Exception as e:
+            raise RuntimeError(f"Cannot open X display: {e}")
+
+        screen = self.display.screen()
+        self.window = screen.root.create_window(0, 0, 1, 1, 0, X.CopyFromParent)
+
+        atom = self.display.intern_atom
+        self.atoms = {
+            "CLIPBOARD": atom("CLIPBOARD"),
+            "PRIMARY": Xatom.PRIMARY,
+            "TARGETS": atom("TARGETS"),
+            "INCR": atom("INCR"),
+            "VOICE_CTRL_SELECTION": atom("VOICE_CTRL_SELECTION"),
+        }
+        self.text_atoms = [atom(name) for name in self.TEXT_TARGETS]
+
+        self._texts = {}  # selection atom -> bytes currently served
+        self._commands = queue.Queue()
+        self._wake_read, self._wake_write = os.pipe()
+        self._pending_read = None  # (result dict, threading.Event) for convert_selection
+        self.served = threading.Event()  # Set whenever an app fetches text from us
+
+        self._running = True
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def _call(self, command, *args, timeout=1.0):
+        """Run a command on the owner thread and wait for its result.
+
+        Args:
+            command: Bound method to run on the owner thread
+            *args: Arguments for the command
+            timeout: Seconds to wait for completion
+
+        Returns:
+            Command result, or None on timeout
+        """
+        done = threading.Event()
+        result = {}
+        self._commands.put((command, args, result, done))
+        os.write(self._wake_write, b"x")
+        if not done.wait(timeout):
+            return None
+        return result.get("value")
+
+    def set_text(self, text, selections=("CLIPBOARD", "PRIMARY"), timeout=1.0):
+        """Take ownership of the selections and serve text from them.
+
+        Returns only after the X server confirms ownership, so the caller can
+        paste immediately instead of sleeping.
+
+        Args:
+            text: String to serve
+            selections: Selection names to own
+            timeout: Seconds to wait for confirmation
+
+        Returns:
+            True if all selections are owned, False otherwise
+        """
+        self.served.clear()
+        return bool(self._call(self._do_set_text, text.encode("utf-8"), selections, timeout=timeout))
+
+    def get_clipboard_text(self, timeout=0.5):
+        """Read the current CLIPBOARD contents over the owner's connection.
+
+        Args:
+            timeout: Seconds to wait for the owning application to answer
+
+        Returns:
+            Clipboard text, or None if empty or unavailable
+        """
+        done = threading.Event()
+        result = {}
+        if self._call(self._do_request_clipboard, result, done, timeout=timeout) is None:
+            return None
+        if not done.wait(timeout):
+            return None
+        return result.get("text")
+
+    def wait_until_served(self, timeout):
+        """Wait for an application to fetch the text set by the last set_text().
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if the text was fetched, False on timeout
+        """
+        return self.served.wait(timeout)
+
+    def close(self):
+        """Stop the owner thread and close the X connection."""
+        if not self._running:
+            return
+        self._running = False
+        os.write(self._wake_write, b"x")
+        self.thread.join(timeout=1.0)
+        try:
+            self.display.close()
+        except Exception:
+            pass
+        os.close(self._wake_read)
+        os.close(self._wake_write)
+
+    # --- Owner thread ---
+
+    def _run(self):
+        """Event loop: serve selection requests and run queued commands."""
+        fileno = self.display.fileno()
+        while self._running:
+            try:
+                readable, _, _ = select.select([fileno, self._wake_read], [], [])
+                if self._wake_read in readable:
+                    os.read(self._wake_read, 1024)
+                self._run_commands()
+                while self.display.pending_events():
+                    self._handle_event(self.display.next_event())
+            except Exception as e:
+                print(f"WARNING: Selection owner error: {e}")
+
+    def _run_commands(self):
+        """Execute commands queued by other threads."""
+        while True:
+            try:
+                command, args, result, done = self._commands.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                result["value"] = command(*args)
+            except Exception as e:
+                print(f"WARNING: Selection owner command failed: {e}")
+                result["value"] = False
+            done.set()
+
+    def _do_set_text(self, data, selections):
+        """Own the given selections with data (owner thread)."""
+        owned = True
+        for name in selections:
+            selection = self.atoms[name]
+            self._texts[selection] = data
+            self.window.set_selection_owner(selection, X.CurrentTime)
+            if self.display.get_selection_owner(selection) != self.window:
+                owned = False
+        self.display.flush()
+        return owned
+
+    def _do_request_clipboard(self, result, done):
+        """Ask the CLIPBOARD owner to convert its contents (owner thread)."""
+        clipboard = self.atoms["CLIPBOARD"]
+        owner = self.display.get_selection_owner(clipboard)
+
+        if owner == self.window and clipboard in self._texts:
+            result["text"] = self._texts[clipboard].decode("utf-8", "replace")
+            done.set()
+        elif owner == X.NONE:
+            done.set()
+        else:
+            self._pending_read = (result, done)
+            self.window.convert_selection(
+                clipboard, self.text_atoms[0], self.atoms["VOICE_CTRL_SELECTION"], X.CurrentTime
+            )
+            self.display.flush()
+        return True
+
+    def _handle_event(self, event):
+        """Dispatch a single X event (owner thread)."""
+        if event.type == X.SelectionRequest:
+            self._serve_request(event)
+        elif event.type == X.SelectionClear:
+            # Another application took the selection; stop serving it
+            self._texts.pop(event.atom, None)
+        elif event.type == X.SelectionNotify and self._pending_read is not None:
+            self._finish_read(event)
+
+    def _serve_request(self, event):
+        """Answer a SelectionRequest from a pasting application."""
+        data = self._texts.get(event.selection)
+        prop = event.property if event.property != X.NONE else event.target
+
+        if data is None:
+            prop = X.NONE
+        elif event.target == self.atoms["TARGETS"]:
+            event.requestor.change_property(
+                prop, Xatom.ATOM, 32, [self.atoms["TARGETS"]] + self.text_atoms
+            )
+        elif event.target in self.text_atoms:
+            event.requestor.change_property(prop, event.target, 8, data)
+            self.served.set()
+        else:
+            prop = X.NONE
+
+        notify = xevent.SelectionNotify(
+            time=event.time,
+            requestor=event.requestor,
+            selection=event.selection,
+            target=event.target,
+            property=prop
+        )
+        event.requestor.send_event(notify)
+        self.display.flush()
+
+    def _finish_read(self, event):
+        """Complete a pending get_clipboard_text() from a SelectionNotify."""
+        result, done = self._pending_read
+        self._pending_read = None
+        try:
+            if event.property != X.NONE:
+                reply = self.window.get_full_property(event.property, X.AnyPropertyType)
+                self.window.delete_property(event.property)
+                # Incremental transfers are not supported; treat as unavailable
+                if reply is not None and reply.property_type != self.atoms["INCR"]:
+                    value = reply.value
+                    if isinstance(value, bytes):
+                        value = value.decode("utf-8", "replace")
+                    result["text"] = value
+        finally:
+            done.set()
@@ -9,20 +9,28 @@ import os
 import subprocess
 import pyperclip
 from .model_scanner import ModelScanner
+from .transcriber import probe_endpoint
+from .config import Config
+from .compute_types import CPU_COMPUTE_TYPES
+from .ui_thread import get_ui_thread
 
 
 class SettingsWindow:
     """Manages the settings GUI window."""
 
-    def __init__(self, config, recorder=None):
+    DEFAULT_DEVICE_LABEL = "System Default"
+
+    def __init__(self, config, recorder=None, transcriber=None):
         """Initialize the settings window.
 
         Args:
             config: Config instance containing current settings
             recorder: AudioRecorder instance for test recording (optional)
+            transcriber: WhisperTranscriber whose request latencies are shown (optional)
         """
         self.config = config
         self.recorder = recorder
+        self.transcriber = transcriber
         self.window = None
         self.entry_widgets = {}
         self.model_scanner = ModelScanner(log_path=config.log_path)
@@ -30,15 +38,20 @@ class SettingsWindow:
         self.selected_model_path = None  # Will be initialized when window is created
 
     def show(self):
-        """Show the settings window."""
+        """Show the settings window (returns immediately; safe from any thread)."""
+        get_ui_thread().call(self._show)
+
+    def _show(self):
+        """Create the settings window, or raise it if already open (on the UI thread)."""
         if self.window is not None:
             # Window already exists, bring it to front
+            self.window.deiconify()
             self.window.lift()
             self.window.focus_force()
             return
 
         # Create new window
-        self.window = tk.Tk()
+        self.window = tk.Toplevel(get_ui_thread().root)
         self.window.title("Voice Control Settings")
         self.window.geometry("800x700")
         self.window.resizable(False, False)
@@ -112,9 +125,6 @@ class SettingsWindow:
         # Handle window close
         self.window.protocol("WM_DELETE_WINDOW", self._close_window)
 
-        # Run the window
-        self.window.mainloop()
-
     def _create_general_tab(self, parent):
         """Create the General settings tab.
 
@@ -165,6 +175,23 @@ class SettingsWindow:
         audio_feedback_check.grid(row=row, column=1, sticky=tk.W, pady=8, padx=(15, 0))
         self.entry_widgets['audio_feedback_enabled'] = audio_feedback_var
 
+        # Input Device
+        row += 1
+        ttk.Label(parent, text="Input Device:").grid(
+            row=row, column=0, sticky=tk.W, pady=8
+        )
+        current_device = self.config.get_input_device()
+        device_var = tk.StringVar(value=str(current_device) if current_device != "" else self.DEFAULT_DEVICE_LABEL)
+        device_combo = ttk.Combobox(
+            parent,
+            textvariable=device_var,
+            values=[self.DEFAULT_DEVICE_LABEL] + self._get_input_device_names(),
+            state="readonly",
+            width=40
+        )
+        device_combo.grid(row=row, column=1, sticky=tk.W, pady=8, padx=(15, 0))
+        self.entry_widgets['input_device'] = device_var
+
         # Keyboard Shortcut
         row += 1
         ttk.Label(parent, text="Keyboard Shortcut:").grid(
@@ -189,16 +216,29 @@ class SettingsWindow:
         autostart_check.grid(row=row, column=1, sticky=tk.W, pady=8, padx=(15, 0))
         self.entry_widgets['autostart_enabled'] = autostart_var
 
-        # Note about restart
+        # Note about applying changes
         row += 1
         note_label = ttk.Label(
             parent,
-            text="Note: Changes to keyboard shortcut or STT provider require app restart",
+            text="Note: Changes take effect as soon as they are saved",
             font=("", 9, "italic"),
             foreground="gray"
         )
         note_label.grid(row=row, column=0, columnspan=2, pady=(20, 0))
 
+    def _get_input_device_names(self):
+        """Get the names of all available input devices.
+
+        Returns:
+            List of device name strings (empty if devices cannot be queried)
+        """
+        try:
+            from .audio_devices import list_input_devices
+            return [name for _, name in list_input_devices()]
+        except Exception as e:
+            print(f"WARNING: Could not list input devices: {e}")
+            return []
+
     def _create_online_tab(self, parent):
         """Create the Online STT settings tab.
 
@@ -229,6 +269,116 @@ class SettingsWindow:
         )
         help_text.grid(row=row, column=0, columnspan=2, sticky=tk.W, pady=(0, 5))
 
+        # Endpoint Section
+        row += 1
+        ttk.Label(parent, text="Endpoint:", font=("", 10, "bold")).grid(
+            row=row, column=0, columnspan=2, sticky=tk.W, pady=(15, 5)
+        )
+
+        row += 1
+        ttk.Label(parent, text="Server URL:").grid(
+            row=row, column=0, sticky=tk.W, pady=8
+        )
+        base_url_entry = ttk.Entry(parent, width=40)
+        base_url_entry.insert(0, self.config.get_openai_base_url())
+        base_url_entry.grid(row=row, column=1, sticky=(tk.W, tk.E), pady=8, padx=(15, 0))
+        self.entry_widgets['openai_base_url'] = base_url_entry
+
+        row += 1
+        ttk.Label(
+            parent,
+            text="Leave empty for OpenAI, or enter an OpenAI-compatible server, e.g. http://gpu-box.lan:8000/v1",
+            font=("", 9, "italic"),
+            foreground="gray"
+        ).grid(row=row, column=0, columnspan=2, sticky=tk.W, pady=(0, 5))
+
+        row += 1
+        ttk.Label(parent, text="Model:").grid(
+            row=row, column=0, sticky=tk.W, pady=8
+        )
+        model_entry = ttk.Entry(parent, width=30)
+        model_entry.insert(0, self.config.get_openai_model())
+        model_entry.grid(row=row, column=1, sticky=tk.W, pady=8, padx=(15, 0))
+        self.entry_widgets['openai_model'] = model_entry
+
+        row += 1
+        ttk.Label(parent, text="Request Timeout (seconds):").grid(
+            row=row, column=0, sticky=tk.W, pady=8
+        )
+        timeout_entry = ttk.Entry(parent, width=10)
+        timeout_entry.insert(0, str(self.config.get_openai_timeout()))
+        timeout_entry.grid(row=row, column=1, sticky=tk.W, pady=8, padx=(15, 0))
+        self.entry_widgets['openai_timeout_seconds'] = timeout_entry
+
+        row += 1
+        ttk.Label(parent, text="Extra Header:").grid(
+            row=row, column=0, sticky=tk.W, pady=8
+        )
+        header_entry = ttk.Entry(parent, show="*", width=40)
+        header_entry.insert(0, self.config.settings.get("openai_auth_header", ""))
+        header_entry.grid(row=row, column=1, sticky=(tk.W, tk.E), pady=8, padx=(15, 0))
+        self.entry_widgets['openai_auth_header'] = header_entry
+
+        row += 1
+        ttk.Label(
+            parent,
+            text='Optional, sent with every request, e.g. "X-Api-Key: secret"',
+            font=("", 9, "italic"),
+            foreground="gray"
+        ).grid(row=row, column=0, columnspan=2, sticky=tk.W, pady=(0, 5))
+
+        # Health probe and measured latency
+        row += 1
+        test_button = ttk.Button(parent, text="Test Connection", command=self._probe_endpoint)
+        test_button.grid(row=row, column=0, sticky=tk.W, pady=8)
+        self.probe_label = ttk.Label(parent, text="")
+        self.probe_label.grid(row=row, column=1, sticky=tk.W, pady=8, padx=(15, 0))
+
+        row += 1
+        ttk.Label(parent, text="Recent Requests:").grid(
+            row=row, column=0, sticky=tk.W, pady=8
+        )
+        ttk.Label(parent, text=self._latency_text()).grid(
+            row=row, column=1, sticky=tk.W, pady=8, padx=(15, 0)
+        )
+
+    def _latency_text(self):
+        """Describe the latency of recent transcription requests."""
+        if self.transcriber is None:
+            return "Not available"
+        stats = self.transcriber.latency_stats()
+        if not stats["count"]:
+            return "No requests yet"
+        return (
+            f"{stats['count']} requests: median {stats['p50']:.0f} ms, "
+            f"p95 {stats['p95']:.0f} ms, last {stats['last']:.0f} ms"
+        )
+
+    def _probe_endpoint(self):
+        """Check the endpoint entered in the Online tab without saving it."""
+        base_url = self.entry_widgets['openai_base_url'].get().strip().rstrip("/")
+        api_key = self.entry_widgets['api_key'].get().strip()
+        headers = {}
+        name, separator, value = self.entry_widgets['openai_auth_header'].get().partition(":")
+        if separator and name.strip():
+            headers[name.strip()] = value.strip()
+        self.probe_label.config(text="Testing...")
+
+        def probe_worker():
+            result = probe_endpoint(base_url, api_key, headers)
+            if result["latency_ms"] is not None:
+                text = f"{result['detail']} ({result['latency_ms']:.0f} ms)"
+            else:
+                text = result["detail"]
+            get_ui_thread().call(self._show_probe_result, text)
+
+        threading.Thread(target=probe_worker, daemon=True).start()
+
+    def _show_probe_result(self, text):
+        """Show the probe result if the window is still open (on the UI thread)."""
+        if self.window is not None:
+            self.probe_label.config(text=text)
+
     def _create_local_tab(self, parent):
         """Create the Local STT settings tab.
 
@@ -248,13 +398,29 @@ class SettingsWindow:
         engine_combo = ttk.Combobox(
             parent,
             textvariable=engine_var,
-            values=["faster-whisper"],
+            values=list(Config.LOCAL_ENGINES),
             state="readonly",
             width=25
         )
         engine_combo.grid(row=row, column=1, sticky=tk.W, pady=8, padx=(15, 0))
         self.entry_widgets['local_engine'] = engine_var
 
+        # Compute type (faster-whisper only)
+        row += 1
+        ttk.Label(parent, text="Compute Type:").grid(
+            row=row, column=0, sticky=tk.W, pady=8
+        )
+        compute_type_var = tk.StringVar(value=self.config.get_local_compute_type())
+        compute_type_combo = ttk.Combobox(
+            parent,
+            textvariable=compute_type_var,
+            values=["auto"] + list(CPU_COMPUTE_TYPES),
+            state="readonly",
+            width=25
+        )
+        compute_type_combo.grid(row=row, column=1, sticky=tk.W, pady=8, padx=(15, 0))
+        self.entry_widgets['local_compute_type'] = compute_type_var
+
         # Model Selection Section
         row += 1
         ttk.Label(parent, text="Model Selection:", font=("", 10, "bold")).grid(
@@ -386,11 +552,11 @@ class SettingsWindow:
         if path:
             try:
                 pyperclip.copy(path)
-                messagebox.showinfo("Copied", "Model path copied to clipboard!")
+                messagebox.showinfo("Copied", "Model path copied to clipboard!", parent=self.window)
             except Exception as e:
-                messagebox.showerror("Copy Failed", f"Failed to copy path: {str(e)}")
+                messagebox.showerror("Copy Failed", f"Failed to copy path: {str(e)}", parent=self.window)
         else:
-            messagebox.showwarning("No Path", "No model path selected")
+            messagebox.showwarning("No Path", "No model path selected", parent=self.window)
 
     def _on_model_selected(self, event):
         """Handle model selection from listbox.
@@ -404,6 +570,9 @@ class SettingsWindow:
             if index < len(self.discovered_models):
                 model = self.discovered_models[index]
                 self.selected_model_path.set(model['path'])
+                # ggml files only load with whisper.cpp, model directories with faster-whisper
+                if model.get('engine'):
+                    self.entry_widgets['local_engine'].set(model['engine'])
 
     def _refresh_model_list(self):
         """Refresh the model list, removing non-existent models."""
@@ -422,12 +591,14 @@ class SettingsWindow:
             messagebox.showinfo(
                 "List Refreshed",
                 f"Removed {removed_count} model(s) that no longer exist.\n"
-                f"{len(valid_models)} model(s) remaining."
+                f"{len(valid_models)} model(s) remaining.",
+                parent=self.window
             )
         else:
             messagebox.showinfo(
                 "List Refreshed",
-                f"All {len(valid_models)} model(s) are still valid."
+                f"All {len(valid_models)} model(s) are still valid.",
+                parent=self.window
             )
 
     def _download_model(self):
@@ -437,7 +608,8 @@ class SettingsWindow:
             messagebox.showwarning(
                 "No Model ID",
                 "Please enter a model ID to download.\n\n"
-                "Examples: base, small, medium, large-v2"
+                "Examples: base, small, medium, large-v2",
+                parent=self.window
             )
             return
 
@@ -447,7 +619,8 @@ class SettingsWindow:
             f"This will download model: {model_id}\n\n"
             "The download may take several minutes depending on model size.\n"
             "The model will be downloaded to ~/.cache/huggingface/\n\n"
-            "Continue?"
+            "Continue?",
+            parent=self.window
         )
 
         if not response:
@@ -461,11 +634,12 @@ class SettingsWindow:
                 from .config import Config
 
                 # Show progress message
-                self.window.after(0, lambda: messagebox.showinfo(
+                get_ui_thread().call(lambda: messagebox.showinfo(
                     "Downloading",
                     f"Downloading model {model_id}...\n"
                     "This window will show another message when complete.\n"
-                    "Please wait, this may take several minutes."
+                    "Please wait, this may take several minutes.",
+                    parent=self.window
                 ))
 
                 # Create a temporary config with the model_id to download
@@ -482,11 +656,11 @@ class SettingsWindow:
                     raise Exception("Model download or loading failed")
 
                 # Success - update UI
-                self.window.after(0, lambda: self._on_download_complete(model_id, success=True))
+                get_ui_thread().call(self._on_download_complete, model_id, success=True)
 
             except Exception as e:
                 error_msg = str(e)
-                self.window.after(0, lambda: self._on_download_complete(model_id, success=False, error=error_msg))
+                get_ui_thread().call(self._on_download_complete, model_id, success=False, error=error_msg)
 
         thread = threading.Thread(target=download_worker, daemon=True)
         thread.start()
@@ -499,12 +673,16 @@ class SettingsWindow:
             success: Whether download succeeded
             error: Error message if failed
         """
+        if self.window is None:
+            return  # Settings were closed during the download
+
         if success:
             messagebox.showinfo(
                 "Download Complete",
                 f"Model {model_id} downloaded successfully!\n\n"
                 "The model is now available for use.\n"
-                "Scanning for new models..."
+                "Scanning for new models...",
+                parent=self.window
             )
             # Refresh the model list to show the newly downloaded model
             self._scan_default_paths()
@@ -512,7 +690,8 @@ class SettingsWindow:
             messagebox.showerror(
                 "Download Failed",
                 f"Failed to download model {model_id}:\n\n{error}\n\n"
-                "Please check the model ID and try again."
+                "Please check the model ID and try again.",
+                parent=self.window
             )
 
     def _test_recording(self):
@@ -521,7 +700,8 @@ class SettingsWindow:
             messagebox.showinfo(
                 "Test Recording",
                 "Test recording is not available.\n\n"
-                "Please use the keyboard shortcut to test recording."
+                "Please use the keyboard shortcut to test recording.",
+                parent=self.window
             )
             return
 
@@ -530,7 +710,8 @@ class SettingsWindow:
             messagebox.showwarning(
                 "Test Recording",
                 "Recording is already in progress.\n\n"
-                "Press the keyboard shortcut to stop it first."
+                "Press the keyboard shortcut to stop it first.",
+                parent=self.window
             )
             return
 
@@ -539,7 +720,8 @@ class SettingsWindow:
             "Test Recording",
             "Test recording will start when you click OK.\n\n"
             "Speak for a few seconds, then use your keyboard shortcut to stop.\n\n"
-            "The transcribed text will be pasted automatically."
+            "The transcribed text will be pasted automatically.",
+            parent=self.window
         )
 
         # Start recording
@@ -549,7 +731,8 @@ class SettingsWindow:
             messagebox.showinfo(
                 "Recording Started",
                 "Recording started!\n\n"
-                "Use your keyboard shortcut to stop when done speaking."
+                "Use your keyboard shortcut to stop when done speaking.",
+                parent=self.window
             )
 
     def _save_settings(self):
@@ -566,29 +749,74 @@ class SettingsWindow:
             # Update with new values
             current_config['api_key'] = self.entry_widgets['api_key'].get()
 
+            # Transcription endpoint
+            base_url = self.entry_widgets['openai_base_url'].get().strip()
+            if base_url and not base_url.startswith(("http://", "https://")):
+                messagebox.showerror(
+                    "Invalid Value",
+                    "Server URL must start with http:// or https://.",
+                    parent=self.window
+                )
+                return
+            current_config['openai_base_url'] = base_url
+            current_config['openai_model'] = self.entry_widgets['openai_model'].get().strip() or "whisper-1"
+            try:
+                timeout = float(self.entry_widgets['openai_timeout_seconds'].get())
+                if not 0 < timeout <= 600:
+                    raise ValueError
+                current_config['openai_timeout_seconds'] = timeout
+            except ValueError:
+                messagebox.showerror(
+                    "Invalid Value",
+                    "Request timeout must be a number of seconds between 0 and 600.",
+                    parent=self.window
+                )
+                return
+            header = self.entry_widgets['openai_auth_header'].get().strip()
+            name, separator, _ = header.partition(":")
+            if header and (not separator or not name.strip()):
+                messagebox.showerror(
+                    "Invalid Value",
+                    'Extra header must look like "Name: value".',
+                    parent=self.window
+                )
+                return
+            current_config['openai_auth_header'] = header
+
             # Validate and convert max_duration_seconds
             try:
                 max_duration = int(self.entry_widgets['max_duration_seconds'].get())
                 if max_duration <= 0:
                     messagebox.showerror(
                         "Invalid Value",
-                        "Max recording duration must be a positive number."
+                        "Max recording duration must be a positive number.",
+                        parent=self.window
                     )
                     return
                 current_config['max_duration_seconds'] = max_duration
             except ValueError:
                 messagebox.showerror(
                     "Invalid Value",
-                    "Max recording duration must be a valid number."
+                    "Max recording duration must be a valid number.",
+                    parent=self.window
                 )
                 return
 
             current_config['audio_feedback_enabled'] = self.entry_widgets['audio_feedback_enabled'].get()
             current_config['keyboard_shortcut'] = self.entry_widgets['keyboard_shortcut'].get()
 
+            # Input device; drop the cached descriptor when the selection changes
+            input_device = self.entry_widgets['input_device'].get()
+            if input_device == self.DEFAULT_DEVICE_LABEL:
+                input_device = ""
+            if input_device != self.config.get_input_device():
+                current_config['input_device_cache'] = {}
+            current_config['input_device'] = input_device
+
             # Local STT settings
             current_config['stt_provider'] = self.entry_widgets['stt_provider'].get()
             current_config['local_engine'] = self.entry_widgets['local_engine'].get()
+            current_config['local_compute_type'] = self.entry_widgets['local_compute_type'].get()
             current_config['local_model_path'] = self.entry_widgets['local_model_path'].get()
             current_config['local_model_id'] = self.entry_widgets['local_model_id'].get()
 
@@ -604,27 +832,25 @@ class SettingsWindow:
                         messagebox.showwarning(
                             "Autostart Warning",
                             "Settings saved, but failed to create autostart file.\n"
-                            "You may need to configure autostart manually."
+                            "You may need to configure autostart manually.",
+                            parent=self.window
                         )
                 else:
                     if not self._remove_autostart_file():
                         messagebox.showwarning(
                             "Autostart Warning",
                             "Settings saved, but failed to remove autostart file.\n"
-                            "You may need to remove it manually from ~/.config/autostart/"
+                            "You may need to remove it manually from ~/.config/autostart/",
+                            parent=self.window
                         )
 
-            # Save to file
-            with open(config_path, 'w') as f:
-                json.dump(current_config, f, indent=2)
-
-            # Update config object in memory
-            self.config.settings = current_config
+            # Save to file and notify running components of the changes
+            self.config.update(current_config)
 
             messagebox.showinfo(
                 "Settings Saved",
-                "Settings have been saved successfully!\n\n"
-                "Note: Some changes (like keyboard shortcut) require restarting the application."
+                "Settings have been saved and applied.",
+                parent=self.window
             )
 
             self._close_window()
@@ -632,7 +858,8 @@ class SettingsWindow:
         except Exception as e:
             messagebox.showerror(
                 "Save Failed",
-                f"Failed to save settings:\n{str(e)}"
+                f"Failed to save settings:\n{str(e)}",
+                parent=self.window
             )
 
     def _close_window(self):
@@ -715,14 +942,14 @@ Categories=Utility;Accessibility;
 
         # Start scan in background
         def on_scan_complete(models):
-            # Update UI from main thread
-            self.window.after(0, lambda: self._on_models_discovered(models))
+            # Update UI from the UI thread
+            get_ui_thread().call(self._on_models_discovered, models)
 
         self.model_scanner.scan_default_paths(callback=on_scan_complete)
 
     def _scan_custom_folder(self):
         """Prompt user to select a folder and scan it."""
-        folder = filedialog.askdirectory(title="Select folder to scan for models")
+        folder = filedialog.askdirectory(title="Select folder to scan for models", parent=self.window)
         if folder:
             # Show scanning message
             self._update_models_list(scanning=True)
@@ -730,8 +957,8 @@ Categories=Utility;Accessibility;
             # Scan synchronously (since user is waiting)
             def scan_worker():
                 models = self.model_scanner.scan_folder_sync(folder)
-                # Update UI from main thread
-                self.window.after(0, lambda: self._on_models_discovered(models))
+                # Update UI from the UI thread
+                get_ui_thread().call(self._on_models_discovered, models)
 
             # Run in background thread
             thread = threading.Thread(target=scan_worker, daemon=True)
@@ -743,6 +970,9 @@ Categories=Utility;Accessibility;
         Args:
             models: List of model dictionaries with 'name' and 'path' keys
         """
+        if self.window is None:
+            return  # Settings were closed during the scan
+
         # Merge with existing models (avoid duplicates)
         existing_paths = {model['path'] for model in self.discovered_models}
         for model in models:
@@ -757,13 +987,15 @@ Categories=Utility;Accessibility;
                 "Models Found",
                 f"Found {len(models)} model(s) in this scan.\n"
                 f"Total: {len(self.discovered_models)} model(s) available.\n\n"
-                "Click on a model to select it."
+                "Click on a model to select it.",
+                parent=self.window
             )
         else:
             messagebox.showinfo(
                 "No Models Found",
                 "No Whisper models were detected in the scanned locations.\n\n"
-                "Try scanning a different folder or download a model first."
+                "Try scanning a different folder or download a model first.",
+                parent=self.window
             )
 
     def _update_models_list(self, scanning=False):
@@ -795,8 +1027,13 @@ Categories=Utility;Accessibility;
 
 
 def show_about_dialog():
-    """Show the About dialog."""
-    about_window = tk.Tk()
+    """Show the About dialog (returns immediately; safe from any thread)."""
+    get_ui_thread().call(_create_about_dialog)
+
+
+def _create_about_dialog():
+    """Create the About dialog (on the UI thread)."""
+    about_window = tk.Toplevel(get_ui_thread().root)
     about_window.title("About Voice Control")
     about_window.geometry("500x320")
     about_window.resizable(False, False)
@@ -848,5 +1085,3 @@ def show_about_dialog():
         width=15
     )
     close_button.grid(row=3, column=0)
-
-    about_window.mainloop()
@@ -3,10 +3,10 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 import json
+import threading
 import webbrowser
 from pathlib import Path
-from openai import OpenAI
-from openai import AuthenticationError, APIError, APIConnectionError
+from .ui_thread import get_ui_thread
 
 
 def validate_api_key(api_key):
@@ -21,6 +21,10 @@ def validate_api_key(api_key):
     if not api_key or not api_key.strip():
         return False, "API key cannot be empty"
 
+    # Imported here so loading this module stays cheap
+    from openai import OpenAI
+    from openai import AuthenticationError, APIError, APIConnectionError
+
     try:
         # Initialize OpenAI client with the key
         client = OpenAI(api_key=api_key.strip(), timeout=10.0)
@@ -61,22 +65,31 @@ class SetupWizard:
         self.status_label = None
         self.validate_button = None
         self.save_button = None
+        self._closed = threading.Event()
 
     def show(self):
         """Show the setup wizard window and return the API key.
 
+        Blocks until the wizard is closed, so it must not be called from
+        the UI thread itself.
+
         Returns:
             API key string if successfully configured, None if cancelled
         """
+        self._closed.clear()
+        # Raises if Tk cannot start, e.g. without a display
+        get_ui_thread().call(self._show).result()
+        self._closed.wait()
+        return self.api_key
+
+    def _show(self):
+        """Create the wizard window (on the UI thread)."""
         # Create window
-        self.window = tk.Tk()
+        self.window = tk.Toplevel(get_ui_thread().root)
         self.window.title("Voice Control - First Time Setup")
         self.window.geometry("550x550")
         self.window.resizable(False, False)
 
-        # Make window modal
-        self.window.grab_set()
-
         # Create main frame with padding
         main_frame = ttk.Frame(self.window, padding="30")
         main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
@@ -175,10 +188,9 @@ class SetupWizard:
         # Handle window close (same as skip)
         self.window.protocol("WM_DELETE_WINDOW", self._skip_setup)
 
-        # Run the window and wait for it to close
-        self.window.mainloop()
-
-        return self.api_key
+        # Make window modal (a Toplevel can only grab once it is mapped)
+        self.window.wait_visibility()
+        self.window.grab_set()
 
     def _open_api_key_url(self):
         """Open the OpenAI API keys page in the default browser."""
@@ -189,7 +201,8 @@ class SetupWizard:
             messagebox.showerror(
                 "Error",
                 f"Failed to open browser:\n{str(e)}\n\n"
-                "Please manually visit: https://platform.openai.com/api-keys"
+                "Please manually visit: https://platform.openai.com/api-keys",
+                parent=self.window
             )
 
     def _toggle_password_visibility(self, show):
@@ -240,18 +253,20 @@ class SetupWizard:
                 messagebox.showinfo(
                     "Setup Complete",
                     "Your API key has been validated and saved!\n\n"
-                    "Voice Control is now ready to use."
+                    "Voice Control is now ready to use.",
+                    parent=self.window
                 )
 
                 # Close the window
-                self.window.destroy()
+                self._close_window()
 
             except Exception as e:
                 self._update_status(f"Error saving config: {str(e)}", "red")
                 self.save_button.config(state="normal")
                 messagebox.showerror(
                     "Save Failed",
-                    f"Failed to save configuration:\n{str(e)}"
+                    f"Failed to save configuration:\n{str(e)}",
+                    parent=self.window
                 )
         else:
             # Show error
@@ -259,7 +274,8 @@ class SetupWizard:
             self.save_button.config(state="normal")
             messagebox.showerror(
                 "Validation Failed",
-                error_message
+                error_message,
+                parent=self.window
             )
 
     def _save_to_config(self, api_key):
@@ -296,12 +312,19 @@ class SetupWizard:
             "Are you sure you want to skip setup?\n\n"
             "Voice Control will not work without an API key.\n"
             "You can configure it later from the Settings menu.",
-            icon='warning'
+            icon='warning',
+            parent=self.window
         )
 
         if result:
             self.api_key = None
-            self.window.destroy()
+            self._close_window()
+
+    def _close_window(self):
+        """Close the wizard and let show() return."""
+        self.window.destroy()
+        self.window = None
+        self._closed.set()
 
 
 def should_show_setup_wizard(config):
@@ -313,10 +336,5 @@ def should_show_setup_wizard(config):
     Returns:
         True if setup wizard should be shown, False otherwise
     """
-    api_key = config.get_api_key()
-
-    # Show wizard if no API key is configured
-    if not api_key or not api_key.strip():
-        return True
-
-    return False
+    # Show wizard if OpenAI is used and no API key is configured
+    return not config.has_api_key() and config.uses_openai_api()
@@ -0,0 +1,114 @@
+"""Keyboard shortcut parsing and validation."""
+
+
+def parse_keyboard_shortcut(shortcut_str):
+    """Parse a keyboard shortcut string into pynput format.
+
+    Args:
+        shortcut_str: String like "Ctrl+Shift+Space" or "Alt+F1"
+
+    Returns:
+        String in pynput format like "<ctrl>+<shift>+<space>" or None if invalid
+
+    Examples:
+        "Ctrl+Shift+Space" -> "<ctrl>+<shift>+<space>"
+        "Alt+F1" -> "<alt>+<f1>"
+        "Ctrl+A" -> "<ctrl>+a"
+    """
+    if not shortcut_str or not isinstance(shortcut_str, str):
+        return None
+
+    # Map of common key names to pynput format
+    key_map = {
+        "ctrl": "<ctrl>",
+        "shift": "<shift>",
+        "alt": "<alt>",
+        "cmd": "<cmd>",
+        "space": "<space>",
+        "enter": "<enter>",
+        "tab": "<tab>",
+        "backspace": "<backspace>",
+        "delete": "<delete>",
+        "esc": "<esc>",
+        "up": "<up>",
+        "down": "<down>",
+        "left": "<left>",
+        "right": "<right>",
+        "home": "<home>",
+        "end": "<end>",
+        "page_up": "<page_up>",
+        "page_down": "<page_down>",
+        "insert": "<insert>",
+    }
+
+    # Add function keys F1-F12
+    for i in range(1, 13):
+        key_map[f"f{i}"] = f"<f{i}>"
+
+    try:
+        # Split the shortcut by + and process each part
+        parts = shortcut_str.split("+")
+        if len(parts) < 2:
+            return None  # Need at least modifier + key
+
+        parsed_parts = []
+        for part in parts:
+            part_lower = part.strip().lower()
+
+            # Check if it's a known modifier/special key
+            if part_lower in key_map:
+                parsed_parts.append(key_map[part_lower])
+            # Single character keys (a-z, 0-9, etc.) stay lowercase
+            elif len(part.strip()) == 1:
+                parsed_parts.append(part.strip().lower())
+            else:
+                # Unknown key format
+                return None
+
+        return "+".join(parsed_parts)
+
+    except Exception:
+        return None
+
+
+def shortcut_keys(shortcut):
+    """Get the keys of a shortcut regardless of their order.
+
+    Args:
+        shortcut: Shortcut string like "Ctrl+Shift+Space"
+
+    Returns:
+        Frozenset of keys in pynput format, or None if the shortcut is not valid
+    """
+    parsed = parse_keyboard_shortcut(shortcut)
+    if not parsed:
+        return None
+    return frozenset(parsed.split("+"))
+
+
+def find_shortcut_conflicts(shortcuts):
+    """Find shortcuts that would trigger on the same key combination.
+
+    The order of the keys does not matter, so "Ctrl+Shift+A" and
+    "shift+ctrl+a" conflict. Shortcuts that only share some keys, such as
+    "Ctrl+A" and "Ctrl+Shift+A", do not.
+
+    Args:
+        shortcuts: Iterable of shortcut strings like "Ctrl+Shift+Space"
+
+    Returns:
+        List of (first, second) pairs of conflicting shortcut strings,
+        plus (shortcut, None) for shortcuts that are not valid
+    """
+    conflicts = []
+    seen = {}  # Set of parsed keys -> first shortcut using it
+    for shortcut in shortcuts:
+        keys = shortcut_keys(shortcut)
+        if keys is None:
+            conflicts.append((shortcut, None))
+            continue
+        if keys in seen:
+            conflicts.append((seen[keys], shortcut))
+        else:
+            seen[keys] = shortcut
+    return conflicts
@@ -0,0 +1,116 @@
+"""Startup profiling for the --profile-startup command line flag."""
+
+import builtins
+import importlib.util
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+
+class StartupProfiler:
+    """Records startup phase durations and first-time module import costs.
+
+    When enabled, builtins.__import__ is wrapped so every module that is
+    imported for the first time is timed (inclusive of its own imports).
+    When disabled, every method is a no-op.
+    """
+
+    # Number of slowest imports to list in the report
+    TOP_IMPORTS = 15
+
+    def __init__(self, enabled=False):
+        """Initialize the profiler.
+
+        Args:
+            enabled: Whether to record anything (default False)
+        """
+        self.enabled = enabled
+        self.started = time.perf_counter()
+        self.phases = []  # (name, seconds)
+        self.marks = []  # (name, seconds since start)
+        self.imports = []  # (depth, module name, seconds)
+        self._local = threading.local()
+        self._original_import = None
+
+        if enabled:
+            self._install_import_hook()
+
+    def _install_import_hook(self):
+        """Wrap builtins.__import__ to time first-time imports."""
+        original_import = builtins.__import__
+        self._original_import = original_import
+
+        def timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+            full_name = name
+            if level:
+                package = (globals or {}).get('__package__') or ''
+                try:
+                    full_name = importlib.util.resolve_name('.' * level + name, package)
+                except (ImportError, ValueError):
+                    full_name = name
+
+            if full_name in sys.modules:
+                return original_import(name, globals, locals, fromlist, level)
+
+            depth = getattr(self._local, 'depth', 0)
+            self._local.depth = depth + 1
+            started = time.perf_counter()
+            try:
+                return original_import(name, globals, locals, fromlist, level)
+            finally:
+                self._local.depth = depth
+                self.imports.append((depth, full_name, time.perf_counter() - started))
+
+        builtins.__import__ = timed_import
+
+    @contextmanager
+    def phase(self, name):
+        """Time a named startup phase.
+
+        Args:
+            name: Label for the phase in the report
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            if self.enabled:
+                self.phases.append((name, time.perf_counter() - started))
+
+    def mark(self, name):
+        """Record a milestone relative to profiler creation.
+
+        Args:
+            name: Label for the milestone (e.g. "hotkey ready")
+        """
+        if self.enabled:
+            self.marks.append((name, time.perf_counter() - self.started))
+
+    def report(self):
+        """Print the startup breakdown and stop timing imports."""
+        if not self.enabled:
+            return
+
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+        print("\n=== Startup Profile ===")
+        print("Phases:")
+        for name, seconds in self.phases:
+            print(f"  {name:<32} {seconds * 1000:8.1f} ms")
+
+        print("Milestones (since launch):")
+        for name, seconds in self.marks:
+            print(f"  {name:<32} {seconds * 1000:8.1f} ms")
+
+        top_level = sorted(
+            (entry for entry in self.imports if entry[0] == 0),
+            key=lambda entry: entry[2],
+            reverse=True
+        )
+        print(f"Slowest imports (top {self.TOP_IMPORTS}, inclusive):")
+        for _, name, seconds in top_level[:self.TOP_IMPORTS]:
+            print(f"  {name:<32} {seconds * 1000:8.1f} ms")
+        print()
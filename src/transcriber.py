@@ -1,15 +1,86 @@
 """Audio transcription module using OpenAI Whisper API."""
 
 import logging
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import deque
 from pathlib import Path
-from openai import OpenAI
-from openai import APIError, APIConnectionError, APITimeoutError, AuthenticationError, RateLimitError
 from .notifier import Notifier
 from .config import Config
+from .transcript_cache import audio_digest, make_key, get_transcript_cache
+from .logging_setup import summarize_latencies
+
+
+# Endpoint used when no OpenAI-compatible server is configured
+OPENAI_BASE_URL = "https://api.openai.com/v1"
+
+
+def probe_endpoint(base_url="", api_key="", headers=None, timeout=5.0):
+    """Check that an OpenAI-compatible server answers, and how fast.
+
+    Sends GET {base_url}/models. Servers that do not implement /models
+    (such as the whisper.cpp server) still count as reachable when they
+    answer with 404.
+
+    Args:
+        base_url: Server URL ("" for api.openai.com)
+        api_key: API key sent as a bearer token, if any
+        headers: Extra request headers
+        timeout: Seconds to wait for the answer
+
+    Returns:
+        Dict with "ok" (bool), "status" (HTTP status or None), "latency_ms"
+        and "detail" (human-readable result)
+    """
+    request = urllib.request.Request(f"{(base_url or OPENAI_BASE_URL).rstrip('/')}/models")
+    if api_key:
+        request.add_header("Authorization", f"Bearer {api_key}")
+    for name, value in (headers or {}).items():
+        request.add_header(name, value)
+
+    started = time.perf_counter()
+    status = None
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            status = response.status
+    except urllib.error.HTTPError as e:
+        status = e.code
+    except (urllib.error.URLError, OSError) as e:
+        reason = getattr(e, "reason", e)
+        return {"ok": False, "status": None, "latency_ms": None, "detail": f"Unreachable: {reason}"}
+    latency_ms = round((time.perf_counter() - started) * 1000, 1)
+
+    if status in (401, 403):
+        detail = "Reachable, but the credentials were rejected"
+    elif status == 404:
+        detail = "Reachable (no /models endpoint)"
+    elif status < 400:
+        detail = "Reachable"
+    else:
+        detail = f"Server error (HTTP {status})"
+    return {"ok": status < 400 or status == 404, "status": status, "latency_ms": latency_ms, "detail": detail}
 
 
 class WhisperTranscriber:
-    """Transcribes audio files using OpenAI Whisper API."""
+    """Transcribes audio files using OpenAI Whisper API.
+
+    Any server implementing the OpenAI transcription endpoint can be used
+    instead, such as a faster-whisper or whisper.cpp server on the LAN,
+    by setting openai_base_url and openai_model.
+    """
+
+    # Config keys the HTTP client is built from
+    CONFIG_KEYS = ("api_key", "openai_base_url", "openai_model", "openai_timeout_seconds", "openai_auth_header")
+
+    # Request options
+    TRANSCRIBE_OPTIONS = {
+        "language": "en",  # Default to English, can be auto-detected
+    }
+
+    # Request latencies kept for the settings window
+    LATENCY_SAMPLES = 50
 
     def __init__(self, config=None):
         """Initialize the Whisper transcriber.
@@ -20,50 +91,139 @@ class WhisperTranscriber:
         # Use provided config or create new one
         self.config = config if config else Config()
 
-        # Set default paths
-        config_dir = Path.home() / ".config" / "voice-ctrl"
-        self.log_path = config_dir / "voice-ctrl.log"
-
-        # Ensure config directory exists
-        config_dir.mkdir(parents=True, exist_ok=True)
-
-        # Set up logging
-        self._setup_logging()
+        # Log through the process-wide logging set up by Config
+        self.log_path = self.config.log_path
+        self.logger = logging.getLogger(__name__)
 
         # Initialize notifier
         self.notifier = Notifier(log_path=self.log_path)
 
-        # Load API key from config
+        # Load endpoint settings from config
+        self._load_settings()
+
+        # OpenAI client, created on first use since importing the SDK is slow
+        self.client = None
+        self._client_lock = threading.Lock()
+
+        # Durations of successful requests in milliseconds, newest last
+        self.latencies_ms = deque(maxlen=self.LATENCY_SAMPLES)
+
+        # Rebuild the client when the endpoint settings change
+        self.config.subscribe(self.CONFIG_KEYS, self._on_config_changed)
+
+    def _load_settings(self):
+        """Read the API key and endpoint settings."""
         self.api_key = self.config.get_api_key()
+        self.base_url = self.config.get_openai_base_url()
+        self.model = self.config.get_openai_model()
+        self.timeout = self.config.get_openai_timeout()
+        self.headers = self.config.get_openai_auth_header()
 
-        # Initialize OpenAI client
-        self.client = OpenAI(api_key=self.api_key, timeout=30.0) if self.api_key else None
-
-    def _setup_logging(self):
-        """Configure logging to file."""
-        logging.basicConfig(
-            filename=str(self.log_path),
-            level=logging.ERROR,
-            format='[%(asctime)s] %(levelname)s: %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S',
-            force=True
-        )
-        self.logger = logging.getLogger(__name__)
+    def _get_client(self):
+        """Get the OpenAI client, creating it for the current settings if needed.
+
+        Returns:
+            OpenAI client, or None if OpenAI is used and no API key is configured
+        """
+        if self.client is None and (self.api_key or self.base_url):
+            with self._client_lock:
+                if self.client is None:
+                    from openai import OpenAI
+                    self.client = OpenAI(
+                        # Self-hosted servers often need no key, but the SDK requires one
+                        api_key=self.api_key or "none",
+                        base_url=self.base_url or None,
+                        timeout=self.timeout,
+                        default_headers=self.headers or None
+                    )
+        return self.client
+
+    def warm_up(self):
+        """Import the OpenAI SDK and create the client ahead of the first dictation."""
+        self._get_client()
+
+    def _on_config_changed(self, changes):
+        """Rebuild the HTTP client after the API key or endpoint changed.
 
-    def transcribe(self, audio_file_path):
+        Args:
+            changes: Dict of key -> ConfigChange from Config.subscribe
+        """
+        with self._client_lock:
+            self._load_settings()
+            self.client = None
+            if "openai_base_url" in changes or "openai_model" in changes:
+                self.latencies_ms.clear()  # Measured against another server
+        self._get_client()
+        print(f"Transcription client rebuilt for {self.base_url or OPENAI_BASE_URL} ({self.model})")
+
+    def probe(self):
+        """Check that the configured endpoint answers.
+
+        Returns:
+            Result dictionary from probe_endpoint
+        """
+        return probe_endpoint(self.base_url, self.api_key, self.headers, timeout=min(self.timeout, 5.0))
+
+    def latency_stats(self):
+        """Summarize the durations of recent successful requests.
+
+        Returns:
+            Dict from summarize_latencies (milliseconds)
+        """
+        return summarize_latencies(self.latencies_ms)
+
+    def _cache_key(self, audio_path, prompt=""):
+        """Build the transcript cache key for an audio file.
+
+        Args:
+            audio_path: Path object to audio file
+            prompt: Context prompt text sent with the audio
+
+        Returns:
+            Cache key string, or None if caching is disabled or the file is unreadable
+        """
+        if not self.config.is_transcript_cache_enabled():
+            return None
+        try:
+            digest = audio_digest(audio_path)
+        except OSError:
+            return None
+        options = self.TRANSCRIBE_OPTIONS
+        if prompt:
+            options = dict(options, prompt=prompt)
+        return make_key(digest, self.base_url or "openai", self.model, options)
+
+    def transcribe(self, audio_file_path, cleanup=True, prompt=None):
         """Transcribe audio file using OpenAI Whisper API.
 
         Args:
             audio_file_path: Path to audio file (WAV format)
+            cleanup: If True, delete audio file after transcription (default: True)
+            prompt: Optional function taking a tokenizer (None here) and
+                returning a Prompt, such as PromptBuilder.build
 
         Returns:
             Transcribed text as string, or None if error occurred
         """
+        from openai import APIError, APIConnectionError, APITimeoutError, AuthenticationError, RateLimitError
+
         audio_path = Path(audio_file_path)
 
         try:
+            # The API tokenizes the prompt itself, so only its text is needed
+            prompt_text = prompt(None).text if prompt is not None else ""
+
+            # Identical audio was already transcribed: skip the API call
+            cache = get_transcript_cache(self.config.get_transcript_cache_max_bytes())
+            cache_key = self._cache_key(audio_path, prompt_text)
+            cached = cache.get(cache_key) if cache_key else None
+            if cached:
+                print(f"Transcription served from cache: {cached['text'][:100]}")
+                return cached["text"]
+
             # Check if client is initialized (API key loaded)
-            if not self.client:
+            client = self._get_client()
+            if not client:
                 self.notifier.notify_invalid_api_key()
                 return None
 
@@ -77,18 +237,27 @@ class WhisperTranscriber:
 
             print(f"Transcribing audio file: {audio_file_path}")
 
+            options = dict(self.TRANSCRIBE_OPTIONS)
+            if prompt_text:
+                options["prompt"] = prompt_text
+
             # Open and send audio file to Whisper API
+            started = time.perf_counter()
             with open(audio_path, 'rb') as audio_file:
-                transcript = self.client.audio.transcriptions.create(
-                    model="whisper-1",
+                transcript = client.audio.transcriptions.create(
+                    model=self.model,
                     file=audio_file,
-                    language="en"  # Default to English, can be auto-detected
+                    **options
                 )
+            self.latencies_ms.append(round((time.perf_counter() - started) * 1000, 1))
 
             # Extract transcribed text
             transcribed_text = transcript.text
             print(f"Transcription successful: {transcribed_text[:100]}..." if len(transcribed_text) > 100 else f"Transcription successful: {transcribed_text}")
 
+            if cache_key and transcribed_text:
+                cache.put(cache_key, {"text": transcribed_text})
+
             return transcribed_text
 
         except AuthenticationError as e:
@@ -117,8 +286,9 @@ class WhisperTranscriber:
             return None
 
         finally:
-            # Clean up temporary audio file
-            self._cleanup_audio_file(audio_path)
+            # Clean up temporary audio file if requested
+            if cleanup:
+                self._cleanup_audio_file(audio_path)
 
     def _cleanup_audio_file(self, audio_path):
         """Delete temporary audio file after transcription.
@@ -0,0 +1,207 @@
+"""Shared transcribers for hotkey and re-transcription profiles."""
+
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from .memory_usage import release_memory, rss_mb
+
+
+# Approximate resident memory of faster-whisper models on CPU with int8 weights
+MODEL_MEMORY_MB = {
+    "tiny": 100,
+    "base": 160,
+    "small": 420,
+    "medium": 1100,
+    "large": 2200,
+}
+# Estimate for models whose size cannot be told from their name
+DEFAULT_MODEL_MB = 1100
+
+# Profile settings passed to the local model as decoding options
+DECODE_OPTION_KEYS = ("language", "beam_size", "vad_filter")
+
+
+def estimate_model_mb(model):
+    """Estimate the memory a loaded local model needs.
+
+    Args:
+        model: Model directory, file or ID (e.g. "small.en" or "Systran/faster-whisper-medium")
+
+    Returns:
+        Estimated size in megabytes
+    """
+    path = Path(model).expanduser()
+    try:
+        if path.is_dir():
+            return max(1, sum(f.stat().st_size for f in path.rglob("*") if f.is_file()) // (1024 * 1024))
+        if path.is_file():
+            return max(1, path.stat().st_size // (1024 * 1024))
+    except OSError:
+        pass
+
+    name = model.lower().rsplit("/", 1)[-1]
+    for size, megabytes in MODEL_MEMORY_MB.items():
+        if size in name:
+            return megabytes
+    return DEFAULT_MODEL_MB
+
+
+def model_source(transcriber):
+    """Get the model path or ID a local transcriber loads."""
+    return (transcriber.model_path or "").strip() or (transcriber.model_id or "").strip() or "base"
+
+
+class TranscriberPool:
+    """Creates and shares transcribers for profiles.
+
+    A profile is a dictionary with a "provider" ("openai" or "local") and,
+    for local profiles, an optional "model" (None means the configured
+    model) and decoding options ("language", "beam_size", "vad_filter").
+    Profiles with the same model and options share one transcriber.
+
+    Loaded local models are kept within the warm_models_max_mb budget:
+    when a profile's model is needed, the least recently used other models
+    are unloaded until the estimated total fits.
+    """
+
+    def __init__(self, config, openai_transcriber, local_factory=None):
+        """Initialize the pool.
+
+        Args:
+            config: Config object
+            openai_transcriber: WhisperTranscriber shared by all OpenAI profiles
+            local_factory: Callable creating local transcribers, called as
+                local_factory(config=..., model=..., options=...) (defaults to LocalTranscriber)
+        """
+        if local_factory is None:
+            from .local_transcriber import LocalTranscriber
+            local_factory = LocalTranscriber
+        self.config = config
+        self.openai_transcriber = openai_transcriber
+        self.local_factory = local_factory
+        self._local = OrderedDict()  # (model, options) -> transcriber, least recently used first
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(profile):
+        options = tuple(sorted((key, profile[key]) for key in DECODE_OPTION_KEYS if key in profile))
+        return profile.get("model") or None, options
+
+    def _local_transcriber(self, profile):
+        """Get or create the local transcriber for a profile (called under the lock)."""
+        key = self._key(profile)
+        transcriber = self._local.get(key)
+        if transcriber is None:
+            model, options = key
+            transcriber = self.local_factory(config=self.config, model=model, options=dict(options))
+            self._local[key] = transcriber
+        return transcriber
+
+    def get(self, profile):
+        """Get the transcriber for a profile, making room for its model.
+
+        Args:
+            profile: Profile dictionary
+
+        Returns:
+            WhisperTranscriber or LocalTranscriber
+        """
+        if profile.get("provider", "local") == "openai":
+            return self.openai_transcriber
+
+        with self._lock:
+            transcriber = self._local_transcriber(profile)
+            self._local.move_to_end(self._key(profile))
+            self._make_room(transcriber)
+        return transcriber
+
+    def _make_room(self, keep):
+        """Unload least recently used models until keep fits in the budget (called under the lock)."""
+        budget = self.config.get_warm_models_max_mb()
+        loaded = [t for t in self._local.values() if t is not keep and t.is_loaded()]
+        total = estimate_model_mb(model_source(keep)) + sum(estimate_model_mb(model_source(t)) for t in loaded)
+        for transcriber in loaded:
+            if total <= budget:
+                break
+            transcriber.unload()
+            total -= estimate_model_mb(model_source(transcriber))
+            print(f"Unloaded local model {model_source(transcriber)} to stay within warm_models_max_mb")
+
+    def warm_up(self, profiles):
+        """Load the local models of profiles, in order, while they fit in the budget.
+
+        Models that do not fit are loaded on first use instead.
+
+        Args:
+            profiles: Profile dictionaries, most important first
+        """
+        budget = self.config.get_warm_models_max_mb()
+        with self._lock:
+            total = sum(estimate_model_mb(model_source(t)) for t in self._local.values() if t.is_loaded())
+            pending = []
+            for profile in profiles:
+                if profile.get("provider", "local") == "openai":
+                    continue
+                transcriber = self._local_transcriber(profile)
+                if transcriber.is_loaded() or transcriber in pending:
+                    continue
+                size = estimate_model_mb(model_source(transcriber))
+                if total + size > budget:
+                    print(f"Not preloading {model_source(transcriber)} ({size} MB); warm_models_max_mb is {budget}")
+                    continue
+                total += size
+                pending.append(transcriber)
+
+        # Loading takes seconds; other profiles stay usable meanwhile
+        for transcriber in pending:
+            transcriber.warm_up()
+
+    def unload_idle(self, max_idle_seconds):
+        """Unload local models unused for a while and return their memory to the system.
+
+        Args:
+            max_idle_seconds: Idle time after which a model is unloaded
+
+        Returns:
+            Tuple of (list of unloaded model paths or IDs, megabytes of
+            resident memory released or None if unmeasurable)
+        """
+        before = rss_mb()
+        with self._lock:
+            idle = [
+                t for t in self._local.values()
+                if t.is_loaded() and t.idle_seconds() >= max_idle_seconds
+            ]
+        for transcriber in idle:
+            transcriber.unload()
+        if not idle:
+            return [], 0.0
+
+        release_memory()
+        after = rss_mb()
+        freed = max(0.0, before - after) if before is not None and after is not None else None
+        return [model_source(t) for t in idle], freed
+
+    def load_stats(self):
+        """Summarize load times of local models, for the metrics command.
+
+        Returns:
+            Dict with "load_ms" (recent model loads) and "wait_ms" (time
+            transcriptions spent waiting for their model) sample lists
+        """
+        with self._lock:
+            transcribers = list(self._local.values())
+        return {
+            "load_ms": [ms for t in transcribers for ms in t.load_latencies_ms],
+            "wait_ms": [ms for t in transcribers for ms in t.wait_latencies_ms],
+        }
+
+    def loaded_models(self):
+        """Get the local models currently in memory.
+
+        Returns:
+            List of model paths or IDs, least recently used first
+        """
+        with self._lock:
+            return [model_source(t) for t in self._local.values() if t.is_loaded()]
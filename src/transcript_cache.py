@@ -0,0 +1,244 @@
+"""On-disk cache of transcription results keyed by audio content."""
+
+import hashlib
+import json
+import os
+import threading
+import time
+import wave
+from pathlib import Path
+
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "voice-ctrl" / "transcripts"
+
+
+def audio_digest(audio_path=None, audio=None, sample_rate=16000):
+    """Hash the PCM content of a recording.
+
+    WAV files are hashed on their decoded frames and format, and float32
+    sample arrays are hashed as the equivalent 16-bit PCM, so a recording
+    hashes the same whether it is passed as a file or as samples. Other
+    audio files are hashed on their raw bytes.
+
+    Args:
+        audio_path: Path to an audio file
+        audio: Mono float32 samples in [-1, 1] (takes precedence over audio_path)
+        sample_rate: Sample rate of audio in Hz
+
+    Returns:
+        Hex digest string
+    """
+    digest = hashlib.blake2b(digest_size=20)
+
+    if audio is not None:
+        import numpy as np
+        pcm = np.clip(np.rint(np.asarray(audio) * 32768), -32768, 32767).astype('<i2')
+        digest.update(f"pcm:{sample_rate}:1:2:".encode())
+        digest.update(pcm.tobytes())
+        return digest.hexdigest()
+
+    audio_path = Path(audio_path)
+    if audio_path.suffix.lower() == ".wav":
+        try:
+            with wave.open(str(audio_path), 'rb') as wav_file:
+                digest.update(
+                    f"pcm:{wav_file.getframerate()}:{wav_file.getnchannels()}:{wav_file.getsampwidth()}:".encode()
+                )
+                while True:
+                    frames = wav_file.readframes(65536)
+                    if not frames:
+                        break
+                    digest.update(frames)
+            return digest.hexdigest()
+        except (wave.Error, EOFError):
+            digest = hashlib.blake2b(digest_size=20)  # Not plain PCM; hash the bytes instead
+
+    digest.update(b"file:")
+    with open(audio_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def make_key(digest, provider, model, options):
+    """Combine an audio digest with everything that affects the transcript.
+
+    Args:
+        digest: Result of audio_digest()
+        provider: Provider or engine name, e.g. "openai" or "faster-whisper"
+        model: Model name, path or ID
+        options: Dict of decoding options
+
+    Returns:
+        Cache key string
+    """
+    identity = json.dumps(
+        {"audio": digest, "provider": provider, "model": model, "options": options},
+        sort_keys=True
+    )
+    return hashlib.blake2b(identity.encode(), digest_size=20).hexdigest()
+
+
+class TranscriptCache:
+    """Size-bounded LRU cache of transcription results stored as JSON files.
+
+    Each entry is a small JSON file whose modification time records when it
+    was last used. When the total size exceeds max_bytes, the least recently
+    used entries are removed until the cache is back under LOW_WATERMARK of
+    its budget, so eviction runs rarely rather than on every write.
+    """
+
+    # Fraction of max_bytes to evict down to
+    LOW_WATERMARK = 0.9
+
+    def __init__(self, cache_dir=None, max_bytes=64 * 1024 * 1024):
+        """Initialize the cache. The directory is scanned on first use.
+
+        Args:
+            cache_dir: Directory for cache entries (defaults to ~/.cache/voice-ctrl/transcripts)
+            max_bytes: Size budget in bytes (default 64 MB)
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._index = None  # key -> [size, last used time]
+        self._total = 0
+
+        # Counters for diagnostics
+        self.hits = 0
+        self.misses = 0
+
+    def _entry_path(self, key):
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _load_index(self):
+        """Scan the cache directory (called under the lock)."""
+        if self._index is not None:
+            return
+        self._index = {}
+        self._total = 0
+        if not self.cache_dir.exists():
+            return
+        for path in self.cache_dir.glob("*/*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            self._index[path.stem] = [stat.st_size, stat.st_mtime]
+            self._total += stat.st_size
+
+    def get(self, key):
+        """Look up a cached result and mark it as recently used.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Entry dictionary (with at least "text"), or None on a miss
+        """
+        path = self._entry_path(key)
+        try:
+            with open(path) as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+
+        now = time.time()
+        try:
+            os.utime(path, (now, now))
+        except OSError:
+            pass
+        with self._lock:
+            if self._index is not None and key in self._index:
+                self._index[key][1] = now
+        self.hits += 1
+        return entry
+
+    def put(self, key, entry):
+        """Store a result, evicting least recently used entries if needed.
+
+        Args:
+            key: Cache key from make_key()
+            entry: JSON-serializable dictionary with at least "text"
+        """
+        path = self._entry_path(key)
+        data = json.dumps(entry).encode("utf-8")
+
+        with self._lock:
+            self._load_index()
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                # Write atomically so readers in other processes never see half an entry
+                temp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+                with open(temp_path, 'wb') as f:
+                    f.write(data)
+                os.replace(temp_path, path)
+            except OSError as e:
+                print(f"WARNING: Could not write transcript cache entry: {e}")
+                return
+
+            old = self._index.get(key)
+            if old:
+                self._total -= old[0]
+            self._index[key] = [len(data), time.time()]
+            self._total += len(data)
+
+            if self._total > self.max_bytes:
+                self._evict()
+
+    def _evict(self):
+        """Remove least recently used entries down to the low watermark (under the lock)."""
+        target = self.max_bytes * self.LOW_WATERMARK
+        for key, (size, _) in sorted(self._index.items(), key=lambda item: item[1][1]):
+            if self._total <= target:
+                break
+            try:
+                self._entry_path(key).unlink()
+            except FileNotFoundError:
+                pass
+            except OSError:
+                continue
+            del self._index[key]
+            self._total -= size
+
+    def clear(self):
+        """Remove every cache entry."""
+        with self._lock:
+            self._load_index()
+            for key in list(self._index):
+                try:
+                    self._entry_path(key).unlink()
+                except OSError:
+                    pass
+            self._index = {}
+            self._total = 0
+
+    @property
+    def total_bytes(self):
+        """Current size of all entries in bytes."""
+        with self._lock:
+            self._load_index()
+            return self._total
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_transcript_cache(max_bytes=None):
+    """Get the process-wide transcript cache.
+
+    Args:
+        max_bytes: If given, update the cache's size budget
+
+    Returns:
+        Shared TranscriptCache instance
+    """
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = TranscriptCache()
+        if max_bytes is not None:
+            _cache.max_bytes = max_bytes
+        return _cache
@@ -0,0 +1,169 @@
+"""Dedicated Tk thread that hosts every window of the application."""
+
+import os
+import threading
+import time
+import queue
+from concurrent.futures import Future
+
+
+class UIThread:
+    """Owns the only Tk interpreter, running on one long-lived thread.
+
+    Tk may only be used from the thread that created it, so windows are
+    built by sending commands to this thread instead of creating their own
+    tk.Tk() and mainloop() wherever they are opened. A hidden root stays
+    alive between windows, so opening one does not pay for interpreter
+    startup, and the tray menu thread returns immediately.
+
+    Commands wake the event loop through a pipe registered as a Tk file
+    handler, so an idle UI thread does not poll.
+    """
+
+    # Seconds to wait for the interpreter to start
+    START_TIMEOUT = 10.0
+
+    def __init__(self):
+        """Initialize the UI thread. The interpreter starts on first use."""
+        self.root = None
+        self.error = None
+        self._commands = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._thread = None
+        self._ready = threading.Event()
+        self._wake_read = None
+        self._wake_write = None
+
+    def start(self):
+        """Start the interpreter if it is not running yet.
+
+        Returns:
+            True if the UI thread is running, False if Tk failed to start
+            (the reason is in self.error)
+        """
+        with self._lock:
+            if self._thread is None or (not self._thread.is_alive() and self._ready.is_set()):
+                self._ready.clear()
+                self.error = None
+                self._thread = threading.Thread(target=self._run, name="ui", daemon=True)
+                self._thread.start()
+
+        if not self._ready.wait(self.START_TIMEOUT):
+            self.error = TimeoutError("Tk did not start in time")
+        return self.error is None and self._thread.is_alive()
+
+    def is_ui_thread(self):
+        """Check whether the caller is running on the UI thread."""
+        return threading.current_thread() is self._thread
+
+    def _run(self):
+        """Thread body: create the hidden root and run the event loop."""
+        try:
+            import tkinter as tk
+            root = tk.Tk()
+            root.withdraw()
+        except Exception as e:
+            print(f"WARNING: Could not start the UI: {e}")
+            self.error = e
+            self._ready.set()
+            self._fail_pending(e)
+            return
+
+        self._wake_read, self._wake_write = os.pipe()
+        os.set_blocking(self._wake_read, False)
+        root.createfilehandler(self._wake_read, tk.READABLE, self._drain)
+
+        self.root = root
+        self._ready.set()
+        self._drain()  # Commands queued while the interpreter was starting
+        root.mainloop()
+
+    def _fail_pending(self, error):
+        """Fail commands that can no longer run."""
+        while True:
+            try:
+                _, _, _, future = self._commands.get_nowait()
+            except queue.Empty:
+                return
+            future.set_exception(error)
+
+    def _drain(self, *args):
+        """Run queued commands (on the UI thread)."""
+        try:
+            os.read(self._wake_read, 4096)
+        except BlockingIOError:
+            pass
+
+        while True:
+            try:
+                func, args, kwargs, future = self._commands.get_nowait()
+            except queue.Empty:
+                return
+            self._execute(func, args, kwargs, future)
+
+    @staticmethod
+    def _execute(func, args, kwargs, future):
+        try:
+            future.set_result(func(*args, **kwargs))
+        except Exception as e:
+            print(f"WARNING: UI command failed: {e}")
+            future.set_exception(e)
+
+    def call(self, func, *args, **kwargs):
+        """Run a function on the UI thread without waiting for it.
+
+        Args:
+            func: Function that creates or updates widgets
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            concurrent.futures.Future with func's result
+        """
+        future = Future()
+        if self.is_ui_thread():
+            self._execute(func, args, kwargs, future)
+            return future
+
+        if not self.start():
+            future.set_exception(RuntimeError(f"UI is not available: {self.error}"))
+            return future
+
+        self._commands.put((func, args, kwargs, future))
+        os.write(self._wake_write, b"\0")
+        return future
+
+    def wait_until_closed(self, interval=0.2):
+        """Block until every window has been closed.
+
+        For scripts that open a window and have nothing else keeping them
+        alive; the daemon keeps running on its own.
+
+        Args:
+            interval: Seconds between checks
+        """
+        while True:
+            try:
+                open_windows = self.call(lambda: len(self.root.winfo_children())).result()
+            except Exception:
+                return
+            if not open_windows:
+                return
+            time.sleep(interval)
+
+
+_ui_thread = None
+_ui_thread_lock = threading.Lock()
+
+
+def get_ui_thread():
+    """Get the process-wide UI thread.
+
+    Returns:
+        Shared UIThread instance
+    """
+    global _ui_thread
+    with _ui_thread_lock:
+        if _ui_thread is None:
+            _ui_thread = UIThread()
+        return _ui_thread
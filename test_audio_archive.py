@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Test the compressed audio archive for history entries."""
+
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.audio_archive import AudioArchive
+from src.history import HistoryManager
+
+
+def _speech_like(seconds, seed):
+    """Generate a deterministic int16 test signal."""
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(16000 * seconds)) / 16000
+    signal = np.sin(2 * np.pi * 220 * t) * 6000 + rng.normal(0, 300, len(t))
+    return signal.astype(np.int16)
+
+
+def test_flac_round_trip():
+    """FLAC recordings should decode back to identical samples."""
+    print("=== Testing FLAC Round Trip ===\n")
+
+    with tempfile.TemporaryDirectory() as directory:
+        archive = AudioArchive(archive_dir=directory)
+        first = _speech_like(2.0, seed=1)
+        second = _speech_like(1.0, seed=2)
+
+        first_ref = archive.store(first)
+        second_ref = archive.store(second)
+
+        assert first_ref["segment"] == second_ref["segment"], "Both should share one segment"
+        assert np.array_equal(archive.read_audio(second_ref), second)
+        assert np.array_equal(archive.read_audio(first_ref), first)
+        ratio = first_ref["length"] / first.nbytes
+        print(f"✓ Lossless round trip, compressed to {ratio:.0%} of PCM size")
+
+
+def test_opus_round_trip():
+    """Opus recordings should decode to roughly the same length."""
+    print("\n=== Testing Opus Round Trip ===\n")
+
+    with tempfile.TemporaryDirectory() as directory:
+        archive = AudioArchive(archive_dir=directory, codec="opus")
+        samples = _speech_like(2.0, seed=3)
+        ref = archive.store(samples)
+
+        decoded = archive.read_audio(ref)
+        assert abs(len(decoded) - len(samples)) < 16000 * 0.05, (len(decoded), len(samples))
+        print(f"✓ Opus stored {ref['length']} bytes for {samples.nbytes} bytes of PCM")
+
+
+def test_oldest_segments_evicted():
+    """Exceeding the byte budget should delete the oldest recordings first."""
+    print("\n=== Testing Eviction ===\n")
+
+    with tempfile.TemporaryDirectory() as directory:
+        archive = AudioArchive(archive_dir=directory, max_bytes=300 * 1024)
+        refs = [archive.store(_speech_like(3.0, seed=i)) for i in range(8)]
+
+        assert archive.total_bytes <= archive.max_bytes + archive.segment_bytes
+        assert archive.read(refs[0]) is None, "Oldest recording should be evicted"
+        assert archive.read_audio(refs[-1]) is not None, "Newest recording should be kept"
+        print(f"✓ Archive holds {archive.total_bytes} bytes with a {archive.max_bytes} byte budget")
+
+
+def test_history_references_audio():
+    """History entries should persist their audio reference."""
+    print("\n=== Testing History Audio References ===\n")
+
+    with tempfile.TemporaryDirectory() as directory:
+        history_path = Path(directory) / "history.json"
+        history = HistoryManager(history_path=history_path)
+        entry = history.add_entry("hello world", 1.5)
+        history.set_entry_audio(entry, {"segment": 1, "offset": 8, "length": 100, "codec": "flac"})
+
+        reloaded = HistoryManager(history_path=history_path)
+        assert reloaded.get_entries()[0]["audio"]["segment"] == 1
+        print("✓ Audio reference saved with the entry")
+
+
+if __name__ == "__main__":
+    test_flac_round_trip()
+    test_opus_round_trip()
+    test_oldest_segments_evicted()
+    test_history_references_audio()
+    print("\nAll audio archive tests passed!")
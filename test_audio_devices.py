@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""Test input device matching and the cached device descriptor."""
+
+import sys
+from pathlib import Path
+from unittest import mock
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+
+def fake_device(name, hostapi=0, channels=2, samplerate=48000.0):
+    return {"name": name, "hostapi": hostapi, "max_input_channels": channels, "default_samplerate": samplerate}
+
+
+class FakePortAudio:
+    """Device table with the sounddevice query functions used by audio_devices."""
+
+    def __init__(self, devices, default=0):
+        self.devices = devices
+        self.default = default
+        self.queries = []
+
+    def query_devices(self, device=None, kind=None):
+        self.queries.append(device)
+        if device is None and kind is None:
+            return list(self.devices)
+        index = self.default if device is None else device
+        if not 0 <= index < len(self.devices):
+            raise ValueError(f"Error querying device {index}")
+        return dict(self.devices[index], index=index)
+
+    def check_input_settings(self, device=None, channels=None, samplerate=None):
+        if self.devices[device]["max_input_channels"] < channels:
+            raise ValueError("Invalid number of channels")
+
+
+def patch_portaudio(audio_devices, portaudio):
+    return mock.patch.multiple(
+        audio_devices.sd,
+        query_devices=portaudio.query_devices,
+        check_input_settings=portaudio.check_input_settings,
+    )
+
+
+def test_device_matching():
+    """Names match without the ALSA suffix; digits are an index, not a substring."""
+    print("=== Testing Device Matching ===\n")
+
+    try:
+        from src import audio_devices
+    except OSError as e:
+        print(f"PortAudio is not installed ({e}); device matching not tested")
+        return
+
+    assert audio_devices.normalize_device_name("USB Audio: - (hw:2,0)") == "usb audio: -"
+    portaudio = FakePortAudio([
+        fake_device("HDA Intel PCH: ALC257 Analog (hw:0,0)"),
+        fake_device("HDMI 0 (hw:0,3)", channels=0),
+        fake_device("USB Audio 2.0: Mic (hw:3,0)", samplerate=44100.0),
+        fake_device("pulse"),
+    ])
+    with patch_portaudio(audio_devices, portaudio):
+        descriptor = audio_devices.resolve_input_device("USB Audio 2.0: Mic (hw:1,0)")
+        assert descriptor["index"] == 2 and descriptor["samplerate"] == 44100
+        print("✓ Device found after its hw:X,Y numbers changed")
+
+        assert audio_devices.resolve_input_device("alc257")["index"] == 0
+        assert audio_devices.resolve_input_device("")["index"] == 0
+        print("✓ Substring and default device resolved")
+
+        # "0" is the index typed in the settings, not part of "USB Audio 2.0"
+        descriptor = audio_devices.resolve_input_device("0")
+        assert descriptor["index"] == 0 and descriptor["name"].startswith("HDA Intel"), descriptor
+        assert audio_devices.resolve_input_device(2)["index"] == 2
+        print("✓ Numeric strings used as indices, not matched as substrings")
+
+        try:
+            audio_devices.resolve_input_device("Blue Yeti")
+            assert False, "Unknown device accepted"
+        except ValueError:
+            pass
+        print("✓ Unknown device reported")
+
+
+def test_cached_descriptor():
+    """A cached descriptor is reused only while its index still has that device."""
+    print("\n=== Testing Cached Descriptor ===\n")
+
+    try:
+        from src import audio_devices
+    except OSError as e:
+        print(f"PortAudio is not installed ({e}); cached descriptors not tested")
+        return
+
+    portaudio = FakePortAudio([fake_device("pulse"), fake_device("Blue Yeti (hw:2,0)")])
+    with patch_portaudio(audio_devices, portaudio):
+        cached = audio_devices.resolve_input_device("Blue Yeti")
+        portaudio.queries.clear()
+        assert audio_devices.descriptor_matches(cached, "Blue Yeti")
+        assert portaudio.queries == [1], "Only the cached index is queried"
+        assert not audio_devices.descriptor_matches(cached, "pulse"), "Cached for another selection"
+        print("✓ Valid descriptor reused with one query")
+
+        # After a reboot another device sits at the cached index
+        portaudio.devices = [fake_device("pulse"), fake_device("Webcam (hw:1,0)"), fake_device("Blue Yeti (hw:3,0)")]
+        assert not audio_devices.descriptor_matches(cached, "Blue Yeti")
+        assert audio_devices.resolve_input_device("Blue Yeti")["index"] == 2
+        print("✓ Stale cached index detected and the device found again")
+
+        # The device was renamed (e.g. new firmware) but still matches the selection
+        portaudio.devices = [fake_device("pulse"), fake_device("Blue Yeti X (hw:2,0)")]
+        cached = dict(cached, index=1)
+        assert not audio_devices.descriptor_matches(cached, "Blue Yeti")
+        assert audio_devices.resolve_input_device("Blue Yeti")["name"] == "Blue Yeti X (hw:2,0)"
+        print("✓ Renamed device not reused from the cache, found by name")
+
+        # The device was unplugged
+        portaudio.devices = [fake_device("pulse")]
+        assert not audio_devices.descriptor_matches(cached, "Blue Yeti")
+        assert not audio_devices.descriptor_matches({}, "")
+        print("✓ Disappeared device falls back to enumeration")
+
+        # Index 0 is a device of its own, not the system default
+        default = audio_devices.resolve_input_device("")
+        assert not audio_devices.descriptor_matches(default, 0)
+        assert audio_devices.descriptor_matches(audio_devices.resolve_input_device(0), 0)
+        print("✓ Index 0 kept apart from the default device")
+
+
+if __name__ == "__main__":
+    test_device_matching()
+    test_cached_descriptor()
+    print("\nAll audio device tests passed!")
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Test mixing of feedback beeps on the persistent output stream.
+
+The stream callback is driven directly with a fake output buffer, so no
+audio device is needed.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+
+class FakeStream:
+    """Output stream stand-in tracking starts and stops."""
+
+    def __init__(self):
+        self.active = False
+        self.stopped = True
+        self.starts = 0
+
+    def start(self):
+        self.active, self.stopped = True, False
+        self.starts += 1
+
+    def stop(self):
+        self.active, self.stopped = False, True
+
+    def close(self):
+        pass
+
+
+def test_beeps_are_mixed_and_stream_stops():
+    """Overlapping beeps are summed; the callback stops once both are done."""
+    print("=== Testing Beep Mixing ===\n")
+
+    try:
+        import sounddevice as sd
+        from src.audio_feedback import AudioFeedback
+    except OSError as e:
+        print(f"PortAudio is not installed ({e}); beep mixing not tested")
+        return
+
+    # Disabled at first so no device is opened, then given a fake stream
+    feedback = AudioFeedback(enabled=False, sample_rate=8000)
+    feedback.enabled = True
+    feedback.stream = stream = FakeStream()
+    start, stop = feedback._beeps["start"], feedback._beeps["stop"]
+    assert len(start) == 800 and len(stop) == 1200
+    assert start.dtype == np.float32 and np.abs(start).max() <= 0.3
+    print("✓ Beeps synthesized once at the stream's sample rate")
+
+    frames = 512
+    feedback.play_start_beep()
+    assert stream.starts == 1
+
+    outdata = np.ones((frames, 1), dtype=np.float32)
+    feedback._callback(outdata, frames, None, None)
+    assert np.allclose(outdata[:, 0], start[:frames]), "Buffer not cleared before mixing"
+
+    # The stop beep begins while the start beep is still playing
+    feedback.play_stop_beep()
+    assert stream.starts == 1, "Running stream restarted"
+    played = []
+    stopped = False
+    while not stopped:
+        outdata = np.zeros((frames, 1), dtype=np.float32)
+        try:
+            feedback._callback(outdata, frames, None, None)
+        except sd.CallbackStop:
+            stopped = True
+        played.append(outdata[:, 0].copy())
+    played = np.concatenate(played)
+
+    expected = np.zeros(len(played), dtype=np.float32)
+    expected[:len(start) - frames] += start[frames:]
+    expected[:len(stop)] += stop
+    assert np.allclose(played, expected), "Overlapping beeps not mixed"
+    assert len(played) >= len(stop) and not feedback._voices
+    print(f"✓ Overlapping beeps mixed, stream stopped after {len(played) // frames} callbacks")
+
+    # The next beep restarts the stopped stream
+    stream.active = False
+    feedback.play_stop_beep()
+    assert stream.starts == 2 and len(feedback._voices) == 1
+    print("✓ Stream restarted for the next beep")
+
+    feedback.close()
+    assert feedback.stream is None
+
+
+if __name__ == "__main__":
+    test_beeps_are_mixed_and_stream_stops()
+    print("\nAll audio feedback tests passed!")
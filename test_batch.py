@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Test batch transcription planning and resume logic."""
+
+import sys
+import json
+import tempfile
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src import batch
+
+
+def test_collect_audio_files():
+    """Directories should be expanded to audio files only, without duplicates."""
+    print("=== Testing File Collection ===\n")
+
+    with tempfile.TemporaryDirectory() as directory:
+        root = Path(directory)
+        (root / "notes").mkdir()
+        for name in ["notes/a.wav", "notes/b.MP3", "notes/readme.txt", "c.flac"]:
+            (root / name).write_bytes(b"")
+
+        files = batch.collect_audio_files([root / "notes", root / "c.flac", root / "notes" / "a.wav"])
+        names = [Path(f).name for f in files]
+        assert names == ["c.flac", "a.wav", "b.MP3"], names
+        print(f"✓ Collected {names}")
+
+
+def test_plan_workers():
+    """Worker count should respect the file count and explicit requests."""
+    print("\n=== Testing Worker Planning ===\n")
+
+    workers, threads = batch.plan_workers(1, "base")
+    assert workers == 1 and threads >= 1
+    workers, threads = batch.plan_workers(100, "base", requested=2)
+    assert workers == 2 and threads >= 1
+    assert batch.estimate_model_memory_mb("Systran/faster-whisper-large-v3") == batch.MODEL_MEMORY_MB["large"]
+    print("✓ Worker count bounded by files and requests")
+
+
+def test_resume_skips_completed():
+    """Completed files should be skipped and partial lines tolerated."""
+    print("\n=== Testing Resume ===\n")
+
+    with tempfile.TemporaryDirectory() as directory:
+        output = Path(directory) / "out.jsonl"
+        output.write_text(
+            json.dumps({"path": "/a.wav", "text": "hello"}) + "\n"
+            + json.dumps({"path": "/b.wav", "error": "decode failed"}) + "\n"
+            + '{"path": "/c.wav", "te'
+        )
+
+        assert batch.load_completed(output) == {"/a.wav"}
+        batch._terminate_partial_line(output)
+        assert output.read_text().endswith("\n")
+        print("✓ Only successful files are treated as done")
+
+
+class FakeTranscriber:
+    """Local transcriber stand-in returning fixed segments."""
+
+    def __init__(self, texts):
+        self.texts = texts
+        self.config = self
+
+    def get_transcript_cache_max_bytes(self):
+        return None
+
+    def cache_key(self, audio_path):
+        return None
+
+    def decode(self, audio):
+        segments = [type("Segment", (), {"text": text}) for text in self.texts]
+        return iter(segments), type("Info", (), {"language": "en", "duration": 1.234})
+
+
+def test_empty_transcription_is_an_error():
+    """Files without speech should be reported as failures, not empty results."""
+    print("\n=== Testing Empty Transcriptions ===\n")
+
+    batch._transcriber = FakeTranscriber(["Hello", "world."])
+    record = batch._transcribe_file("/a.wav")
+    assert record["text"] == "Hello world." and "error" not in record
+    assert record["audio_seconds"] == 1.23
+
+    batch._transcriber = FakeTranscriber(["  "])
+    record = batch._transcribe_file("/silence.wav")
+    assert record["error"] == "No speech detected" and "text" not in record
+    batch._transcriber = None
+    print("✓ Silent files reported as failed")
+
+
+if __name__ == "__main__":
+    test_collect_audio_files()
+    test_plan_workers()
+    test_resume_skips_completed()
+    test_empty_transcription_is_an_error()
+    print("\nAll batch tests passed!")
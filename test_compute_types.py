@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""Test CPU feature detection and compute type benchmarking."""
+
+import json
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from unittest import mock
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src import local_transcriber
+from src.compute_types import (
+    ComputeTypeSelector, candidate_compute_types, cpu_features, get_compute_type_selector, read_cpu_info
+)
+from src.config import Config
+from src.local_transcriber import LocalTranscriber
+
+
+CPUINFO = """processor\t: 0
+vendor_id\t: GenuineIntel
+model name\t: Intel(R) Xeon(R) Gold 6430
+flags\t\t: fpu sse2 avx avx2 fma avx512f avx512_vnni avx512_bf16 amx_tile amx_int8
+
+processor\t: 1
+model name\t: Intel(R) Xeon(R) Gold 6430
+flags\t\t: fpu sse2 avx avx2 fma avx512f avx512_vnni avx512_bf16 amx_tile amx_int8
+"""
+
+OLD_CPUINFO = """processor\t: 0
+model name\t: Intel(R) Core(TM)2 Duo CPU
+flags\t\t: fpu sse2 ssse3
+"""
+
+ALL_TYPES = {"int8", "int8_float32", "int8_bfloat16", "bfloat16", "float32"}
+
+
+class FakeModel:
+    """Model whose decode time depends on its compute type."""
+
+    DECODE_SECONDS = {"int8": 0.004, "int8_float32": 0.002, "int8_bfloat16": 0.006, "bfloat16": 0.008, "float32": 0.01}
+
+    def __init__(self, compute_type):
+        self.compute_type = compute_type
+
+    def transcribe(self, audio, **options):
+        assert options["max_new_tokens"] == ComputeTypeSelector.MAX_NEW_TOKENS
+        assert options["vad_filter"] is False
+
+        def segments():
+            time.sleep(self.DECODE_SECONDS[self.compute_type])
+            yield " noise"
+        return segments(), None
+
+
+def test_cpu_features():
+    """CPU flags map to features and an ordering of compute types."""
+    print("=== Testing CPU Feature Detection ===\n")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "cpuinfo"
+        path.write_text(CPUINFO)
+        name, flags = read_cpu_info(path)
+        assert name == "Intel(R) Xeon(R) Gold 6430"
+        features = cpu_features(flags)
+        assert features == ["amx", "avx2", "avx512", "bf16", "vnni"]
+        print("✓ AVX2, AVX-512, VNNI, BF16 and AMX detected")
+
+        assert candidate_compute_types(features, ALL_TYPES) == [
+            "int8", "int8_float32", "int8_bfloat16", "bfloat16", "float32"
+        ]
+        assert candidate_compute_types(["avx2"], ALL_TYPES) == ["int8", "int8_float32", "float32"]
+        assert candidate_compute_types(["avx2"], {"int8", "float32"}) == ["int8", "float32"]
+
+        path.write_text(OLD_CPUINFO)
+        _, flags = read_cpu_info(path)
+        assert candidate_compute_types(cpu_features(flags), ALL_TYPES)[0] == "float32"
+        assert read_cpu_info(Path(directory) / "missing") == ("", set())
+        print("✓ int8 first with AVX2, float32 first without")
+
+
+def test_benchmark_is_cached_per_machine():
+    """The fastest type is remembered per model and machine."""
+    print("\n=== Testing Compute Type Benchmark ===\n")
+
+    with tempfile.TemporaryDirectory() as directory:
+        cpuinfo = Path(directory) / "cpuinfo"
+        cpuinfo.write_text(CPUINFO)
+        results = Path(directory) / "compute_types.json"
+        selector = ComputeTypeSelector(path=results, cpuinfo_path=cpuinfo, supported=ALL_TYPES)
+        assert selector.choose("small.en") == "int8", "Guess from CPU features before benchmarking"
+
+        loaded = []
+
+        def loader(model, cpu_threads=0, compute_type="int8"):
+            if compute_type == "bfloat16":
+                raise ValueError("bfloat16 not supported by this build")
+            loaded.append(compute_type)
+            return FakeModel(compute_type)
+
+        result = selector.benchmark("small.en", loader, options={"language": "en", "beam_size": 5})
+        assert result["compute_type"] == "int8_float32", result
+        assert set(result["decode_ms"]) == {"int8", "int8_float32", "int8_bfloat16", "float32"}
+        assert selector.choose("small.en") == "int8_float32"
+        print("✓ Fastest compute type picked; unsupported types skipped")
+
+        # Benchmarked models are not measured again, even by a new process
+        selector.benchmark("small.en", loader)
+        assert len(loaded) == 4
+        reloaded = ComputeTypeSelector(path=results, cpuinfo_path=cpuinfo, supported=ALL_TYPES)
+        assert reloaded.choose("small.en") == "int8_float32"
+        print("✓ Result reused after restart")
+
+        # Another machine sharing the file starts from its own guess
+        other = Path(directory) / "other_cpuinfo"
+        other.write_text(OLD_CPUINFO)
+        elsewhere = ComputeTypeSelector(path=results, cpuinfo_path=other, supported=ALL_TYPES)
+        assert elsewhere.get("small.en") is None
+        assert elsewhere.choose("small.en") == "float32"
+        elsewhere.benchmark("small.en", loader)
+        with open(results) as f:
+            assert len(json.load(f)) == 2, "Both machines' results kept"
+        print("✓ Results kept separately per machine")
+
+
+def test_batch_workers_do_not_benchmark():
+    """Transcribers created without benchmarking load the chosen type and stop there."""
+    print("\n=== Testing Benchmark Opt-Out ===\n")
+
+    # The process-wide log file may be opened in the first Config's directory
+    with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as directory:
+        config = Config(config_path=Path(directory) / "config.json", log_path=Path(directory) / "voice-ctrl.log")
+        benchmarked = []
+        with mock.patch.object(local_transcriber, "load_model", return_value=object()), \
+                mock.patch.object(LocalTranscriber, "_benchmark_compute_types", lambda self, model: benchmarked.append(model)):
+            worker = LocalTranscriber(config=config, model="small.en", benchmark=False)
+            assert worker.compute_type == get_compute_type_selector().choose("small.en")
+            worker.warm_up()
+            assert worker.is_loaded() and benchmarked == []
+
+            daemon = LocalTranscriber(config=config, model="small.en")
+            daemon.warm_up()
+            assert benchmarked == ["small.en"]
+        print("✓ Batch workers skip the benchmark; the daemon runs it")
+
+
+def test_benchmark_budget_and_pause():
+    """Large models are not benchmarked; the benchmark waits for dictations."""
+    print("\n=== Testing Benchmark Budget and Pause ===\n")
+
+    # The process-wide log file may be opened in the first Config's directory
+    with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as directory:
+        cpuinfo = Path(directory) / "cpuinfo"
+        cpuinfo.write_text(CPUINFO)
+        selector = ComputeTypeSelector(
+            path=Path(directory) / "compute_types.json", cpuinfo_path=cpuinfo, supported=ALL_TYPES
+        )
+        config_path = Path(directory) / "config.json"
+        config_path.write_text(json.dumps({"warm_models_max_mb": 2048}))
+        config = Config(config_path=config_path, log_path=Path(directory) / "voice-ctrl.log")
+
+        started = []
+        with mock.patch.object(local_transcriber, "get_compute_type_selector", return_value=selector), \
+                mock.patch.object(selector, "benchmark", lambda *args, **kwargs: started.append(args[0])):
+            transcriber = LocalTranscriber(config=config, model="medium.en")
+            transcriber._benchmark_compute_types("medium.en")
+            time.sleep(0.05)
+            assert started == [], "Two copies of medium do not fit in 2048 MB"
+            transcriber._benchmark_compute_types("small.en")
+            time.sleep(0.05)
+            assert started == ["small.en"]
+        print("✓ Benchmark skipped when two copies exceed warm_models_max_mb")
+
+        loaded = []
+
+        def loader(model, cpu_threads=0, compute_type="int8"):
+            loaded.append(compute_type)
+            return FakeModel(compute_type)
+
+        # A dictation is being transcribed when the benchmark starts
+        LocalTranscriber._set_active(1)
+        try:
+            worker = threading.Thread(
+                target=selector.benchmark, args=("small.en", loader),
+                kwargs={"wait_idle": LocalTranscriber._wait_until_idle}, daemon=True
+            )
+            worker.start()
+            time.sleep(0.1)
+            assert loaded == [], "Benchmark ran during a dictation"
+        finally:
+            LocalTranscriber._set_active(-1)
+        worker.join(5)
+        assert not worker.is_alive() and len(loaded) == len(selector.candidates)
+        print("✓ Benchmark paused until the dictation finished")
+
+
+if __name__ == "__main__":
+    test_cpu_features()
+    test_benchmark_is_cached_per_machine()
+    test_batch_workers_do_not_benchmark()
+    test_benchmark_budget_and_pause()
+    print("\nAll compute type tests passed!")
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""Test Config change notifications and hot reload."""
+
+import sys
+import json
+import tempfile
+import threading
+import time
+import wave
+from pathlib import Path
+from unittest import mock
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src import local_transcriber, transcript_cache
+from src.config import Config
+from src.local_engines import Segment, TranscriptionInfo
+from src.local_transcriber import LocalTranscriber
+from src.transcript_cache import TranscriptCache
+
+
+def _make_config(directory):
+    """Create a Config backed by a temporary config file."""
+    return Config(
+        config_path=Path(directory) / "config.json",
+        log_path=Path(directory) / "voice-ctrl.log"
+    )
+
+
+def test_update_notifies_subscribers():
+    """Config.update should persist settings and notify only relevant subscribers."""
+    print("=== Testing Config.update Notifications ===\n")
+
+    with tempfile.TemporaryDirectory() as directory:
+        config = _make_config(directory)
+
+        shortcut_events = []
+        provider_events = []
+        config.subscribe(["keyboard_shortcut"], shortcut_events.append)
+        config.subscribe(["stt_provider"], provider_events.append)
+
+        new_settings = dict(config.settings)
+        new_settings["keyboard_shortcut"] = "Alt+F1"
+        changes = config.update(new_settings)
+
+        assert set(changes) == {"keyboard_shortcut"}, f"Unexpected changes: {changes}"
+        assert len(shortcut_events) == 1
+        change = shortcut_events[0]["keyboard_shortcut"]
+        assert change.old_value == "Ctrl+Shift+Space" and change.new_value == "Alt+F1"
+        assert provider_events == [], "Unrelated subscriber should not be called"
+
+        with open(config.config_path) as f:
+            assert json.load(f)["keyboard_shortcut"] == "Alt+F1"
+
+        print("✓ Only the keyboard_shortcut subscriber was notified")
+        print("✓ New value was written to disk")
+
+
+def test_reload_from_disk():
+    """Editing config.json should be picked up by the watcher."""
+    print("\n=== Testing File Watcher Reload ===\n")
+
+    with tempfile.TemporaryDirectory() as directory:
+        config = _make_config(directory)
+
+        events = []
+        config.subscribe(["max_duration_seconds"], events.append)
+        config.start_watching(interval=0.05)
+
+        try:
+            # Make sure the mtime differs from the one recorded at load time
+            time.sleep(0.05)
+            data = dict(config.settings)
+            data["max_duration_seconds"] = 60
+            with open(config.config_path, "w") as f:
+                json.dump(data, f)
+
+            deadline = time.time() + 2.0
+            while not events and time.time() < deadline:
+                time.sleep(0.05)
+        finally:
+            config.stop_watching()
+
+        assert events, "Watcher did not report the change"
+        assert config.get_max_duration() == 60
+        print("✓ max_duration_seconds change picked up from disk")
+
+
+def test_invalid_file_keeps_settings():
+    """A broken config file should not reset settings to defaults."""
+    print("\n=== Testing Invalid File Handling ===\n")
+
+    with tempfile.TemporaryDirectory() as directory:
+        config = _make_config(directory)
+        new_settings = dict(config.settings)
+        new_settings["max_duration_seconds"] = 90
+        config.update(new_settings)
+
+        with open(config.config_path, "w") as f:
+            f.write("{ not json")
+
+        assert config.reload() == {}
+        assert config.get_max_duration() == 90
+        print("✓ Settings kept when the file cannot be parsed")
+
+
+def test_update_rejects_invalid_settings():
+    """Config.update should neither save nor apply invalid settings."""
+    print("\n=== Testing Invalid Update ===\n")
+
+    with tempfile.TemporaryDirectory() as directory:
+        config = _make_config(directory)
+        events = []
+        config.subscribe(["typing_max_chars", "hotkey_profiles"], events.append)
+
+        for bad in ({"typing_max_chars": "ten"}, {"hotkey_profiles": [{"shortcut": "Ctrl+Alt+X"}]}):
+            try:
+                config.update(dict(config.settings, **bad))
+                assert False, f"{bad} accepted"
+            except ValueError:
+                pass
+
+        assert events == [], "Subscribers notified of invalid settings"
+        assert config.settings.get("typing_max_chars") == Config.DEFAULT_CONFIG["typing_max_chars"]
+        if config.config_path.exists():
+            with open(config.config_path) as f:
+                assert json.load(f).get("typing_max_chars") != "ten"
+        print("✓ Invalid settings raised ValueError and were not saved or applied")
+
+
+class FakeModel:
+    """Model stand-in that answers with its own name."""
+
+    def __init__(self, name):
+        self.name = name
+
+    def transcribe(self, audio, **options):
+        return iter([Segment(f" {self.name}")]), TranscriptionInfo("en", 1.0)
+
+
+def test_model_reload_keeps_cache_keys():
+    """Until a reloaded model is swapped in, transcripts are cached under the old one."""
+    print("\n=== Testing Model Reload and Cache Keys ===\n")
+
+    # The process-wide log file may be opened in the first Config's directory
+    with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as directory:
+        config = _make_config(directory)
+        audio_path = Path(directory) / "speech.wav"
+        with wave.open(str(audio_path), "wb") as f:
+            f.setnchannels(1)
+            f.setsampwidth(2)
+            f.setframerate(16000)
+            f.writeframes(b"\0\0" * 16000)
+
+        release = threading.Event()
+
+        def load_model(engine, source, cpu_threads=0, compute_type=None):
+            if source == "small.en":
+                release.wait(5)
+            return FakeModel(source)
+
+        cache = TranscriptCache(cache_dir=Path(directory) / "transcripts")
+        with mock.patch.object(local_transcriber, "load_model", load_model), \
+                mock.patch.object(transcript_cache, "_cache", cache):
+            transcriber = LocalTranscriber(config=config, benchmark=False)
+            transcriber.warm_up()
+            old_key = transcriber.cache_key(audio_path)
+
+            new_settings = dict(config.settings)
+            new_settings["local_model_id"] = "small.en"
+            config.update(new_settings)
+            time.sleep(0.1)  # The reload is now waiting for the load
+
+            assert transcriber.model_id == "", "Settings changed before the model did"
+            assert transcriber.transcribe(audio_path, cleanup=False) == "base"
+            assert cache.get(old_key) == {"text": "base"}
+            print("✓ Old model's transcript cached under the old model's key")
+
+            release.set()
+            deadline = time.time() + 2.0
+            while transcriber.model_id != "small.en" and time.time() < deadline:
+                time.sleep(0.02)
+            assert transcriber.model_id == "small.en"
+            new_key = transcriber.cache_key(audio_path)
+            assert new_key != old_key and cache.get(new_key) is None
+            assert transcriber.transcribe(audio_path, cleanup=False) == "small.en"
+            assert cache.get(new_key) == {"text": "small.en"}
+            print("✓ Settings and cache key switch when the new model is swapped in")
+
+
+if __name__ == "__main__":
+    test_update_notifies_subscribers()
+    test_reload_from_disk()
+    test_invalid_file_keeps_settings()
+    test_update_rejects_invalid_settings()
+    test_model_reload_keeps_cache_keys()
+    print("\nAll config reload tests passed!")
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""Test the control socket server and CLI client."""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.control_server import ControlServer, send_command
+from src import ctl
+
+
+def test_commands_round_trip():
+    """Commands should reach their handlers and return results."""
+    print("=== Testing Control Socket Round Trip ===\n")
+
+    state = {"recording": False}
+
+    def toggle():
+        state["recording"] = not state["recording"]
+        return "Recording started" if state["recording"] else "hello world"
+
+    def transcribe_file(path, paste=False):
+        return f"transcribed {Path(path).name} paste={paste}"
+
+    with tempfile.TemporaryDirectory() as directory:
+        socket_path = Path(directory) / "voice-ctrl.sock"
+        server = ControlServer({
+            "toggle": toggle,
+            "status": lambda: dict(state),
+            "transcribe-file": transcribe_file,
+        }, socket_path=socket_path)
+        server.start()
+
+        try:
+            started = time.perf_counter()
+            reply = send_command("status", socket_path=socket_path, timeout=2.0)
+            elapsed = time.perf_counter() - started
+            assert reply == {"ok": True, "result": {"recording": False}}, reply
+            print(f"✓ status answered in {elapsed * 1000:.2f} ms")
+
+            assert send_command("toggle", socket_path=socket_path)["result"] == "Recording started"
+            assert send_command("toggle", socket_path=socket_path)["result"] == "hello world"
+            print("✓ toggle reached the handler twice")
+
+            reply = send_command("transcribe-file", {"path": "/tmp/a.wav", "paste": True}, socket_path=socket_path)
+            assert reply["result"] == "transcribed a.wav paste=True", reply
+            print("✓ transcribe-file arguments passed through")
+
+            reply = send_command("metrics", socket_path=socket_path)
+            assert not reply["ok"] and "Unknown command" in reply["error"]
+            print("✓ Unknown commands are reported as errors")
+
+            assert ctl.main(["--socket", str(socket_path), "status"]) == 0
+            print("✓ CLI client exits 0")
+        finally:
+            server.stop()
+
+        assert not socket_path.exists(), "Socket file should be removed on stop"
+
+
+def test_not_running():
+    """The client should fail cleanly when no daemon is listening."""
+    print("\n=== Testing Client Without Daemon ===\n")
+
+    with tempfile.TemporaryDirectory() as directory:
+        socket_path = Path(directory) / "voice-ctrl.sock"
+        assert ctl.main(["--socket", str(socket_path), "toggle"]) == 1
+        print("✓ CLI client exits 1 when the daemon is not running")
+
+
+def test_stale_socket_replaced():
+    """A socket file left by a crashed daemon should not block startup."""
+    print("\n=== Testing Stale Socket ===\n")
+
+    with tempfile.TemporaryDirectory() as directory:
+        socket_path = Path(directory) / "voice-ctrl.sock"
+        first = ControlServer({"status": lambda: "first"}, socket_path=socket_path)
+        first.start()
+        # Simulate a crash: stop serving but leave the file behind
+        first.server.shutdown()
+        first.server.server_close()
+
+        second = ControlServer({"status": lambda: "second"}, socket_path=socket_path)
+        second.start()
+        try:
+            assert send_command("status", socket_path=socket_path)["result"] == "second"
+            print("✓ Stale socket replaced")
+
+            third = ControlServer({}, socket_path=socket_path)
+            try:
+                third.start()
+                raise AssertionError("A second live server should be refused")
+            except RuntimeError:
+                print("✓ Second live instance refused")
+        finally:
+            second.stop()
+
+
+if __name__ == "__main__":
+    test_commands_round_trip()
+    test_not_running()
+    test_stale_socket_replaced()
+    print("\nAll control server tests passed!")
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""Test the passive key grab hotkey against a headless Xvfb server.
+
+The end-to-end test starts Xvfb, grabs a shortcut, and presses keys with
+XTest from a second connection, with and without Caps Lock and Num Lock.
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.hotkey_grabber import HotkeyGrabber, shortcut_to_grab
+from test_key_typer import start_xvfb
+
+
+def test_shortcut_to_grab():
+    """Parsed shortcuts split into modifiers and one keysym."""
+    print("=== Testing Shortcut Conversion ===\n")
+
+    assert shortcut_to_grab("<ctrl>+<shift>+<space>") == ({"<ctrl>", "<shift>"}, 0x20)
+    assert shortcut_to_grab("<alt>+<f1>") == ({"<alt>"}, 0xffbe)
+    assert shortcut_to_grab("<cmd>+<page_down>") == ({"<cmd>"}, 0xff56)
+    assert shortcut_to_grab("<ctrl>+a") == ({"<ctrl>"}, ord("a"))
+    print("✓ Modifiers, named keys and characters")
+
+    for invalid in ("<ctrl>+<shift>", "<ctrl>+a+b", "<ctrl>+<bogus>"):
+        try:
+            shortcut_to_grab(invalid)
+            assert False, f"{invalid} should be rejected"
+        except ValueError:
+            pass
+    print("✓ Shortcuts without exactly one key rejected")
+
+
+class KeyPresser:
+    """Second X client that presses keys with XTest."""
+
+    def __init__(self, display_name):
+        from Xlib import X, XK, display as xdisplay
+        from Xlib.ext import xtest
+        self.X = X
+        self.XK = XK
+        self.xtest = xtest
+        self.display = xdisplay.Display(display_name)
+
+    def keycode(self, name):
+        return self.display.keysym_to_keycode(self.XK.string_to_keysym(name))
+
+    def press(self, *names, release=True):
+        """Press keys in order, then release them in reverse order."""
+        codes = [self.keycode(name) for name in names]
+        for code in codes:
+            self.xtest.fake_input(self.display, self.X.KeyPress, code)
+        if release:
+            for code in reversed(codes):
+                self.xtest.fake_input(self.display, self.X.KeyRelease, code)
+        self.display.sync()
+
+    def release(self, *names):
+        for name in names:
+            self.xtest.fake_input(self.display, self.X.KeyRelease, self.keycode(name))
+        self.display.sync()
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.time() + timeout
+    while not condition() and time.time() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+def test_grab_in_xvfb():
+    """The shortcut fires once per press, whatever the lock keys' state."""
+    print("\n=== Testing Passive Key Grab (Xvfb) ===\n")
+
+    server = start_xvfb(":96")
+    if server is None:
+        print("Xvfb is not installed; key grab not tested")
+        return
+
+    try:
+        presses = []
+        activated = threading.Event()
+
+        def on_activate():
+            presses.append(time.perf_counter())
+            activated.set()
+
+        shifted = []
+        grabber = HotkeyGrabber({
+            "<ctrl>+<alt>+h": on_activate,
+            "<ctrl>+<alt>+<shift>+h": lambda: shifted.append(time.perf_counter()),
+        }, display_name=":96")
+        grabber.start()
+        keys = KeyPresser(":96")
+
+        started = time.perf_counter()
+        keys.press("Control_L", "Alt_L", "h")
+        assert wait_for(lambda: len(presses) == 1)
+        print(f"✓ Shortcut delivered in {(presses[0] - started) * 1000:.2f}ms")
+
+        keys.press("h")
+        keys.press("Control_L", "h")
+        time.sleep(0.1)
+        assert len(presses) == 1, "Other combinations must not be grabbed"
+        print("✓ Other combinations ignored")
+
+        keys.press("Control_L", "Alt_L", "Shift_L", "h")
+        assert wait_for(lambda: len(shifted) == 1)
+        assert len(presses) == 1
+        print("✓ Shortcuts sharing a key call their own function")
+
+        # Caps Lock and Num Lock toggle on press
+        for lock in ("Caps_Lock", "Num_Lock"):
+            keys.press(lock)
+            keys.press("Control_L", "Alt_L", "h")
+            assert wait_for(lambda: len(presses) == 2), f"Not delivered with {lock} on"
+            keys.press(lock)
+            presses.pop()
+        print("✓ Shortcut works with Caps Lock and Num Lock on")
+
+        # Holding the key down fires only once
+        keys.press("Control_L", "Alt_L", "h", release=False)
+        keys.press("h", release=False)
+        keys.press("h", release=False)
+        keys.release("h", "Alt_L", "Control_L")
+        time.sleep(0.1)
+        assert len(presses) == 2, f"Fired {len(presses) - 1} times for one press"
+        print("✓ Held key fires once")
+
+        # A second client cannot take the same combination
+        try:
+            HotkeyGrabber({"<ctrl>+<alt>+h": on_activate}, display_name=":96").start()
+            assert False, "Second grab should fail"
+        except RuntimeError:
+            pass
+        print("✓ Conflicting grab reported")
+
+        grabber.stop()
+        keys.press("Control_L", "Alt_L", "h")
+        time.sleep(0.1)
+        assert len(presses) == 2
+        print("✓ Grab released on stop")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    test_shortcut_to_grab()
+    test_grab_in_xvfb()
+    print("\nAll hotkey grabber tests passed!")
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""Test hotkey profiles: shortcut conflicts, validation and warm models."""
+
+import sys
+import json
+import tempfile
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.config import Config
+from src.shortcuts import find_shortcut_conflicts
+from src.transcriber_pool import TranscriberPool, estimate_model_mb
+
+
+def test_shortcut_conflicts():
+    """Shortcuts with the same keys in any order conflict."""
+    print("=== Testing Shortcut Conflicts ===\n")
+
+    assert find_shortcut_conflicts(["Ctrl+Shift+Space", "Alt+F1", "Ctrl+Alt+R"]) == []
+    assert find_shortcut_conflicts(["Ctrl+Shift+Space", "shift+ctrl+space"]) == [
+        ("Ctrl+Shift+Space", "shift+ctrl+space")
+    ]
+    assert find_shortcut_conflicts(["Ctrl+A", "Ctrl+Shift+A"]) == []
+    assert find_shortcut_conflicts(["Ctrl+A", "Nonsense"]) == [("Nonsense", None)]
+    print("✓ Duplicates and invalid shortcuts reported, supersets allowed")
+
+
+def test_profiles_validated():
+    """Malformed profiles reject the config; conflicting ones are dropped."""
+    print("\n=== Testing Profile Validation ===\n")
+
+    # The process-wide log file may be opened in the first Config's directory
+    with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as directory:
+        config_path = Path(directory) / "config.json"
+        profiles = [
+            {"name": "Chat", "shortcut": "Ctrl+Alt+C", "provider": "local", "model": "tiny.en", "beam_size": 1},
+            {"name": "Prose", "shortcut": "Ctrl+Alt+P", "provider": "openai", "paste_strategy": "ctrl_shift_v"},
+            {"name": "Clash", "shortcut": "Shift+Ctrl+Space", "provider": "local"},
+        ]
+        with open(config_path, "w") as f:
+            json.dump({"keyboard_shortcut": "Ctrl+Shift+Space", "hotkey_profiles": profiles}, f)
+
+        config = Config(config_path=config_path, log_path=Path(directory) / "voice-ctrl.log")
+        assert [p["name"] for p in config.get_hotkey_profiles()] == ["Chat", "Prose"]
+        print("✓ Profile clashing with the main shortcut dropped")
+
+        # The exact main shortcut is dropped too, not only a reordering of it
+        same = {"keyboard_shortcut": "Ctrl+Shift+Space", "hotkey_profiles": [
+            {"name": "Main", "shortcut": "Ctrl+Shift+Space"},
+            {"name": "Chat", "shortcut": "Ctrl+Alt+C"},
+        ]}
+        assert config._validate_config(same)
+        assert [p["name"] for p in same["hotkey_profiles"]] == ["Chat"]
+        print("✓ Profile with exactly the main shortcut dropped")
+
+        # Of two profiles with the same shortcut, the first one wins
+        duplicates = {"keyboard_shortcut": "Ctrl+Shift+Space", "hotkey_profiles": [
+            {"name": "First", "shortcut": "Ctrl+Alt+C"},
+            {"name": "Second", "shortcut": "Ctrl+Alt+C"},
+            {"name": "Third", "shortcut": "alt+ctrl+c"},
+        ]}
+        assert config._validate_config(duplicates)
+        assert [p["name"] for p in duplicates["hotkey_profiles"]] == ["First"]
+        print("✓ First of several profiles with the same shortcut kept")
+
+        for bad in (
+            {"name": "X", "shortcut": "Ctrl+Alt+X", "provider": "cloud"},
+            {"name": "X", "shortcut": "Ctrl+Alt+X", "beam_size": 0},
+            {"name": "X", "shortcut": "Ctrl+Alt+X", "paste_strategy": "middle_click"},
+            {"name": "X", "shortcut": "Ctrl+Alt+X", "temperature": 0.5},
+            {"shortcut": "Ctrl+Alt+X"},
+        ):
+            assert not config._validate_config({"hotkey_profiles": [bad]}), f"{bad} accepted"
+        print("✓ Unknown providers, options and strategies rejected")
+
+
+class FakeLocalTranscriber:
+    """Local transcriber stand-in that tracks loading."""
+
+    def __init__(self, config=None, model=None, options=None):
+        self.model_path = ""
+        self.model_id = model or "base"
+        self.options = options
+        self.model = None
+        self.loads = 0
+
+    def is_loaded(self):
+        return self.model is not None
+
+    def warm_up(self):
+        if self.model is None:
+            self.model = object()
+            self.loads += 1
+
+    def unload(self):
+        self.model = None
+
+
+class FakeConfig:
+    def __init__(self, max_mb):
+        self.max_mb = max_mb
+
+    def get_warm_models_max_mb(self):
+        return self.max_mb
+
+
+def test_pool_budget():
+    """Profiles share transcribers and models stay within the memory budget."""
+    print("\n=== Testing Warm Model Budget ===\n")
+
+    assert estimate_model_mb("tiny.en") < estimate_model_mb("small.en") < estimate_model_mb("large-v3")
+    assert estimate_model_mb("Systran/faster-whisper-medium") == estimate_model_mb("medium")
+
+    openai = object()
+    budget = estimate_model_mb("base") + estimate_model_mb("small.en")
+    pool = TranscriberPool(FakeConfig(budget), openai, local_factory=FakeLocalTranscriber)
+
+    assert pool.get({"provider": "openai", "model": "whisper-1"}) is openai
+    chat = {"name": "Chat", "shortcut": "Ctrl+Alt+C", "model": "small.en", "beam_size": 1}
+    assert pool.get(chat) is pool.get(dict(chat, name="Other", shortcut="Ctrl+Alt+O"))
+    assert pool.get(chat) is not pool.get({"model": "small.en", "beam_size": 5})
+    assert pool.get(chat).options == {"beam_size": 1}
+    print("✓ Profiles with the same model and options share a transcriber")
+
+    profiles = [
+        {"provider": "local"},
+        chat,
+        {"provider": "local", "model": "large-v3"},
+    ]
+    pool.warm_up(profiles)
+    assert sorted(pool.loaded_models()) == ["base", "small.en"], pool.loaded_models()
+    print(f"✓ Preloaded {pool.loaded_models()} within {budget} MB, large-v3 left cold")
+
+    large = pool.get(profiles[2])
+    large.warm_up()
+    assert pool.loaded_models() == ["large-v3"], pool.loaded_models()
+    print("✓ Using a cold model unloads the least recently used ones")
+
+
+if __name__ == "__main__":
+    test_shortcut_conflicts()
+    test_profiles_validated()
+    test_pool_budget()
+    print("\nAll hotkey profile tests passed!")
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Test unloading idle local models and reloading them during recording."""
+
+import json
+import sys
+import tempfile
+import threading
+import time
+import wave
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import numpy as np
+
+from src.config import Config
+from src.local_engines import Segment, TranscriptionInfo
+from src.memory_usage import rss_mb
+from src.transcriber_pool import TranscriberPool
+
+# Size of the stand-in model's weights
+MODEL_MB = 200
+
+
+class FakeModel:
+    """Model stand-in holding MODEL_MB of resident memory."""
+
+    def __init__(self, load_seconds=0.0):
+        time.sleep(load_seconds)
+        self.weights = np.ones(MODEL_MB * 1024 * 1024 // 8)
+
+    def transcribe(self, audio, **options):
+        return iter([Segment(" Hello.")]), TranscriptionInfo("en", 1.0)
+
+
+def write_wav(path):
+    with wave.open(str(path), "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(16000)
+        f.writeframes(b"\0\0" * 16000)
+
+
+def test_idle_unload_and_overlapped_reload():
+    """Idle models are released with their memory and reloaded while recording."""
+    print("=== Testing Idle Model Unload ===\n")
+
+    # The process-wide log file may be opened in the first Config's directory
+    with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as directory:
+        config_path = Path(directory) / "config.json"
+        with open(config_path, "w") as f:
+            json.dump({"model_idle_unload_minutes": 1, "transcript_cache_enabled": False}, f)
+        config = Config(config_path=config_path, log_path=Path(directory) / "voice-ctrl.log")
+        assert config.get_model_idle_unload_minutes() == 1
+        assert not config._validate_config({"model_idle_unload_minutes": -1})
+
+        pool = TranscriberPool(config, openai_transcriber=object())
+        transcriber = pool.get({"provider": "local"})
+        transcriber._create_model = lambda settings: FakeModel()
+        transcriber.warm_up()
+        assert transcriber.is_loaded() and len(transcriber.load_latencies_ms) == 1
+
+        assert pool.unload_idle(60) == ([], 0.0), "Recently used models stay loaded"
+
+        transcriber.last_used -= 61
+        unloaded, freed_mb = pool.unload_idle(60)
+        assert unloaded == ["base"] and not transcriber.is_loaded()
+        if rss_mb() is not None:
+            assert freed_mb > MODEL_MB * 0.8, f"Only {freed_mb:.0f} MB released"
+        print(f"✓ Idle model unloaded, {freed_mb:.0f} MB released")
+
+        # The hotkey starts loading when recording starts; by the time the
+        # recording stops, most of the load is done
+        transcriber._create_model = lambda settings: FakeModel(load_seconds=0.3)
+        threading.Thread(target=transcriber.warm_up, daemon=True).start()
+        time.sleep(0.2)  # Speaking
+        audio_path = Path(directory) / "speech.wav"
+        write_wav(audio_path)
+        assert transcriber.transcribe(audio_path, cleanup=False) == "Hello."
+        wait_ms = transcriber.wait_latencies_ms[-1]
+        load_ms = transcriber.load_latencies_ms[-1]
+        assert 0 < wait_ms < load_ms, (wait_ms, load_ms)
+        print(f"✓ Reload overlapped with recording: waited {wait_ms} ms of a {load_ms} ms load")
+
+        stats = pool.load_stats()
+        assert stats["load_ms"] == list(transcriber.load_latencies_ms)
+        assert stats["wait_ms"] == [wait_ms]
+        print("✓ Load and wait times reported")
+
+
+if __name__ == "__main__":
+    test_idle_unload_and_overlapped_reload()
+    print("\nAll idle unload tests passed!")
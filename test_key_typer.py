@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""Test XTest typing against a headless Xvfb server.
+
+The end-to-end test starts Xvfb, focuses a client window that records the
+characters it receives, and compares them with the typed text. Run this
+file directly to also see typing throughput.
+"""
+
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.key_typer import KeyTyper, char_to_keysym, RETURN_KEYSYM
+
+
+def test_char_to_keysym():
+    """Characters map to Latin-1 or Unicode keysyms."""
+    print("=== Testing Keysym Mapping ===\n")
+
+    assert char_to_keysym("a") == 0x61
+    assert char_to_keysym("é") == 0xe9
+    assert char_to_keysym("ł") == 0x01000142
+    assert char_to_keysym("€") == 0x010020ac
+    assert char_to_keysym("\n") == RETURN_KEYSYM
+    assert char_to_keysym("\x07") is None
+    print("✓ ASCII, Latin-1, Unicode and control characters")
+
+
+def start_xvfb(display_name=":97"):
+    """Start Xvfb on display_name.
+
+    Returns:
+        Popen handle, or None if Xvfb is not installed
+    """
+    if not shutil.which("Xvfb"):
+        return None
+    server = subprocess.Popen(
+        ["Xvfb", display_name, "-screen", "0", "640x480x24", "-nolisten", "tcp"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+    socket_path = Path(f"/tmp/.X11-unix/X{display_name[1:]}")
+    deadline = time.time() + 5
+    while not socket_path.exists() and time.time() < deadline:
+        time.sleep(0.05)
+    return server
+
+
+class RecordingClient:
+    """Focused window that decodes the key presses it receives."""
+
+    def __init__(self, display_name):
+        from Xlib import X, display as xdisplay
+        self.X = X
+        self.display = xdisplay.Display(display_name)
+        root = self.display.screen().root
+        self.window = root.create_window(0, 0, 200, 100, 0, X.CopyFromParent, event_mask=X.KeyPressMask)
+        self.window.map()
+        self.display.sync()
+        self.window.set_input_focus(X.RevertToParent, X.CurrentTime)
+        self.display.sync()
+
+    def read(self, expected_length, timeout=5.0):
+        """Collect typed characters until expected_length arrive."""
+        X = self.X
+        chars = []
+        deadline = time.time() + timeout
+        while len(chars) < expected_length and time.time() < deadline:
+            if not self.display.pending_events():
+                time.sleep(0.005)
+                continue
+            event = self.display.next_event()
+            if event.type == X.MappingNotify:
+                self.display.refresh_keyboard_mapping(event)
+            elif event.type == X.KeyPress:
+                level = 1 if event.state & X.ShiftMask else 0
+                keysym = self.display.keycode_to_keysym(event.detail, level)
+                if keysym == RETURN_KEYSYM:
+                    chars.append("\n")
+                elif keysym & 0x01000000:
+                    chars.append(chr(keysym & 0xffffff))
+                elif 0x20 <= keysym <= 0xff:
+                    chars.append(chr(keysym))
+        return "".join(chars)
+
+
+def test_typing_into_xvfb(rounds=1):
+    """Typed text arrives intact, including characters missing from the layout."""
+    print("\n=== Testing XTest Typing (Xvfb) ===\n")
+
+    server = start_xvfb()
+    if server is None:
+        print("Xvfb is not installed; end-to-end typing not tested")
+        return
+
+    try:
+        client = RecordingClient(":97")
+        typer = KeyTyper(":97")
+        text = "Hello, World! Grüße aus Łódź: 5€ & ½ price.\nNext line"
+
+        for _ in range(rounds):
+            started = time.perf_counter()
+            assert typer.type_text(text)
+            elapsed = time.perf_counter() - started
+            received = client.read(len(text))
+            assert received == text, f"Received {received!r}"
+            print(f"✓ Typed {len(text)} characters in {elapsed * 1000:.2f}ms "
+                  f"({len(text) / elapsed:.0f} chars/s)")
+
+        typer.close()
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    test_char_to_keysym()
+    test_typing_into_xvfb(rounds=5)
+    print("\nAll key typer tests passed!")
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""Test the whisper.cpp engine and discovery of ggml models."""
+
+import os
+import stat
+import sys
+import tempfile
+import wave
+from pathlib import Path
+from unittest import mock
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import av
+import numpy as np
+
+from src import local_engines
+from src.local_engines import WhisperCppModel, find_ggml_model, is_ggml_model, load_model
+from src.model_scanner import ModelScanner
+
+
+# Stand-in for whisper-cli: prints its arguments' language and two segments
+FAKE_PROGRAM = """#!/bin/sh
+while [ $# -gt 0 ]; do
+    case "$1" in
+        -l) language="$2"; shift ;;
+        -f) audio="$2"; shift ;;
+    esac
+    shift
+done
+if [ ! -f "$audio" ]; then echo "cannot read $audio" >&2; exit 2; fi
+echo " Hello from $language."
+echo ""
+echo " Second segment."
+"""
+
+
+def write_ggml(path, magic=b"lmgg"):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(magic + b"\0" * 60)
+    return path
+
+
+def test_ggml_detection_and_scan():
+    """ggml files are recognized by magic and listed with the whisper.cpp engine."""
+    print("=== Testing ggml Model Discovery ===\n")
+
+    with tempfile.TemporaryDirectory() as directory:
+        root = Path(directory)
+        quantized = write_ggml(root / "whisper.cpp" / "ggml-base.en-q5_1.bin")
+        gguf = write_ggml(root / "models" / "small.gguf", magic=b"GGUF")
+        (root / "other.bin").write_bytes(b"\x00" * 64)
+
+        assert is_ggml_model(quantized) and is_ggml_model(gguf)
+        assert not is_ggml_model(root / "other.bin"), "Random .bin files are not models"
+        print("✓ ggml and GGUF files detected by their magic number")
+
+        # A faster-whisper model directory next to them
+        ct2 = root / "faster-whisper-tiny"
+        ct2.mkdir()
+        (ct2 / "model.bin").write_bytes(b"\0")
+        (ct2 / "config.json").write_text("{}")
+
+        models = {m['path']: m for m in ModelScanner().scan_folder_sync(root)}
+        assert models[str(quantized)]['engine'] == "whisper.cpp"
+        assert models[str(quantized)]['name'] == "whisper.cpp base.en (q5_1)"
+        assert models[str(gguf)]['name'] == "whisper.cpp small"
+        assert models[str(ct2)]['engine'] == "faster-whisper"
+        assert str(root / "other.bin") not in models
+        print("✓ Scanner lists both engines' models")
+
+        with mock.patch.object(local_engines, "GGML_MODEL_DIRS", [root / "whisper.cpp"]):
+            assert find_ggml_model("base.en-q5_1") == quantized
+            assert find_ggml_model(str(gguf)) == gguf
+            assert find_ggml_model("large-v3") is None
+        print("✓ Models found by name or path")
+
+
+def test_whisper_cli_fallback():
+    """Without the bindings, transcription streams segments from whisper-cli."""
+    print("\n=== Testing whisper-cli Engine ===\n")
+
+    with tempfile.TemporaryDirectory() as directory:
+        root = Path(directory)
+        model_path = write_ggml(root / "ggml-tiny.bin")
+        program = root / "whisper-cli"
+        program.write_text(FAKE_PROGRAM)
+        program.chmod(program.stat().st_mode | stat.S_IEXEC)
+
+        with mock.patch.dict(sys.modules, {"pywhispercpp": None, "pywhispercpp.model": None}), \
+                mock.patch.dict(os.environ, {"PATH": f"{root}{os.pathsep}{os.environ['PATH']}"}):
+            model = load_model("whisper.cpp", str(model_path), cpu_threads=2)
+            assert isinstance(model, WhisperCppModel)
+
+            # In-memory audio is written to a temporary WAV for the program
+            audio = np.zeros(32000, dtype=np.float32)
+            segments, info = model.transcribe(audio, language="en", beam_size=5, vad_filter=True)
+            assert info.duration == 2.0 and info.language == "en"
+            assert [s.text for s in segments] == [" Hello from en.", " Second segment."]
+            print("✓ Segments streamed from the program")
+
+            wav_path = root / "speech.wav"
+            with wave.open(str(wav_path), "wb") as f:
+                f.setnchannels(1)
+                f.setsampwidth(2)
+                f.setframerate(16000)
+                f.writeframes(b"\0\0" * 8000)
+            segments, info = model.transcribe(str(wav_path))
+            assert info.duration == 0.5
+            assert next(iter(segments)).text == " Hello from auto."
+            print("✓ Files transcribed with language detection")
+
+            # Other formats and WAV layouts are decoded to 16 kHz samples first
+            stereo_path = root / "stereo.wav"
+            with wave.open(str(stereo_path), "wb") as f:
+                f.setnchannels(2)
+                f.setsampwidth(2)
+                f.setframerate(44100)
+                f.writeframes(b"\0\0\0\0" * 44100)
+            flac_path = root / "speech.flac"
+            with av.open(str(flac_path), mode="w") as container:
+                stream = container.add_stream("flac", rate=16000, layout="mono")
+                frame = av.AudioFrame.from_ndarray(np.zeros((1, 24000), dtype=np.int16), format="s16", layout="mono")
+                frame.sample_rate = 16000
+                for packet in stream.encode(frame):
+                    container.mux(packet)
+                for packet in stream.encode(None):
+                    container.mux(packet)
+            for path, seconds in ((stereo_path, 1.0), (flac_path, 1.5)):
+                segments, info = model.transcribe(str(path), language="en")
+                assert abs(info.duration - seconds) < 0.05, (path, info.duration)
+                assert next(iter(segments)).text == " Hello from en."
+            print("✓ Non-WAV files and other WAV layouts decoded first")
+
+            segments = model._run_program(str(root / "missing.wav"), "en", None, None)
+            try:
+                list(segments)
+                assert False, "A failing program must raise"
+            except RuntimeError as e:
+                assert "cannot read" in str(e)
+            print("✓ Program failures raised")
+
+        with mock.patch.dict(sys.modules, {"pywhispercpp": None, "pywhispercpp.model": None}), \
+                mock.patch.object(local_engines.shutil, "which", return_value=None):
+            try:
+                WhisperCppModel(model_path)
+                assert False, "Missing whisper.cpp must raise ImportError"
+            except ImportError:
+                pass
+        print("✓ Missing whisper.cpp reported as not installed")
+
+
+if __name__ == "__main__":
+    test_ggml_detection_and_scan()
+    test_whisper_cli_fallback()
+    print("\nAll local engine tests passed!")
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""Test the process-wide logging setup."""
+
+import sys
+import json
+import logging
+import tempfile
+from logging.handlers import QueueHandler
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.config import Config
+from src.notifier import Notifier
+from src.model_scanner import ModelScanner
+from src.logging_setup import PERF_LOGGER_NAME, JsonLinesFormatter
+
+
+def _make_config(directory):
+    """Create a Config backed by a temporary config file."""
+    return Config(
+        config_path=Path(directory) / "config.json",
+        log_path=Path(directory) / "voice-ctrl.log"
+    )
+
+
+def test_single_queue_handler():
+    """Creating several components should not stack or replace handlers."""
+    print("=== Testing Single Logging Initialization ===\n")
+
+    with tempfile.TemporaryDirectory() as directory:
+        config = _make_config(directory)
+        Notifier(log_path=config.log_path)
+        ModelScanner(log_path=config.log_path)
+        _make_config(directory)
+
+        root = logging.getLogger()
+        queue_handlers = [h for h in root.handlers if isinstance(h, QueueHandler)]
+        assert len(queue_handlers) == 1, f"Expected one QueueHandler, got {root.handlers}"
+        assert not logging.getLogger(PERF_LOGGER_NAME).propagate
+        print("✓ Root logger has exactly one QueueHandler")
+
+
+def test_log_level_applied():
+    """log_level and perf_log_enabled should take effect on update."""
+    print("\n=== Testing Runtime Log Settings ===\n")
+
+    with tempfile.TemporaryDirectory() as directory:
+        config = _make_config(directory)
+        perf_logger = logging.getLogger(PERF_LOGGER_NAME)
+
+        try:
+            new_settings = dict(config.settings)
+            new_settings["log_level"] = "debug"
+            new_settings["perf_log_enabled"] = True
+            config.update(new_settings)
+
+            assert logging.getLogger().level == logging.DEBUG
+            assert perf_logger.isEnabledFor(logging.INFO)
+            print("✓ Log level and perf log applied without restart")
+        finally:
+            new_settings = dict(config.settings)
+            new_settings["log_level"] = "ERROR"
+            new_settings["perf_log_enabled"] = False
+            config.update(new_settings)
+
+        assert logging.getLogger().level == logging.ERROR
+        assert not perf_logger.isEnabledFor(logging.INFO)
+        print("✓ Defaults restored")
+
+
+def test_invalid_log_level_rejected():
+    """Unknown level names should fail validation."""
+    print("\n=== Testing Log Level Validation ===\n")
+
+    with tempfile.TemporaryDirectory() as directory:
+        config = _make_config(directory)
+        assert not config._validate_config({"log_level": "LOUD"})
+        assert not config._validate_config({"log_max_bytes": 0})
+        assert config._validate_config({"log_level": "info", "log_backup_count": 5})
+        print("✓ Invalid logging settings rejected")
+
+
+def test_perf_record_format():
+    """Perf spans should be formatted as one JSON object per line."""
+    print("\n=== Testing Perf Record Format ===\n")
+
+    record = logging.LogRecord(PERF_LOGGER_NAME, logging.INFO, __file__, 0, "transcribe", None, None)
+    record.perf_fields = {"provider": "local", "duration_ms": 812.5}
+    entry = json.loads(JsonLinesFormatter().format(record))
+
+    assert entry["span"] == "transcribe"
+    assert entry["provider"] == "local"
+    assert entry["duration_ms"] == 812.5
+    print("✓ Perf span serialized as JSON")
+
+
+if __name__ == "__main__":
+    test_single_queue_handler()
+    test_log_level_applied()
+    test_invalid_log_level_rejected()
+    test_perf_record_format()
+    print("\nAll logging setup tests passed!")
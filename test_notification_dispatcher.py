@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""Test the background notification dispatcher."""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.notifier import NotificationDispatcher
+
+
+class SlowSender:
+    """Records notifications, blocking until released."""
+
+    def __init__(self):
+        self.sent = []
+        self.release = threading.Event()
+
+    def __call__(self, title, message, timeout):
+        self.release.wait(2.0)
+        self.sent.append((title, message))
+
+
+def test_submit_does_not_block():
+    """submit() should return immediately even if showing hangs."""
+    print("=== Testing Non-blocking Submit ===\n")
+
+    sender = SlowSender()
+    dispatcher = NotificationDispatcher(send=sender, min_interval=0)
+
+    started = time.perf_counter()
+    dispatcher.submit("Voice Control - Error", "first")
+    dispatcher.submit("Voice Control - Error", "second")
+    elapsed = time.perf_counter() - started
+
+    sender.release.set()
+    dispatcher.wait_until_idle()
+
+    assert elapsed < 0.1, f"submit blocked for {elapsed:.3f}s"
+    assert len(sender.sent) == 2
+    print(f"✓ Two submits took {elapsed * 1000:.2f} ms while the sender was blocked")
+
+
+def test_repeats_are_coalesced():
+    """Identical errors should be folded into one notification."""
+    print("\n=== Testing Coalescing ===\n")
+
+    sender = SlowSender()
+    dispatcher = NotificationDispatcher(send=sender, min_interval=0)
+
+    # The first one is picked up by the worker and blocks in the sender
+    dispatcher.submit("Voice Control - Error", "blocker")
+    time.sleep(0.05)
+    for _ in range(5):
+        dispatcher.submit("Voice Control - API Failure", "Failed to transcribe audio.")
+
+    sender.release.set()
+    dispatcher.wait_until_idle()
+
+    # Repeats right after it was shown are suppressed
+    assert not dispatcher.submit("Voice Control - API Failure", "Failed to transcribe audio.")
+
+    assert sender.sent[1] == (
+        "Voice Control - API Failure", "Failed to transcribe audio. (repeated 5 times)"
+    ), sender.sent
+    assert dispatcher.coalesced == 5
+    print("✓ Five identical errors shown once with a repeat count")
+
+
+def test_queue_is_bounded():
+    """Distinct notifications beyond the queue size should be dropped."""
+    print("\n=== Testing Bounded Queue ===\n")
+
+    sender = SlowSender()
+    dispatcher = NotificationDispatcher(send=sender, max_queued=3, min_interval=0)
+
+    dispatcher.submit("Voice Control - Error", "blocker")
+    time.sleep(0.05)
+    for i in range(10):
+        dispatcher.submit("Voice Control - Error", f"message {i}")
+
+    sender.release.set()
+    dispatcher.wait_until_idle()
+
+    assert len(sender.sent) == 4, sender.sent
+    assert dispatcher.dropped == 7
+    print("✓ Queue kept 3 pending notifications and dropped the rest")
+
+
+def test_wait_until_idle_is_bounded():
+    """Waiting for a hung sender should give up after the timeout."""
+    print("\n=== Testing Bounded Wait ===\n")
+
+    sender = SlowSender()
+    dispatcher = NotificationDispatcher(send=sender, min_interval=0)
+    assert dispatcher.wait_until_idle(timeout=0.1), "An empty queue is idle"
+
+    dispatcher.submit("Voice Control - Invalid Keyboard Shortcut", "'Nonsense' is not valid.")
+    started = time.perf_counter()
+    assert not dispatcher.wait_until_idle(timeout=0.2)
+    elapsed = time.perf_counter() - started
+    assert elapsed < 1.0, f"Waited {elapsed:.2f}s"
+
+    sender.release.set()
+    assert dispatcher.wait_until_idle(timeout=2.0)
+    assert len(sender.sent) == 1
+    print(f"✓ Gave up after {elapsed * 1000:.0f} ms, then drained once the sender returned")
+
+
+if __name__ == "__main__":
+    test_submit_does_not_block()
+    test_repeats_are_coalesced()
+    test_queue_is_bounded()
+    test_wait_until_idle_is_bounded()
+    print("\nAll notification dispatcher tests passed!")
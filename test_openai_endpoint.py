@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""Test transcription through an OpenAI-compatible server.
+
+A local stand-in server implements the transcription and model list
+endpoints, so nothing leaves the machine.
+"""
+
+import sys
+import json
+import tempfile
+import threading
+import wave
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.config import Config
+from src.transcriber import WhisperTranscriber, probe_endpoint
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Minimal OpenAI-compatible transcription server."""
+
+    requests = []
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status, body):
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.path == "/v1/models":
+            self._reply(200, {"object": "list", "data": [{"id": "small.en", "object": "model"}]})
+        else:
+            self._reply(404, {"error": "not found"})
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        StandInHandler.requests.append({
+            "path": self.path,
+            "api_key": self.headers.get("X-Api-Key"),
+            "model": b'name="model"\r\n\r\nsmall.en' in body,
+        })
+        if self.path != "/v1/audio/transcriptions":
+            self._reply(404, {"error": "not found"})
+        elif self.headers.get("X-Api-Key") != "secret":
+            self._reply(401, {"error": {"message": "bad key"}})
+        else:
+            self._reply(200, {"text": "Hello from the LAN server."})
+
+
+def start_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def write_silence(path, seconds=0.5):
+    with wave.open(str(path), "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(16000)
+        f.writeframes(b"\0\0" * int(16000 * seconds))
+
+
+def test_self_hosted_transcription():
+    """Requests go to the configured server with its model and header."""
+    print("=== Testing OpenAI-Compatible Server ===\n")
+
+    server = start_server()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/v1"
+    try:
+        # The process-wide log file may be opened in the first Config's directory
+        with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as directory:
+            config_path = Path(directory) / "config.json"
+            with open(config_path, "w") as f:
+                json.dump({
+                    "openai_base_url": base_url + "/",
+                    "openai_model": "small.en",
+                    "openai_timeout_seconds": 5,
+                    "openai_auth_header": "X-Api-Key: secret",
+                    "transcript_cache_enabled": False,
+                }, f)
+            config = Config(config_path=config_path, log_path=Path(directory) / "voice-ctrl.log")
+            assert config.get_openai_base_url() == base_url
+            assert not config.uses_openai_api()
+
+            transcriber = WhisperTranscriber(config=config)
+            audio_path = Path(directory) / "clip.wav"
+            write_silence(audio_path)
+
+            text = transcriber.transcribe(audio_path, cleanup=False)
+            assert text == "Hello from the LAN server.", text
+            request = StandInHandler.requests[-1]
+            assert request["path"] == "/v1/audio/transcriptions"
+            assert request["api_key"] == "secret" and request["model"]
+            print("✓ Transcribed without an OpenAI API key, model and header sent")
+
+            stats = transcriber.latency_stats()
+            assert stats["count"] == 1
+            print(f"✓ Request latency tracked ({stats['last']} ms)")
+
+            result = transcriber.probe()
+            assert result["ok"] and result["status"] == 200, result
+            print(f"✓ Health probe: {result['detail']} ({result['latency_ms']} ms)")
+
+            # A changed header applies to the next request
+            config.update(dict(config.settings, openai_auth_header="X-Api-Key: wrong"))
+            assert transcriber.transcribe(audio_path, cleanup=False) is None
+            assert StandInHandler.requests[-1]["api_key"] == "wrong"
+            assert transcriber.latency_stats()["count"] == 1
+            print("✓ Rejected request reported, not counted")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_probe_failures():
+    """The probe tells unreachable servers from ones without /models."""
+    print("\n=== Testing Health Probe ===\n")
+
+    server = start_server()
+    port = server.server_address[1]
+    try:
+        result = probe_endpoint(f"http://127.0.0.1:{port}/other")
+        assert result["ok"] and result["status"] == 404, result
+        print(f"✓ {result['detail']}")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    result = probe_endpoint(f"http://127.0.0.1:{port}/v1", timeout=1.0)
+    assert not result["ok"] and result["status"] is None, result
+    print(f"✓ {result['detail']}")
+
+
+if __name__ == "__main__":
+    test_self_hosted_transcription()
+    test_probe_failures()
+    print("\nAll OpenAI-compatible endpoint tests passed!")
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""Test learning of per-application paste strategies."""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.config import Config
+from src.paste_profiles import PasteProfiles, STRATEGIES
+
+
+def test_failures_rotate_then_slow_down():
+    """Failed pastes try the next keystroke, then add delay; successes relax it."""
+    print("=== Testing Strategy Learning ===\n")
+
+    with tempfile.TemporaryDirectory() as directory:
+        profiles = PasteProfiles(path=Path(directory) / "profiles.json")
+        assert profiles.get("gedit") == {"strategy": "shift_insert", "delay": 0.0, "override": False}
+
+        # A fast native app stays on the default with no delay
+        for _ in range(10):
+            profiles.record("gedit", "shift_insert", True)
+        assert profiles.get("gedit")["delay"] == 0.0
+
+        # A terminal that ignores Shift+Insert moves on to Ctrl+Shift+V
+        learned = profiles.record("kitty", "shift_insert", False)
+        assert learned["strategy"] == "ctrl_shift_v" and learned["delay"] == 0.0
+        profiles.record("kitty", "ctrl_shift_v", True)
+        assert profiles.get("kitty")["strategy"] == "ctrl_shift_v"
+        print("✓ Failed keystroke replaced by the next one")
+
+        # An app that fails with every keystroke gets a delay
+        for strategy in STRATEGIES:
+            learned = profiles.record("slow-app", strategy, False)
+        assert learned == {"strategy": "shift_insert", "delay": PasteProfiles.DELAY_STEP, "override": False}
+        for strategy in STRATEGIES:
+            learned = profiles.record("slow-app", strategy, False)
+        assert learned["delay"] == PasteProfiles.DELAY_STEP * 2
+        print(f"✓ Delay grows to {learned['delay']}s after every keystroke failed")
+
+        for _ in range(PasteProfiles.RELAX_AFTER):
+            learned = profiles.record("slow-app", "shift_insert", True)
+        assert learned["delay"] == PasteProfiles.DELAY_STEP
+        print(f"✓ Delay relaxed to {learned['delay']}s after {PasteProfiles.RELAX_AFTER} successes")
+
+        # Learned profiles survive a restart
+        reloaded = PasteProfiles(path=Path(directory) / "profiles.json")
+        assert reloaded.get("kitty")["strategy"] == "ctrl_shift_v"
+        assert reloaded.get("slow-app")["delay"] == PasteProfiles.DELAY_STEP
+        print("✓ Profiles reloaded from disk")
+
+
+def test_overrides_win():
+    """User overrides are used as-is and never learned over."""
+    print("\n=== Testing Overrides ===\n")
+
+    with tempfile.TemporaryDirectory() as directory:
+        profiles = PasteProfiles(
+            path=Path(directory) / "profiles.json",
+            overrides={"Code": {"strategy": "ctrl_v", "delay": 0.2}}
+        )
+        assert profiles.get("code") == {"strategy": "ctrl_v", "delay": 0.2, "override": True}
+        profiles.record("code", "ctrl_v", False)
+        assert profiles.get("code")["strategy"] == "ctrl_v"
+        assert profiles.get(None)["strategy"] == "shift_insert"
+        assert not (Path(directory) / "profiles.json").exists(), "Nothing learned for overridden apps"
+        print("✓ Override used and left unchanged")
+
+    # The process-wide log file may be opened in the first Config's directory
+    with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as directory:
+        config = Config(config_path=Path(directory) / "config.json", log_path=Path(directory) / "voice-ctrl.log")
+        assert config._validate_config({"paste_app_overrides": {"code": {"strategy": "type", "delay": 0.2}}})
+        assert not config._validate_config({"paste_app_overrides": {"code": {"strategy": "middle_click"}}})
+        assert not config._validate_config({"paste_app_overrides": {"code": {"delay": 10}}})
+        print("✓ Overrides with unknown strategies or long delays rejected")
+
+
+def test_proven_strategy_survives_a_miss():
+    """A keystroke that has worked is kept through a stray miss."""
+    print("\n=== Testing Proven Strategies ===\n")
+
+    with tempfile.TemporaryDirectory() as directory:
+        profiles = PasteProfiles(path=Path(directory) / "profiles.json")
+        profiles.record("kitty", "shift_insert", True)
+
+        # Pasting into a window without a text field is missed once
+        learned = profiles.record("kitty", "shift_insert", False)
+        assert learned["strategy"] == "shift_insert"
+        profiles.record("kitty", "shift_insert", True)
+        print("✓ One miss does not unlearn a working keystroke")
+
+        for _ in range(PasteProfiles.PROVEN_MISSES):
+            learned = profiles.record("kitty", "shift_insert", False)
+        assert learned["strategy"] == "ctrl_shift_v"
+        print(f"✓ Given up after {PasteProfiles.PROVEN_MISSES} misses in a row")
+
+
+def test_wait_follows_latency():
+    """The wait for a fetch is bounded by the application's learned latency."""
+    print("\n=== Testing Fetch Timeout ===\n")
+
+    with tempfile.TemporaryDirectory() as directory:
+        profiles = PasteProfiles(path=Path(directory) / "profiles.json")
+        assert profiles.serve_timeout("gedit") == PasteProfiles.DEFAULT_TIMEOUT
+        assert profiles.serve_timeout(None) == PasteProfiles.DEFAULT_TIMEOUT
+
+        for _ in range(5):
+            profiles.record("gedit", "shift_insert", True, latency=0.01)
+        assert profiles.serve_timeout("gedit") == PasteProfiles.MIN_TIMEOUT
+
+        profiles.record("electron", "shift_insert", True, latency=0.2)
+        assert abs(profiles.serve_timeout("electron") - 0.2 * PasteProfiles.LATENCY_FACTOR) < 1e-9
+        for _ in range(5):
+            profiles.record("electron", "shift_insert", True, latency=5.0)
+        assert profiles.serve_timeout("electron") == PasteProfiles.MAX_TIMEOUT
+        print("✓ Timeout scales with latency within its bounds")
+
+
+if __name__ == "__main__":
+    test_failures_rotate_then_slow_down()
+    test_overrides_win()
+    test_proven_strategy_survives_a_miss()
+    test_wait_follows_latency()
+    print("\nAll paste profile tests passed!")
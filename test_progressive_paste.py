@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""Test progressive pasting of transcription segments."""
+
+import sys
+import threading
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.progressive_paste import ProgressivePaste
+
+
+class SlowPaster:
+    """Paster stand-in that records pieces and blocks until released."""
+
+    def __init__(self):
+        self.pasted = []
+        self.release = threading.Event()
+
+    def paste_text(self, text, strategy=None):
+        self.release.wait(2.0)
+        self.pasted.append(text)
+        return True
+
+
+def test_segments_pasted_in_order():
+    """Pieces are pasted in order with spaces between them."""
+    print("=== Testing Progressive Paste ===\n")
+
+    paster = SlowPaster()
+    progressive = ProgressivePaste(paster)
+
+    # Adding never waits for the paste, so decoding can continue
+    for segment in ["Hello there.", "  ", " This is the second segment.", "Third."]:
+        progressive.add(segment)
+    assert paster.pasted == []
+    print("✓ add() returned while the first paste was still running")
+
+    paster.release.set()
+    text = progressive.finish()
+    assert paster.pasted == ["Hello there.", " This is the second segment.", " Third."], paster.pasted
+    assert text == "Hello there. This is the second segment. Third."
+    assert progressive.first_paste_at is not None
+    print(f"✓ Pasted {len(paster.pasted)} pieces: {text!r}")
+
+
+def test_nothing_decoded():
+    """Finishing without segments pastes nothing."""
+    print("\n=== Testing Empty Transcription ===\n")
+
+    paster = SlowPaster()
+    progressive = ProgressivePaste(paster)
+    assert progressive.finish() == ""
+    assert paster.pasted == [] and progressive.first_paste_at is None
+    print("✓ Nothing pasted")
+
+
+if __name__ == "__main__":
+    test_segments_pasted_in_order()
+    test_nothing_decoded()
+    print("\nAll progressive paste tests passed!")
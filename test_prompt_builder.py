@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""Test the context prompt built from the glossary and recent history."""
+
+import sys
+import json
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.config import Config
+from src.history import HistoryManager
+from src.prompt_builder import PromptBuilder
+
+
+def make_config(directory, **settings):
+    """Create a Config with the given prompt settings (context prompting on)."""
+    settings.setdefault("context_prompt_enabled", True)
+    config_path = Path(directory) / "config.json"
+    config_path.write_text(json.dumps(settings))
+    return Config(config_path=config_path)
+
+
+def make_history(directory, texts, age_minutes=1):
+    """Create a history with texts, oldest first, age_minutes apart."""
+    history = HistoryManager(history_path=Path(directory) / "history.json")
+    now = datetime.now()
+    for i, text in enumerate(texts):
+        entry = history.add_entry(text, 1.0)
+        entry["timestamp"] = (now - timedelta(minutes=age_minutes * (len(texts) - i))).strftime("%Y-%m-%d %H:%M:%S")
+    return history
+
+
+class WordTokenizer:
+    """Whitespace tokenizer with the tokenizers.Tokenizer encode() interface."""
+
+    def __init__(self):
+        self.vocab = {}
+        self.calls = 0
+
+    def encode(self, text, add_special_tokens=True):
+        self.calls += 1
+        ids = [self.vocab.setdefault(word, len(self.vocab)) for word in text.split()]
+        return type("Encoding", (), {"ids": ids})()
+
+
+def test_glossary_and_recent_history():
+    """Glossary comes first, then recent dictations oldest first within budget."""
+    print("=== Testing Prompt Layout ===\n")
+
+    with tempfile.TemporaryDirectory() as directory:
+        config = make_config(directory, glossary=["Kubernetes", "PostgreSQL"], prompt_max_tokens=12)
+        history = make_history(directory, ["one two three four five", "six seven", "eight nine ten"])
+        builder = PromptBuilder(history, config)
+
+        prompt = builder.build(WordTokenizer())
+        assert prompt.text == "Glossary: Kubernetes, PostgreSQL. six seven eight nine ten", prompt.text
+        assert len(prompt.tokens) == 8
+        print(f"✓ Prompt: {prompt.text!r}")
+
+        # An entry being re-transcribed only sees what came before it
+        newest = history.get_entries()[0]
+        prompt = builder.build(WordTokenizer(), before=newest)
+        assert prompt.text.endswith("one two three four five six seven"), prompt.text
+        print("✓ Re-transcription prompt excludes the entry itself")
+
+
+def test_tail_and_age_limits():
+    """Long dictations are cut to their last words; stale ones are skipped."""
+    print("\n=== Testing Prompt Limits ===\n")
+
+    with tempfile.TemporaryDirectory() as directory:
+        config = make_config(directory, prompt_max_tokens=3, prompt_history_max_age_minutes=30)
+        history = make_history(directory, ["a b c d e f"])
+        prompt = PromptBuilder(history, config).build(WordTokenizer())
+        assert prompt.text == "d e f", prompt.text
+        print("✓ Newest dictation cut to the budget")
+
+        history = make_history(directory, ["yesterday's topic"], age_minutes=60 * 24)
+        assert PromptBuilder(history, config).build().text == ""
+        print("✓ Stale dictations ignored")
+
+        config = make_config(directory, context_prompt_enabled=False, glossary=["Kubernetes"])
+        assert PromptBuilder(history, config).build().text == ""
+        print("✓ Disabled prompt is empty")
+
+        config_path = Path(directory) / "config.json"
+        config_path.write_text(json.dumps({"glossary": ["Kubernetes"]}))
+        config = Config(config_path=config_path)
+        assert not config.is_context_prompt_enabled()
+        assert PromptBuilder(history, config).build().text == ""
+        print("✓ Prompting is off unless enabled")
+
+
+def test_tokenization_is_cached():
+    """Rebuilding the prompt only tokenizes new pieces."""
+    print("\n=== Testing Token Cache ===\n")
+
+    with tempfile.TemporaryDirectory() as directory:
+        config = make_config(directory, glossary=["voice-ctrl"])
+        history = make_history(directory, ["first dictation", "second dictation"])
+        builder = PromptBuilder(history, config)
+        tokenizer = WordTokenizer()
+
+        first = builder.build(tokenizer)
+        calls = tokenizer.calls
+        assert builder.build(tokenizer) == first
+        assert tokenizer.calls == calls, "Repeated build should not tokenize again"
+
+        history.add_entry("third dictation", 1.0)
+        builder.build(tokenizer)
+        assert tokenizer.calls == calls + 1, "Only the new dictation is tokenized"
+        print(f"✓ {calls} tokenizer calls for the first prompt, 1 for the next")
+
+
+if __name__ == "__main__":
+    test_glossary_and_recent_history()
+    test_tail_and_age_limits()
+    test_tokenization_is_cached()
+    print("\nAll prompt builder tests passed!")
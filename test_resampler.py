@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Test the streaming polyphase resampler used by AudioRecorder."""
+
+import sys
+import time
+from pathlib import Path
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.resampler import PolyphaseResampler
+
+
+def _sine(rate, seconds, frequency=440.0):
+    """Generate a mono float32 sine wave of shape (frames, 1)."""
+    t = np.arange(int(rate * seconds)) / rate
+    return np.sin(2 * np.pi * frequency * t).astype(np.float32)[:, None]
+
+
+def test_common_device_rates():
+    """Resampled sine waves should match a sine generated directly at 16 kHz."""
+    print("=== Testing Common Device Rates ===\n")
+
+    for rate in (48000, 44100, 32000, 22050, 8000):
+        audio = _sine(rate, 2.0)
+        resampler = PolyphaseResampler(rate, 16000)
+
+        started = time.perf_counter()
+        blocks = [resampler.process(audio[i:i + 1024]) for i in range(0, len(audio), 1024)]
+        blocks.append(resampler.flush())
+        elapsed = time.perf_counter() - started
+        output = np.concatenate(blocks)
+
+        assert len(output) == 32000, f"{rate} Hz: expected 32000 samples, got {len(output)}"
+
+        expected = np.sin(2 * np.pi * 440.0 * np.arange(len(output)) / 16000)
+        error = np.abs(output[:, 0] - expected)[200:-200].max()
+        assert error < 0.01, f"{rate} Hz: max error {error:.4f} too large"
+
+        print(f"✓ {rate} Hz -> 16000 Hz: {resampler.taps} taps/phase, "
+              f"max error {error:.5f}, {elapsed * 1000:.1f} ms for 2 s of audio")
+
+
+def test_block_size_independence():
+    """Streaming in blocks should give the same result as one large block."""
+    print("\n=== Testing Block Size Independence ===\n")
+
+    audio = _sine(44100, 1.0, frequency=1000.0)
+
+    one_shot = PolyphaseResampler(44100, 16000)
+    reference = np.concatenate([one_shot.process(audio), one_shot.flush()])
+
+    for block_size in (64, 441, 4096):
+        streaming = PolyphaseResampler(44100, 16000)
+        blocks = [streaming.process(audio[i:i + block_size]) for i in range(0, len(audio), block_size)]
+        blocks.append(streaming.flush())
+        output = np.concatenate(blocks)
+        assert output.shape == reference.shape, f"block {block_size}: shape mismatch"
+        assert np.allclose(output, reference, atol=1e-5), f"block {block_size}: output differs"
+        print(f"✓ Block size {block_size} matches one-shot output")
+
+
+def test_passthrough():
+    """Matching rates should return audio untouched."""
+    print("\n=== Testing Passthrough ===\n")
+
+    audio = _sine(16000, 0.5)
+    resampler = PolyphaseResampler(16000, 16000)
+    assert resampler.is_passthrough
+    output = np.concatenate([resampler.process(audio), resampler.flush()])
+    assert np.array_equal(output, audio)
+    print("✓ 16000 Hz input passes through unchanged")
+
+
+def test_int16_stays_int16():
+    """int16 capture should be resampled without rescaling to float."""
+    print("\n=== Testing int16 Blocks ===\n")
+
+    audio = (_sine(48000, 1.0) * 16000).astype(np.int16)
+    resampler = PolyphaseResampler(48000, 16000)
+    blocks = [resampler.process(audio[i:i + 960]) for i in range(0, len(audio), 960)]
+    blocks.append(resampler.flush(dtype=np.int16))
+    output = np.concatenate(blocks)
+
+    assert output.dtype == np.int16, f"Expected int16 output, got {output.dtype}"
+    assert len(output) == 16000
+    expected = 16000 * np.sin(2 * np.pi * 440.0 * np.arange(len(output)) / 16000)
+    error = np.abs(output[:, 0] - expected)[200:-200].max()
+    assert error < 160, f"Max error {error:.1f} too large"
+    print(f"✓ 48000 Hz int16 -> 16000 Hz int16, max error {error:.1f} LSB")
+
+
+if __name__ == "__main__":
+    test_common_device_rates()
+    test_block_size_independence()
+    test_passthrough()
+    test_int16_stays_int16()
+    print("\nAll resampler tests passed!")
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Test background re-transcription of archived recordings."""
+
+import sys
+import queue
+import tempfile
+import threading
+from pathlib import Path
+
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.audio_archive import AudioArchive
+from src.retranscriber import Retranscriber
+
+
+class RecordingTranscriber:
+    """Transcriber stand-in that reports what it was given."""
+
+    def __init__(self, name, release=None):
+        self.name = name
+        self.release = release
+        self.calls = []
+
+    def transcribe(self, audio_file_path, cleanup=True, audio=None, prompt=None):
+        if self.release is not None:
+            self.release.wait(2.0)
+        self.calls.append((audio_file_path, None if audio is None else len(audio)))
+        Path(audio_file_path).unlink()
+        return f"{self.name} text"
+
+
+def test_results_stream_per_entry():
+    """Each queued entry should produce its own result, in order."""
+    print("=== Testing Re-transcription Results ===\n")
+
+    with tempfile.TemporaryDirectory() as directory:
+        archive = AudioArchive(archive_dir=directory)
+        entries = [
+            {"text": f"entry {i}", "audio": archive.store(np.full(1600 * (i + 1), 100, dtype=np.int16))}
+            for i in range(3)
+        ]
+        entries.append({"text": "no audio"})
+
+        local = RecordingTranscriber("local")
+        retranscriber = Retranscriber(archive, lambda profile: local)
+        assert [retranscriber.can_retranscribe(entry) for entry in entries] == [True, True, True, False]
+
+        results = queue.Queue()
+        profile = {"name": "Local tiny", "provider": "local", "model": "tiny"}
+        for entry in entries[:3]:
+            retranscriber.submit(entry, profile, lambda *result: results.put(result))
+
+        received = [results.get(timeout=5) for _ in range(3)]
+        assert [r[0]["text"] for r in received] == ["entry 0", "entry 1", "entry 2"]
+        assert all(r[2] == "local text" and r[4] is None for r in received)
+        assert [call[1] for call in local.calls] == [1600, 3200, 4800], "Decoded samples passed to local model"
+        assert not any(Path(call[0]).exists() for call in local.calls), "Temporary WAVs removed"
+        print("✓ Three entries re-transcribed in order with decoded audio")
+
+
+def test_submit_does_not_block():
+    """Submitting work should return while a transcription is running."""
+    print("\n=== Testing Background Worker ===\n")
+
+    with tempfile.TemporaryDirectory() as directory:
+        archive = AudioArchive(archive_dir=directory)
+        entry = {"text": "slow", "audio": archive.store(np.zeros(1600, dtype=np.int16))}
+
+        release = threading.Event()
+        remote = RecordingTranscriber("openai", release=release)
+        retranscriber = Retranscriber(archive, lambda profile: remote)
+
+        results = queue.Queue()
+        retranscriber.submit(entry, {"name": "OpenAI", "provider": "openai"}, lambda *result: results.put(result))
+        assert results.empty(), "Result should not be ready before the transcriber returns"
+
+        release.set()
+        _, _, text, _, error = results.get(timeout=5)
+        assert text == "openai text" and error is None
+        print("✓ submit() returned while the transcriber was busy")
+
+
+def test_evicted_recording_reports_error():
+    """Entries whose audio was evicted should report an error, not crash the worker."""
+    print("\n=== Testing Missing Recording ===\n")
+
+    with tempfile.TemporaryDirectory() as directory:
+        archive = AudioArchive(archive_dir=directory)
+        entry = {"text": "gone", "audio": {"segment": 42, "offset": 8, "length": 10, "codec": "flac"}}
+        retranscriber = Retranscriber(archive, lambda profile: RecordingTranscriber("local"))
+
+        results = queue.Queue()
+        retranscriber.submit(entry, {"name": "Local", "provider": "local"}, lambda *result: results.put(result))
+        _, _, text, _, error = results.get(timeout=5)
+        assert text is None and "no longer" in error
+        print("✓ Missing recording reported as an error")
+
+
+if __name__ == "__main__":
+    test_results_stream_per_entry()
+    test_submit_does_not_block()
+    test_evicted_recording_reports_error()
+    print("\nAll re-transcriber tests passed!")
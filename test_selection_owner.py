@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""Test the in-process selection owner against a headless Xvfb server.
+
+The end-to-end test starts Xvfb and fetches the served selections from a
+second connection, the way a pasting application does.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.selection_owner import SelectionOwner
+from test_key_typer import start_xvfb
+
+
+class PastingClient:
+    """Application stand-in that converts selections like a paste does."""
+
+    def __init__(self, display_name):
+        from Xlib import X, display as xdisplay
+        self.X = X
+        self.display = xdisplay.Display(display_name)
+        self.window = self.display.screen().root.create_window(0, 0, 1, 1, 0, X.CopyFromParent)
+        self.property = self.display.intern_atom("TEST_PASTE")
+
+    def convert(self, selection, target, timeout=2.0):
+        """Request a selection in a target format.
+
+        Returns:
+            Property reply, or None if the owner refused the target
+        """
+        X = self.X
+        self.window.convert_selection(
+            self.display.intern_atom(selection), self.display.intern_atom(target), self.property, X.CurrentTime
+        )
+        self.display.flush()
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            if not self.display.pending_events():
+                time.sleep(0.005)
+                continue
+            event = self.display.next_event()
+            if event.type != X.SelectionNotify:
+                continue
+            if event.property == X.NONE:
+                return None
+            reply = self.window.get_full_property(self.property, X.AnyPropertyType)
+            self.window.delete_property(self.property)
+            return reply
+        raise AssertionError(f"No answer to converting {selection} to {target}")
+
+    def take(self, selection):
+        """Become the owner of a selection, as copying in another application does."""
+        self.window.set_selection_owner(self.display.intern_atom(selection), self.X.CurrentTime)
+        self.display.sync()
+
+
+def test_missing_display():
+    """An unreachable display is reported so the paster can fall back to xclip."""
+    print("=== Testing Missing Display ===\n")
+
+    try:
+        SelectionOwner(":199")
+        assert False, "Opening a missing display must fail"
+    except RuntimeError as e:
+        print(f"✓ Reported: {e}")
+
+
+def test_serving_in_xvfb():
+    """TARGETS lists the text formats, text is served as UTF-8 and fetches are signalled."""
+    print("\n=== Testing Selection Owner (Xvfb) ===\n")
+
+    server = start_xvfb(":95")
+    if server is None:
+        print("Xvfb is not installed; selection serving not tested")
+        return
+
+    try:
+        owner = SelectionOwner(":95")
+        client = PastingClient(":95")
+        text = "Grüße aus Łódź: 5€ ✓"
+
+        assert owner.set_text(text)
+        reply = client.convert("CLIPBOARD", "TARGETS")
+        targets = [client.display.get_atom_name(atom) for atom in reply.value]
+        assert targets[0] == "TARGETS" and "UTF8_STRING" in targets and "STRING" in targets, targets
+        assert not owner.served.is_set(), "Listing targets is not a paste"
+        print(f"✓ TARGETS: {targets}")
+
+        for selection in ("CLIPBOARD", "PRIMARY"):
+            owner.served.clear()
+            reply = client.convert(selection, "UTF8_STRING")
+            assert reply.format == 8 and bytes(reply.value).decode("utf-8") == text, reply.value
+            assert owner.wait_until_served(1.0), f"Fetch from {selection} not signalled"
+        print("✓ CLIPBOARD and PRIMARY served as UTF8_STRING, fetches signalled")
+
+        assert client.convert("CLIPBOARD", "image/png") is None
+        print("✓ Unsupported target refused")
+
+        assert owner.get_clipboard_text() == text
+        assert owner.set_text("second") and not owner.served.is_set()
+        assert bytes(client.convert("CLIPBOARD", "UTF8_STRING").value) == b"second"
+        print("✓ Own clipboard read back, new text replaces the old")
+
+        # Copying in another application ends serving that selection
+        client.take("CLIPBOARD")
+        deadline = time.time() + 2
+        while owner.atoms["CLIPBOARD"] in owner._texts and time.time() < deadline:
+            time.sleep(0.01)
+        assert owner.atoms["CLIPBOARD"] not in owner._texts
+        assert bytes(client.convert("PRIMARY", "UTF8_STRING").value) == b"second"
+        print("✓ Selection released when another application takes it")
+
+        owner.close()
+        assert not owner.thread.is_alive()
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    test_missing_display()
+    test_serving_in_xvfb()
+    print("\nAll selection owner tests passed!")
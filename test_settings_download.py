@@ -9,6 +9,7 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from src.config import Config
 from src.settings_window import SettingsWindow
+from src.ui_thread import get_ui_thread
 
 def test_settings_download():
     """Test the Settings window model download UI."""
@@ -39,6 +40,7 @@ def test_settings_download():
     # Create and show settings window
     settings = SettingsWindow(config)
     settings.show()
+    get_ui_thread().wait_until_closed()
 
     print("\n✓ Test complete!")
     print("If the download worked correctly, the story passes.")
@@ -9,6 +9,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from src.config import Config
 from src.settings_window import SettingsWindow
+from src.ui_thread import get_ui_thread
 
 def main():
     """Test the settings window with three tabs."""
@@ -35,6 +36,7 @@ def main():
     # Create and show settings window
     settings = SettingsWindow(config)
     settings.show()
+    get_ui_thread().wait_until_closed()
 
 if __name__ == "__main__":
     main()
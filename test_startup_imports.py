@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""Test that startup leaves GUI toolkits and provider SDKs unimported.
+
+src.main is imported in a fresh interpreter, so modules imported by other
+tests in the same process cannot hide a regression.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+# Modules deferred until first use or until after the hotkey is registered
+DEFERRED_MODULES = (
+    "openai",
+    "faster_whisper",
+    "ctranslate2",
+    "av",
+    "tkinter",
+    "pystray",
+    "src.settings_window",
+    "src.history_window",
+    "src.setup_wizard",
+    "src.tray_icon",
+    "src.retranscriber",
+)
+
+CHILD = """
+import json, sys
+try:
+    import src.main
+except (ImportError, OSError) as e:
+    print(json.dumps({"unavailable": f"{type(e).__name__}: {e}"}))
+else:
+    print(json.dumps({"modules": sorted(sys.modules)}))
+"""
+
+
+def test_deferred_modules_not_imported():
+    """Importing src.main does not import the deferred modules."""
+    print("=== Testing Deferred Imports ===\n")
+
+    result = subprocess.run(
+        [sys.executable, "-c", CHILD],
+        cwd=Path(__file__).parent,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+    report = json.loads(result.stdout.strip().splitlines()[-1])
+    if "unavailable" in report:
+        # pynput needs an X display and sounddevice needs PortAudio
+        print(f"src.main cannot be imported here ({report['unavailable']}); deferred imports not tested")
+        return
+
+    modules = set(report["modules"])
+    assert "src.main" in modules
+    imported = [name for name in DEFERRED_MODULES if name in modules]
+    assert not imported, f"Imported at startup: {imported}"
+    print(f"✓ None of {len(DEFERRED_MODULES)} deferred modules imported by src.main")
+
+
+if __name__ == "__main__":
+    test_deferred_modules_not_imported()
+    print("\nAll startup import tests passed!")
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Test the content-addressed transcript cache."""
+
+import sys
+import tempfile
+import time
+import wave
+from pathlib import Path
+
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.transcript_cache import TranscriptCache, audio_digest, make_key
+
+
+def _write_wav(path, samples):
+    """Write int16 samples as a 16 kHz mono WAV file."""
+    with wave.open(str(path), 'wb') as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(16000)
+        wav_file.writeframes(samples.astype(np.int16).tobytes())
+
+
+def test_digest_matches_file_and_samples():
+    """A recording should hash the same as a WAV file and as float32 samples."""
+    print("=== Testing Audio Digest ===\n")
+
+    samples = (np.sin(np.arange(16000) / 10.0) * 12000).astype(np.int16)
+    with tempfile.TemporaryDirectory() as directory:
+        wav_path = Path(directory) / "recording.wav"
+        _write_wav(wav_path, samples)
+
+        from_file = audio_digest(wav_path)
+        from_samples = audio_digest(audio=samples.astype(np.float32) / 32768.0)
+        assert from_file == from_samples
+        print("✓ WAV file and float32 samples give the same digest")
+
+        samples[100] += 1
+        _write_wav(wav_path, samples)
+        assert audio_digest(wav_path) != from_file
+        print("✓ A one-sample change gives a different digest")
+
+    key = make_key(from_file, "faster-whisper", "base", {"beam_size": 5})
+    assert key != make_key(from_file, "faster-whisper", "base", {"beam_size": 1})
+    assert key != make_key(from_file, "openai", "base", {"beam_size": 5})
+    print("✓ Provider and decode options are part of the key")
+
+
+def test_get_put_round_trip():
+    """Stored entries should be returned by later lookups, also across instances."""
+    print("\n=== Testing Cache Round Trip ===\n")
+
+    with tempfile.TemporaryDirectory() as directory:
+        cache = TranscriptCache(cache_dir=directory)
+        assert cache.get("ab" * 20) is None
+        cache.put("ab" * 20, {"text": "hello world"})
+        assert cache.get("ab" * 20) == {"text": "hello world"}
+
+        reopened = TranscriptCache(cache_dir=directory)
+        assert reopened.get("ab" * 20)["text"] == "hello world"
+        assert reopened.total_bytes > 0
+        print("✓ Entries persist on disk")
+
+
+def test_lru_eviction():
+    """The least recently used entries should be evicted first."""
+    print("\n=== Testing LRU Eviction ===\n")
+
+    with tempfile.TemporaryDirectory() as directory:
+        entry = {"text": "x" * 90}
+        entry_size = len(str(entry))
+        cache = TranscriptCache(cache_dir=directory, max_bytes=entry_size * 5)
+
+        keys = [f"{i:02d}" + "0" * 38 for i in range(5)]
+        for key in keys:
+            cache.put(key, entry)
+            time.sleep(0.01)
+
+        # Use the oldest entry so it becomes the most recently used
+        assert cache.get(keys[0]) is not None
+        time.sleep(0.01)
+        cache.put("99" + "0" * 38, entry)
+
+        assert cache.total_bytes <= cache.max_bytes
+        assert cache.get(keys[0]) is not None, "Recently used entry was evicted"
+        assert cache.get(keys[1]) is None, "Least recently used entry was kept"
+        print(f"✓ Evicted down to {cache.total_bytes} of {cache.max_bytes} bytes, oldest first")
+
+
+if __name__ == "__main__":
+    test_digest_matches_file_and_samples()
+    test_get_put_round_trip()
+    test_lru_eviction()
+    print("\nAll transcript cache tests passed!")
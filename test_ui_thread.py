@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""Test the dedicated Tk UI thread."""
+
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.ui_thread import UIThread
+
+
+def test_commands_run_on_ui_thread():
+    """Commands from any thread run in order on the one UI thread."""
+    print("=== Testing UI Command Queue ===\n")
+
+    if not os.environ.get("DISPLAY"):
+        print("No display available; not starting Tk")
+        return
+
+    ui = UIThread()
+    started = time.perf_counter()
+    assert ui.start(), ui.error
+    print(f"✓ Interpreter started in {(time.perf_counter() - started) * 1000:.0f}ms")
+
+    seen = []
+
+    def record(value):
+        seen.append((value, threading.current_thread().name))
+        return value
+
+    workers = [threading.Thread(target=lambda i=i: ui.call(record, i).result()) for i in range(5)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    assert sorted(value for value, _ in seen) == list(range(5))
+    assert {name for _, name in seen} == {"ui"}, "All commands should run on the UI thread"
+
+    # A window opens from the warm interpreter without blocking the caller
+    started = time.perf_counter()
+    window = ui.call(lambda: __import__("tkinter").Toplevel(ui.root)).result()
+    print(f"✓ Toplevel opened in {(time.perf_counter() - started) * 1000:.1f}ms")
+    ui.call(window.destroy).result()
+    ui.wait_until_closed()
+
+
+def test_missing_display_fails_fast():
+    """Without a display, calls fail instead of hanging."""
+    print("\n=== Testing Missing Display ===\n")
+
+    saved = os.environ.get("DISPLAY")
+    os.environ["DISPLAY"] = ":987"
+    try:
+        ui = UIThread()
+        future = ui.call(lambda: "never runs")
+        try:
+            future.result(timeout=UIThread.START_TIMEOUT + 1)
+            raise AssertionError("Call should fail without a display")
+        except RuntimeError as e:
+            print(f"✓ Call failed: {e}")
+    finally:
+        if saved is None:
+            del os.environ["DISPLAY"]
+        else:
+            os.environ["DISPLAY"] = saved
+
+
+if __name__ == "__main__":
+    test_commands_run_on_ui_thread()
+    test_missing_display_fails_fast()
+    print("\nAll UI thread tests passed!")